@@ -0,0 +1,138 @@
+# backend/config/benchmark.py
+"""
+Helpers for the `manage.py bench_*` commands.
+
+Benchmarks that touch the database run against a throwaway test database
+(same machinery as `manage.py test`), never against the configured one.
+"""
+import argparse
+import logging
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+def positive_int(value):
+    """
+    argparse type for counts (rows, iterations, ...): an int >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def positive_float(value):
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got {value!r}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number:g}")
+    return number
+
+
+class Timing:
+    def __init__(self, label, samples, queries):
+        self.label = label
+        self.samples = samples
+        self.queries = queries
+
+    @property
+    def per_call_ms(self):
+        return statistics.median(self.samples) * 1000
+
+    @property
+    def p95_ms(self):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+
+    @property
+    def per_second(self):
+        return len(self.samples) / sum(self.samples) if self.samples else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.label:<28} median {self.per_call_ms:8.3f} ms   p95 {self.p95_ms:8.3f} ms"
+            f"   {self.per_second:9.1f}/s   {self.queries:g} queries/call"
+        )
+
+
+def measure(label, fn, iterations):
+    """
+    Call fn(i) `iterations` times; return per-call timings and average query count.
+    """
+    samples = []
+    with CaptureQueriesContext(connection) as ctx:
+        for i in range(iterations):
+            start = time.perf_counter()
+            fn(i)
+            samples.append(time.perf_counter() - start)
+    return Timing(label, samples, len(ctx.captured_queries) / max(iterations, 1))
+
+
+def _unthrottled(rest_framework):
+    """
+    Same throttle scopes (so their cost is measured) but rates nothing can hit.
+    """
+    rates = rest_framework.get("DEFAULT_THROTTLE_RATES", {})
+    return {**rest_framework, "DEFAULT_THROTTLE_RATES": {scope: "1000000/s" for scope in rates}}
+
+
+class BenchmarkCommand(BaseCommand):
+    """
+    Base class: sets up a test environment + test database, calls
+    `run_benchmark(**options)`, then tears everything down.
+
+    Options that only make sense together (e.g. a page number past the
+    seeded rows) are checked in `check_options(**options)`, which raises
+    CommandError before any database work starts.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=positive_int, default=200)
+        parser.add_argument(
+            "--real-hasher", action="store_true",
+            help="Use the configured PASSWORD_HASHERS instead of a fast test hasher.",
+        )
+
+    def handle(self, *args, **options):
+        self.check_options(**options)
+        # expected 4xx responses would otherwise flood the output
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        overrides = {"REST_FRAMEWORK": _unthrottled(settings.REST_FRAMEWORK)}
+        if not options["real_hasher"]:
+            overrides["PASSWORD_HASHERS"] = FAST_HASHERS
+        try:
+            with override_settings(**overrides):
+                self.run_benchmark(**options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+    def check_options(self, **options):
+        pass
+
+    def run_benchmark(self, **options):
+        raise NotImplementedError
+
+    def report(self, timing):
+        self.stdout.write(str(timing))
@@ -0,0 +1,96 @@
+# backend/config/cache.py
+"""
+Read-through cache for hot endpoints, with stampede protection.
+
+    data = get_or_compute("notices:list", compute_fn, ttl=60)
+
+- Single flight: on a miss or expiry, one caller (per key, across processes
+  sharing the cache) recomputes under a `cache.add` lock. Everyone else
+  gets the stale value if there is one, or waits briefly for the fresh one.
+- Probabilistic early refresh ("XFetch"): each read may recompute a bit
+  before expiry, with a probability that grows as expiry nears and with how
+  slow the last compute was. Hot keys rarely expire at all, and keys
+  written at the same moment don't all expire together.
+- Entries are stored for CACHE_STALE_GRACE seconds beyond their TTL so
+  there is a stale value to serve while the refresh runs.
+
+invalidate_on_commit() drops keys once the current transaction commits. A
+recompute that was already running when the key was invalidated doesn't
+store its (possibly stale) result.
+"""
+import math
+import random
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+LOCK_SUFFIX = ":lock"
+GEN_SUFFIX = ":gen"
+
+
+def _grace():
+    return getattr(settings, "CACHE_STALE_GRACE", 30)
+
+
+def _lock_timeout():
+    return getattr(settings, "CACHE_LOCK_TIMEOUT", 10)
+
+
+def _should_refresh(entry, beta, now):
+    _value, delta, expires_at = entry
+    # XFetch: refresh when now - delta * beta * ln(rand) >= expiry
+    return now - delta * beta * math.log(random.random() or 1e-12) >= expires_at
+
+
+def _store(key, compute, ttl):
+    generation = cache.get(key + GEN_SUFFIX)
+    start = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - start
+    if cache.get(key + GEN_SUFFIX) == generation:
+        cache.set(key, (value, delta, time.time() + ttl), ttl + _grace())
+    return value
+
+
+def get_or_compute(key, compute, ttl, *, beta=1.0):
+    """
+    Cached `compute()` under `key` for about `ttl` seconds. The value must be picklable.
+    """
+    entry = cache.get(key)
+    now = time.time()
+    if entry is not None and not _should_refresh(entry, beta, now):
+        return entry[0]
+
+    lock_key = key + LOCK_SUFFIX
+    if cache.add(lock_key, 1, _lock_timeout()):
+        try:
+            return _store(key, compute, ttl)
+        finally:
+            cache.delete(lock_key)
+
+    # someone else is recomputing
+    if entry is not None:
+        return entry[0]
+    deadline = time.monotonic() + _lock_timeout()
+    while time.monotonic() < deadline:
+        time.sleep(0.01)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        if cache.get(lock_key) is None:
+            break  # holder finished without storing (error) or its lock expired
+    return _store(key, compute, ttl)
+
+
+def invalidate(*keys):
+    # new generation marker: in-flight recomputes of these keys won't store
+    marker = uuid.uuid4().hex
+    cache.set_many({key + GEN_SUFFIX: marker for key in keys}, _lock_timeout())
+    cache.delete_many(list(keys))
+
+
+def invalidate_on_commit(*keys):
+    transaction.on_commit(lambda: invalidate(*keys))
@@ -0,0 +1,136 @@
+# backend/config/db_router.py
+"""
+Primary / read-replica routing.
+
+Writes always go to "default". Reads go to "default" too, unless the view
+opted in with `replica_reads` (function views) or `ReplicaReadsMixin`
+(class-based views) and the request is a GET/HEAD/OPTIONS. Then they go to
+one of settings.DATABASE_REPLICAS.
+
+Read-your-writes: after an authenticated user's successful write,
+ReplicaStickinessMiddleware pins that user to the primary for
+DATABASE_REPLICA_STICKY_SECONDS. The pin is soft state in the default cache;
+if it is lost, the user just reads from a replica slightly early.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+PRIMARY = "default"
+
+_read_alias = ContextVar("hall_read_alias", default=None)
+
+
+def _replicas():
+    return [alias for alias in getattr(settings, "DATABASE_REPLICAS", []) if alias in settings.DATABASES]
+
+
+def _pin_key(user_id):
+    return f"db-pin:{user_id}"
+
+
+def pin_to_primary(user_id):
+    seconds = getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 5)
+    if user_id is not None and seconds > 0:
+        cache.set(_pin_key(user_id), 1, seconds)
+
+
+def is_pinned(user_id):
+    return user_id is not None and cache.get(_pin_key(user_id)) is not None
+
+
+def _user_id(request):
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def read_alias_for(request):
+    """
+    Replica alias for this request's reads, or PRIMARY.
+    """
+    replicas = _replicas()
+    if not replicas or request.method not in SAFE_METHODS or is_pinned(_user_id(request)):
+        return PRIMARY
+    return random.choice(replicas)
+
+
+@contextmanager
+def reading_from(alias):
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def replica_reads(view):
+    """
+    For @api_view functions; put it under @permission_classes so that
+    request.user is authenticated by the time the alias is picked.
+    """
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        with reading_from(read_alias_for(request)):
+            return view(request, *args, **kwargs)
+    return wrapped
+
+
+class ReplicaReadsMixin:
+    """
+    For APIView subclasses: the alias is picked after authentication.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._replica_token = _read_alias.set(read_alias_for(request))
+
+    def dispatch(self, request, *args, **kwargs):
+        # reset here, not in finalize_response: an unhandled exception skips that,
+        # and the alias would stick to the worker thread for later requests
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            token = getattr(self, "_replica_token", None)
+            if token is not None:
+                _read_alias.reset(token)
+                self._replica_token = None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _read_alias.get() or PRIMARY
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # every alias holds the same data (eventually)
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas receive schema changes through replication
+        return db not in getattr(settings, "DATABASE_REPLICAS", [])
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Pins the user to the primary after a successful unsafe request.
+    Must come after AuthenticationMiddleware; DRF copies the authenticated
+    user back onto the Django request, so JWT users are seen here too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(_user_id(request))
+        return response
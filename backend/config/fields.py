@@ -0,0 +1,126 @@
+# backend/config/fields.py
+"""
+Partial responses: ?fields= / ?exclude=.
+
+    GET /api/applications/?fields=id,full_name,student_id,status,created_at
+    GET /api/applications/?exclude=address
+
+SparseFieldsMixin (serializers) drops the fields that weren't asked for.
+SparseFieldsViewMixin (generic views) reads the query parameters on safe
+requests, hands the selection to the serializer and narrows the queryset
+with .only(), so unrequested columns aren't read from the database either.
+Unknown field names are a 400. Writes always use the full serializer.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+def _names(raw):
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def parse_selection(query_params, available):
+    """
+    Field names to keep, in `available` order, or None when neither parameter is given.
+    """
+    fields = query_params.get(FIELDS_PARAM)
+    exclude = query_params.get(EXCLUDE_PARAM)
+    if fields is None and exclude is None:
+        return None
+
+    keep = list(available)
+    errors = {}
+    for param, raw in ((FIELDS_PARAM, fields), (EXCLUDE_PARAM, exclude)):
+        if raw is None:
+            continue
+        names = set(_names(raw))
+        unknown = sorted(names.difference(available))
+        if unknown:
+            errors[param] = [f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(available)}."]
+        elif param == FIELDS_PARAM:
+            keep = [name for name in keep if name in names]
+        else:
+            keep = [name for name in keep if name not in names]
+    if errors:
+        raise ValidationError(errors)
+    return keep
+
+
+def trim(data, keep):
+    """
+    Already-serialized dict narrowed to `keep` (None keeps everything).
+    """
+    if data is None or keep is None:
+        return data
+    return {name: data[name] for name in keep if name in data}
+
+
+def model_columns(serializer_fields, model):
+    """
+    .only() arguments covering these serializer fields, or None when one of
+    them isn't backed by a concrete column of `model` (method fields, "*",
+    dotted sources, reverse relations).
+    """
+    columns = [model._meta.pk.name]
+    for field in serializer_fields.values():
+        source = field.source
+        if source == "*" or "." in source:
+            return None
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        columns.append(source)
+    return columns
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin: `fields=[...]` keeps only those fields.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields).difference(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsViewMixin:
+    """
+    For GenericAPIView subclasses whose serializer uses SparseFieldsMixin.
+    """
+
+    def field_selection(self):
+        """
+        (field names, .only() columns or None), or None for the full representation.
+        """
+        if not hasattr(self, "_field_selection"):
+            self._field_selection = None
+            request = getattr(self, "request", None)
+            if request is not None and request.method in SAFE_METHODS:
+                serializer = self.get_serializer_class()(context=self.get_serializer_context())
+                keep = parse_selection(request.query_params, list(serializer.fields))
+                if keep is not None:
+                    kept = {name: field for name, field in serializer.fields.items() if name in keep}
+                    self._field_selection = (keep, model_columns(kept, serializer.Meta.model))
+        return self._field_selection
+
+    def get_serializer(self, *args, **kwargs):
+        selection = self.field_selection()
+        if selection is not None:
+            kwargs.setdefault("fields", selection[0])
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selection = self.field_selection()
+        if selection is not None and selection[1] is not None:
+            queryset = queryset.only(*selection[1])
+        return queryset
@@ -0,0 +1,365 @@
+# backend/config/loadtest.py
+"""
+Load generator for semester-start traffic (`manage.py loadtest`).
+
+Standard library only: an asyncio HTTP/1.1 client, with one keep-alive
+connection per virtual user, plus scripted scenarios:
+
+- student: register -> login -> complete profile (multipart, with photo)
+  -> poll notices -> submit a hall application, with think time between
+  steps
+- poller: anonymous notice polling, a full list first and then ?since=
+  delta syncs, like the app does
+
+A traffic profile mixes the scenarios. Virtual users arrive linearly over
+the ramp-up, at most `concurrency` of them at a time. Each one sends its
+own X-Forwarded-For address. A server run with HALL_NUM_PROXIES=1 (as
+`loadtest --serve` does) takes that address as the throttle identity, so
+every student gets their own buckets, as they would behind the production
+proxy. Against a server that trusts no proxies, all users share one bucket.
+"""
+import asyncio
+import json
+import random
+import struct
+import time
+import uuid
+import zlib
+from collections import Counter, defaultdict
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urlsplit
+
+PROFILES = {
+    # applications just opened: most arrivals go through the whole journey
+    "semester-start": {"student": 0.7, "poller": 0.3},
+    "registration": {"student": 1.0},
+    "notices": {"poller": 1.0},
+}
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body or b"null")
+
+
+class HttpClient:
+    """
+    Minimal HTTP/1.1 client over asyncio streams; one connection, reopened when the server closes it.
+    """
+
+    def __init__(self, base_url, *, forwarded_for=None, timeout=30.0):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError("only http:// base URLs are supported")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.forwarded_for = forwarded_for
+        self.timeout = timeout
+        self._reader = self._writer = None
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def request(self, method, path, *, json_body=None, body=b"", content_type=None, token=None):
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            content_type = "application/json"
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        if token:
+            lines.append(f"Authorization: Bearer {token}")
+        if self.forwarded_for:
+            lines.append(f"X-Forwarded-For: {self.forwarded_for}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+        for attempt in (0, 1):
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout
+                )
+                reused = False
+            else:
+                reused = True
+            try:
+                self._writer.write(head + body)
+                await self._writer.drain()
+                return await asyncio.wait_for(self._read_response(), self.timeout)
+            except _ServerClosed:
+                # an idle keep-alive connection closed before any response byte: safe to resend once
+                await self.close()
+                if attempt or not reused:
+                    raise ConnectionError("server closed the connection")
+            except BaseException:
+                await self.close()
+                raise
+
+    async def _read_response(self):
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise _ServerClosed()
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self._reader.readline()
+                    break
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await self._reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self._reader.read()
+            headers["connection"] = "close"
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return Response(status, headers, body)
+
+
+class _ServerClosed(Exception):
+    pass
+
+
+# -----------------------------
+# Payloads
+# -----------------------------
+def png_bytes(kilobytes):
+    """
+    An RGB PNG of roughly `kilobytes` KB; random pixels, so it doesn't compress away.
+    """
+    side = max(int((kilobytes * 1024 / 3) ** 0.5), 1)
+    rng = random.Random(side)
+    raw = b"".join(b"\x00" + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def multipart(fields, files):
+    """
+    (body, content type) for form fields + {name: (filename, content type, bytes)}.
+    """
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content_type, data) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode() + data + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+# -----------------------------
+# Recording
+# -----------------------------
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.failures = Counter()
+        self.started = time.perf_counter()
+        self.finished = None
+
+    async def call(self, step, client, method, path, *, expect=(200,), **kwargs):
+        """
+        Timed request; returns the Response, or None after a transport error / unexpected status.
+        """
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+            self.latencies[step].append(time.perf_counter() - start)
+            self.statuses[step][type(exc).__name__] += 1
+            self.failures[step] += 1
+            return None
+        self.latencies[step].append(time.perf_counter() - start)
+        self.statuses[step][response.status] += 1
+        if response.status not in expect:
+            self.failures[step] += 1
+            return None
+        return response
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        steps = {}
+        for step, samples in self.latencies.items():
+            ordered = sorted(samples)
+            steps[step] = {
+                "requests": len(ordered),
+                "per_second": len(ordered) / elapsed,
+                "error_rate": self.failures[step] / len(ordered),
+                "statuses": {str(code): n for code, n in sorted(self.statuses[step].items(), key=str)},
+                "p50_ms": _percentile(ordered, 0.50) * 1000,
+                "p90_ms": _percentile(ordered, 0.90) * 1000,
+                "p99_ms": _percentile(ordered, 0.99) * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        total = sum(len(samples) for samples in self.latencies.values())
+        everything = sorted(s for samples in self.latencies.values() for s in samples)
+        return {
+            "elapsed_s": elapsed,
+            "requests": total,
+            "per_second": total / elapsed if elapsed else 0.0,
+            "error_rate": sum(self.failures.values()) / total if total else 0.0,
+            "p50_ms": _percentile(everything, 0.50) * 1000,
+            "p99_ms": _percentile(everything, 0.99) * 1000,
+            "steps": steps,
+        }
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+# -----------------------------
+# Scenarios
+# -----------------------------
+class LoadTest:
+    def __init__(self, base_url, *, profile="semester-start", users=200, ramp=30.0, concurrency=100,
+                 polls=3, think=1.0, photo_kb=200, timeout=30.0, spread_ips=True, seed=None):
+        self.base_url = base_url
+        self.mix = PROFILES[profile]
+        self.users = users
+        self.ramp = ramp
+        self.concurrency = concurrency
+        self.polls = polls
+        self.think = think
+        self.timeout = timeout
+        self.spread_ips = spread_ips
+        self.rng = random.Random(seed)
+        self.run_id = uuid.uuid4().hex[:8]  # keeps emails / student ids unique across runs
+        self.photo = png_bytes(photo_kb)
+        self.recorder = Recorder()
+
+    async def _pause(self):
+        if self.think > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think))
+
+    def _client(self, n):
+        ip = f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}" if self.spread_ips else None
+        return HttpClient(self.base_url, forwarded_for=ip, timeout=self.timeout)
+
+    async def student(self, n, client):
+        call = self.recorder.call
+        email = f"lt-{self.run_id}-{n}@example.com"
+        password = "semester-start-1"
+        student_id = f"LT{self.run_id}{n:06d}"
+
+        response = await call(
+            "register", client, "POST", "/api/users/auth/register/", expect=(201,),
+            json_body={"email": email, "password": password, "full_name": f"Load Student {n}"},
+        )
+        if response is None:
+            return
+        await self._pause()
+
+        response = await call(
+            "login", client, "POST", "/api/users/auth/login/",
+            json_body={"email": email, "password": password},
+        )
+        if response is None:
+            return
+        token = response.json()["access"]
+        await self._pause()
+
+        body, content_type = multipart(
+            {
+                "student_id": student_id, "department": self.rng.choice(["CSE", "EEE", "ME", "CE"]),
+                "session": "2025-26", "room_no": str(self.rng.randint(101, 450)), "dob": "2004-01-01",
+                "gender": "Male", "blood_group": "O+", "mobile_number": f"017{n:08d}", "address": "Hall road",
+            },
+            {"photo": (f"{student_id}.png", "image/png", self.photo)},
+        )
+        await call(
+            "complete-profile", client, "POST", "/api/users/auth/complete-profile/",
+            body=body, content_type=content_type, token=token,
+        )
+        await self._pause()
+
+        await self._poll_notices(client, token)
+
+        await call(
+            "application", client, "POST", "/api/applications/create/", expect=(201,), token=token,
+            json_body={
+                "full_name": f"Load Student {n}", "student_id": student_id, "department": "CSE",
+                "session": "2025-26", "dob": "2004-01-01", "gender": "Male", "mobile": f"017{n:08d}",
+                "email": email, "address": "Hall road", "payment_slip_no": f"PS{self.run_id}{n:06d}",
+            },
+        )
+
+    async def poller(self, n, client):
+        await self._poll_notices(client, None)
+
+    async def _poll_notices(self, client, token):
+        # the full (cached) list once, then ?since= delta syncs from the server's clock
+        since = None
+        for _ in range(self.polls):
+            path = "/api/notices/" if since is None else f"/api/notices/?since={quote(since)}"
+            response = await self.recorder.call("notices", client, "GET", path, token=token)
+            if response is not None:
+                if since is None and "date" in response.headers:
+                    since = parsedate_to_datetime(response.headers["date"]).isoformat()
+                elif since is not None:
+                    since = response.json()["until"]
+            await self._pause()
+
+    async def _virtual_user(self, n, scenario, gate):
+        async with gate:
+            client = self._client(n)
+            try:
+                await getattr(self, scenario)(n, client)
+            finally:
+                await client.close()
+
+    async def run(self):
+        gate = asyncio.Semaphore(self.concurrency)
+        self.recorder.started = time.perf_counter()
+        scenarios, weights = zip(*self.mix.items())
+        tasks = []
+        interval = self.ramp / self.users if self.users else 0
+        for n in range(self.users):
+            scenario = self.rng.choices(scenarios, weights)[0]
+            tasks.append(asyncio.create_task(self._virtual_user(n, scenario, gate)))
+            if interval:
+                await asyncio.sleep(interval)
+        await asyncio.gather(*tasks)
+        self.recorder.finished = time.perf_counter()
+        return self.recorder.summary()
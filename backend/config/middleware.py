@@ -0,0 +1,178 @@
+# backend/config/middleware.py
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+# Optional codecs: used only when the packages are installed
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+# -----------------------------
+# Codecs
+# -----------------------------
+class _GzipCodec:
+    name = "gzip"
+
+    def __init__(self, level=6):
+        self.level = level
+
+    def compress(self, data):
+        co = self.stream()
+        return co.compress(data) + co.flush()
+
+    def stream(self):
+        # wbits=31 -> gzip container
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+
+class _BrotliStream:
+    def __init__(self, quality):
+        self._c = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._c.process(data)
+
+    def flush(self):
+        return self._c.finish()
+
+
+class _BrotliCodec:
+    name = "br"
+
+    def __init__(self, quality=5):
+        self.quality = quality
+
+    def compress(self, data):
+        return brotli.compress(data, quality=self.quality)
+
+    def stream(self):
+        return _BrotliStream(self.quality)
+
+
+class _ZstdCodec:
+    name = "zstd"
+
+    def __init__(self, level=3):
+        self.level = level
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def stream(self):
+        return zstandard.ZstdCompressor(level=self.level).compressobj()
+
+
+def _available_codecs():
+    codecs = {"gzip": _GzipCodec()}
+    if brotli is not None:
+        codecs["br"] = _BrotliCodec()
+    if zstandard is not None:
+        codecs["zstd"] = _ZstdCodec()
+    return codecs
+
+
+def _accepted_encodings(header):
+    """
+    Parse Accept-Encoding into {coding: q}. Codings with q=0 are kept as
+    refused, so "gzip;q=0, *" does not let the wildcard re-admit gzip.
+    """
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = max(q, 0.0)
+    return accepted
+
+
+# -----------------------------
+# Compression middleware
+# -----------------------------
+class CompressionMiddleware:
+    """
+    Negotiated response compression (zstd / br / gzip).
+
+    Works like django.middleware.gzip.GZipMiddleware, but picks the best codec
+    the client accepts (by q-value, then by COMPRESSION_PREFERENCE), skips
+    bodies below COMPRESSION_MIN_SIZE and compresses streaming responses
+    chunk by chunk so large lists never sit fully compressed in memory.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+        codecs = _available_codecs()
+        preference = getattr(settings, "COMPRESSION_PREFERENCE", ("zstd", "br", "gzip"))
+        self.codecs = [codecs[name] for name in preference if name in codecs]
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.has_header("Content-Encoding"):
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        codec = self._negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                return response  # ASGI streaming is passed through untouched
+            response.streaming_content = self._compress_stream(codec, response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed = codec.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # Same as Django's GZipMiddleware: a re-encoded body can only carry a weak ETag
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = codec.name
+        return response
+
+    def _negotiate(self, header):
+        accepted = _accepted_encodings(header)
+        if not accepted:
+            return None
+        wildcard = accepted.get("*", 0)
+        best, best_q = None, 0
+        for codec in self.codecs:
+            # an explicit entry (even q=0) wins over the wildcard
+            q = accepted.get(codec.name, wildcard)
+            if q > best_q:
+                best, best_q = codec, q
+        return best
+
+    @staticmethod
+    def _compress_stream(codec, chunks):
+        co = codec.stream()
+        for chunk in chunks:
+            data = co.compress(chunk)
+            if data:
+                yield data
+        yield co.flush()
@@ -0,0 +1,35 @@
+# backend/config/migration_ops.py
+"""
+Migration operations that are safe to run against live, large tables.
+"""
+from django.db import migrations
+
+
+class AddIndexOnline(migrations.AddIndex):
+    """
+    AddIndex that doesn't block writes while the index builds:
+
+    - MySQL: CREATE INDEX ... ALGORITHM=INPLACE LOCK=NONE. InnoDB does this
+      for secondary indexes anyway. Spelling it out makes MySQL refuse,
+      instead of silently falling back to a locking table copy.
+    - PostgreSQL: CREATE INDEX CONCURRENTLY. The migration must set
+      `atomic = False`.
+    - Anything else (SQLite in dev/tests): a plain CREATE INDEX.
+
+    Reversal is a plain DROP INDEX, which is cheap everywhere.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        vendor = schema_editor.connection.vendor
+        if vendor == "mysql":
+            schema_editor.execute(f"{self.index.create_sql(model, schema_editor)} ALGORITHM=INPLACE LOCK=NONE")
+        elif vendor == "postgresql":
+            schema_editor.execute(self.index.create_sql(model, schema_editor, concurrently=True))
+        else:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"{super().describe()} (online)"
@@ -0,0 +1,37 @@
+# backend/config/openapi_inspectors.py
+"""
+drf_yasg inspectors for filter/pagination query parameters, built from the
+OpenAPI 3 `get_schema_operation_parameters()` hooks instead of the coreapi
+ones (coreapi isn't installed, and DRF/django-filter assert on it).
+Wired through SWAGGER_SETTINGS; only imported when generating the schema.
+"""
+from drf_yasg import openapi
+from drf_yasg.inspectors import FilterInspector, PaginatorInspector
+
+_TYPES = {"integer", "number", "string", "boolean", "array"}
+
+
+def _parameters(component, view):
+    get_params = getattr(component, "get_schema_operation_parameters", None)
+    if get_params is None:
+        return None
+    params = []
+    for p in get_params(view):
+        schema = p.get("schema", {})
+        params.append(openapi.Parameter(
+            name=p["name"],
+            in_=openapi.IN_QUERY,
+            required=p.get("required", False),
+            description=str(p.get("description", "")),
+            type=schema.get("type") if schema.get("type") in _TYPES else openapi.TYPE_STRING,
+            enum=schema.get("enum"),
+        ))
+    return params
+
+
+class OperationParametersInspector(PaginatorInspector, FilterInspector):
+    def get_filter_parameters(self, filter_backend):
+        return _parameters(filter_backend, self.view)
+
+    def get_paginator_parameters(self, paginator):
+        return _parameters(paginator, self.view)
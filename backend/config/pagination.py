@@ -0,0 +1,135 @@
+# backend/config/pagination.py
+"""
+Project-wide pagination policy (REST_FRAMEWORK["DEFAULT_PAGINATION_CLASS"]).
+
+Every list view is paginated unless it opts out explicitly with
+`pagination_class = None`, or picks its own class as the status history
+(cursor) and the student directory do.
+
+    GET /api/applications/?page=2&page_size=100
+    -> {"count": 1234, "next": "...?page=3&page_size=100", "previous": "...", "results": [...]}
+
+- No COUNT(*) per page: a page reads page_size + 1 rows, and the extra
+  row tells whether there is a next page. "count" comes from the cache
+  (config.cache). It is recomputed at most every PAGINATION_COUNT_TTL
+  seconds per filtered query, so it may lag recent writes.
+- page_size is capped at PAGINATION_MAX_PAGE_SIZE.
+- Requests without ?page= / ?page_size= get the old bare-list body, so
+  existing clients keep working. It is deprecated: the response carries
+  `Deprecation: true` (and `Sunset: <date>` once PAGINATION_LEGACY_SUNSET
+  is set). It is bounded too, at PAGINATION_LEGACY_LIMIT rows: larger
+  than a page, so today's lists still arrive whole. When it is cut short,
+  a `Link: <...>; rel="next"` header points at the rest and a warning is
+  logged, so a client still losing rows shows up in the logs.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from config.cache import get_or_compute
+
+logger = logging.getLogger(__name__)
+
+
+def max_page_size():
+    return getattr(settings, "PAGINATION_MAX_PAGE_SIZE", 200)
+
+
+def legacy_limit():
+    """
+    Row cap for unpaged (bare list) responses: a whole number of max-size
+    pages, so the Link header can point at the next one.
+    """
+    pages = getattr(settings, "PAGINATION_LEGACY_LIMIT", 1000) // max_page_size()
+    return max(pages, 1) * max_page_size()
+
+
+def cached_count(queryset):
+    """
+    Approximate COUNT(*) of `queryset`, shared across requests for PAGINATION_COUNT_TTL seconds.
+    """
+    # keyed on the filter alone: ordering and .only() columns don't change the count
+    queryset = queryset.order_by().values("pk")
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    digest = hashlib.sha1(f"{queryset.db} {sql} {params!r}".encode()).hexdigest()
+    return get_or_compute(f"count:{digest}", queryset.count, getattr(settings, "PAGINATION_COUNT_TTL", 60))
+
+
+def bare_list_response(request, rows, has_next):
+    """
+    The pre-pagination body (a bare list), marked deprecated, plus a Link
+    header when rows were cut off.
+    """
+    response = Response(rows)
+    response["Deprecation"] = "true"
+    sunset = getattr(settings, "PAGINATION_LEGACY_SUNSET", None)
+    if sunset:
+        response["Sunset"] = sunset
+    if has_next:
+        size = max_page_size()
+        url = replace_query_param(request.build_absolute_uri(), CountFreePagination.page_size_query_param, size)
+        url = replace_query_param(url, CountFreePagination.page_query_param, len(rows) // size + 1)
+        response["Link"] = f'<{url}>; rel="next"'
+        logger.warning("Unpaged list %s cut at %d rows; the client should use ?page=", request.path, len(rows))
+    return response
+
+
+class CountFreePagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self):
+        return max_page_size()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.queryset = queryset
+        params = request.query_params
+        self.legacy = self.page_query_param not in params and self.page_size_query_param not in params
+        self.size = legacy_limit() if self.legacy else self.get_page_size(request)
+        try:
+            self.number = int(params.get(self.page_query_param, 1))
+        except ValueError:
+            self.number = 0
+        if self.number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (self.number - 1) * self.size
+        rows = list(queryset[offset:offset + self.size + 1])
+        self.has_next = len(rows) > self.size
+        if not rows and self.number > 1:
+            raise NotFound(self.invalid_page_message)
+        return rows[:self.size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.size)
+        return replace_query_param(url, self.page_query_param, self.number + 1)
+
+    def get_previous_link(self):
+        if self.number <= 1:
+            return None
+        # page_size stays in the URL: without it and ?page= the response would be a bare list
+        url = replace_query_param(self.request.build_absolute_uri(), self.page_size_query_param, self.size)
+        return replace_query_param(url, self.page_query_param, self.number - 1)
+
+    def get_paginated_response(self, data):
+        if self.legacy:
+            return bare_list_response(self.request, data, self.has_next)
+        return Response({
+            "count": cached_count(self.queryset),
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
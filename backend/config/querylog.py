@@ -0,0 +1,213 @@
+# backend/config/querylog.py
+"""
+Opt-in slow-query log (meant for staging).
+
+With SLOW_QUERY_LOG set to a file path, SlowQueryMiddleware wraps every
+database connection for the duration of a request. Each query slower than
+SLOW_QUERY_THRESHOLD_MS is appended to the file as one JSON line with:
+- the normalized SQL and its fingerprint (literals and IN-lists collapsed)
+- the duration and database alias
+- the request path and the view that ran it
+- the project frames of the stack that issued it
+
+The first time a process sees a slow SELECT fingerprint it also records
+the database's EXPLAIN output (EXPLAIN on MySQL, EXPLAIN QUERY PLAN on
+SQLite) for it.
+
+`manage.py slow_queries` aggregates the file by fingerprint and lists the
+top offenders by total time. Parameter values are never written, only
+the normalized SQL.
+
+Outside requests (shell, commands), wrap code in `capture("label")`.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+import traceback
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+
+_origin = ContextVar("hall_query_origin", default=None)
+_explaining = ContextVar("hall_query_explaining", default=False)
+
+_QUOTED = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"`.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(sql):
+    """
+    SQL with placeholders and literals as ?, IN-lists as IN (...), single-spaced.
+    """
+    sql = sql.replace("%s", "?")
+    sql = _QUOTED.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql):
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()[:12]
+
+
+def _project_stack(limit=8):
+    base = str(settings.BASE_DIR)
+    frames = [
+        f"{Path(frame.filename).relative_to(base)}:{frame.lineno} {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base) and "site-packages" not in frame.filename
+        and frame.filename != __file__ and frame.name != "__call__"  # middleware chain
+    ]
+    return frames[-limit:]
+
+
+class SlowQueryLog:
+    """
+    execute_wrapper that appends slow queries to a JSONL file.
+    """
+
+    def __init__(self, path, threshold_ms=100, explain=True):
+        self.path = Path(path)
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self._lock = threading.Lock()
+        self._explained = set()
+
+    @classmethod
+    def from_settings(cls):
+        path = getattr(settings, "SLOW_QUERY_LOG", None)
+        if not path:
+            return None
+        return cls(
+            path,
+            threshold_ms=getattr(settings, "SLOW_QUERY_THRESHOLD_MS", 100),
+            explain=getattr(settings, "SLOW_QUERY_EXPLAIN", True),
+        )
+
+    def wrapper(self, alias):
+        def execute(run, sql, params, many, context):
+            if _explaining.get():
+                return run(sql, params, many, context)
+            start = time.perf_counter()
+            try:
+                return run(sql, params, many, context)
+            finally:
+                elapsed = time.perf_counter() - start
+                if elapsed >= self.threshold:
+                    self._record(alias, sql, params, many, elapsed)
+        return execute
+
+    def _record(self, alias, sql, params, many, elapsed):
+        normalized = normalize(sql)
+        key = fingerprint(normalized)
+        origin = _origin.get() or {}
+        entry = {
+            "at": timezone.now().isoformat(),
+            "fingerprint": key,
+            "sql": normalized,
+            "ms": round(elapsed * 1000, 3),
+            "alias": alias,
+            "path": origin.get("path"),
+            "view": origin.get("view"),
+            "stack": _project_stack(),
+        }
+        if self.explain and not many and key not in self._explained and normalized[:6].upper() == "SELECT":
+            self._explained.add(key)
+            entry["explain"] = self._explain(alias, sql, params)
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line)
+
+    def _explain(self, alias, sql, params):
+        connection = connections[alias]
+        token = _explaining.set(True)
+        try:
+            # savepoint: a failed EXPLAIN must not break the caller's transaction
+            guard = transaction.atomic(using=alias) if connection.in_atomic_block else ExitStack()
+            with guard, connection.cursor() as cursor:
+                cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+                columns = [col[0] for col in cursor.description or ()]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except DatabaseError as exc:
+            return [{"error": str(exc)}]
+        finally:
+            _explaining.reset(token)
+
+    @contextmanager
+    def active(self, **origin):
+        token = _origin.set(origin)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self.wrapper(connection.alias)))
+                yield
+        finally:
+            _origin.reset(token)
+
+
+_log = None
+
+
+def get_log():
+    global _log
+    if _log is None:
+        _log = SlowQueryLog.from_settings()
+    return _log
+
+
+@contextmanager
+def capture(label):
+    """
+    Log slow queries of a block outside the request cycle (no-op when SLOW_QUERY_LOG is unset).
+    """
+    log = get_log()
+    if log is None:
+        yield
+        return
+    with log.active(path=None, view=label):
+        yield
+
+
+class SlowQueryMiddleware:
+    """
+    Installed by settings only when SLOW_QUERY_LOG is set.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.log = get_log()
+
+    def __call__(self, request):
+        if self.log is None:
+            return self.get_response(request)
+        with self.log.active(path=request.path, view=None):
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        origin = _origin.get()
+        if origin is not None:
+            view = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None) or view_func
+            # __name__: @api_view classes are all called WrappedAPIView but take the function's name
+            origin["view"] = f"{view.__module__}.{view.__name__}"
+        return None
+
+
+def read_entries(path):
+    """
+    Parsed lines of a slow-query log; malformed lines (a torn write) are skipped.
+    """
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
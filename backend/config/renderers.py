@@ -0,0 +1,69 @@
+# backend/config/renderers.py
+"""
+Faster JSON renderer/parser for DRF, backed by orjson when it is installed.
+
+Enable through REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] /
+["DEFAULT_PARSER_CLASSES"] (see config/settings.py). Without orjson both
+classes fall back to DRF's stock json implementation, so the setting is safe
+on any box.
+"""
+from django.conf import settings
+from rest_framework.utils import encoders
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# Anything orjson can't serialize natively (Decimal, lazy strings, QuerySets...)
+# goes through DRF's encoder, so output matches the stock renderer.
+# Datetimes are passed through too, to keep DRF's "Z" suffix for UTC.
+_drf_default = encoders.JSONEncoder().default
+
+_ORJSON_OPTIONS = 0
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for rest_framework.renderers.JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        # Pretty-printing (browsable API, "; indent=4") stays on the stock path
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_drf_default, option=_ORJSON_OPTIONS)
+        # Same JS-safety escaping the stock renderer does
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """
+    Drop-in replacement for rest_framework.parsers.JSONParser.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,130 @@
+# backend/config/schema.py
+"""
+Pre-generated OpenAPI schema.
+
+`manage.py generate_schema` (run at build/deploy time) walks the API with
+drf_yasg once and writes OPENAPI_SCHEMA_DIR/openapi.json + openapi.yaml,
+plus openapi.meta.json holding the URLconf fingerprint it was built from.
+It is a no-op while the fingerprint still matches. The fingerprint covers
+only the routes under API_PREFIX: admin and static routes depend on the
+startup profile (HALL_API_ONLY, DEBUG) and are not in the schema.
+
+The schema views only read those files: no drf_yasg import and no serializer
+introspection at request time, so they also work in API-only mode.
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, get_resolver
+
+FORMATS = {"json": "application/json", "yaml": "application/yaml"}
+API_PREFIX = "api/"
+
+
+def schema_dir():
+    return Path(getattr(settings, "OPENAPI_SCHEMA_DIR", settings.BASE_DIR / "schema"))
+
+
+def _walk(patterns, prefix=""):
+    for p in patterns:
+        route = prefix + str(p.pattern)
+        if isinstance(p, URLResolver):
+            yield from _walk(p.url_patterns, route)
+        elif isinstance(p, URLPattern):
+            callback = p.callback
+            view = getattr(callback, "cls", None) or getattr(callback, "view_class", None) or callback
+            yield f"{route} {p.name} {view.__module__}.{view.__qualname__}"
+
+
+def url_fingerprint():
+    """
+    Hash of every API route, its name and the view behind it.
+    """
+    lines = sorted(
+        line for line in _walk(get_resolver().url_patterns) if line.lstrip("^").startswith(API_PREFIX)
+    )
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()[:16]
+
+
+def _meta_path():
+    return schema_dir() / "openapi.meta.json"
+
+
+def read_meta():
+    try:
+        return json.loads(_meta_path().read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def is_current():
+    meta = read_meta()
+    return meta is not None and meta.get("fingerprint") == url_fingerprint()
+
+
+def generate(force=False):
+    """
+    (Re)write the schema artifacts when the URLconf changed. Returns True if written.
+    """
+    fingerprint = url_fingerprint()
+    meta = read_meta()
+    if not force and meta is not None and meta.get("fingerprint") == fingerprint:
+        return False
+
+    from drf_yasg import openapi
+    from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    info = openapi.Info(
+        title=getattr(settings, "OPENAPI_TITLE", "Hall Management API"),
+        default_version=getattr(settings, "OPENAPI_VERSION", "v1"),
+    )
+    schema = OpenAPISchemaGenerator(info).get_schema(request=None, public=True)
+
+    out = schema_dir()
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "openapi.json").write_bytes(OpenAPICodecJson(validators=[]).encode(schema))
+    (out / "openapi.yaml").write_bytes(OpenAPICodecYaml(validators=[]).encode(schema))
+    # meta last: readers treat its fingerprint as "artifacts complete"
+    _meta_path().write_text(json.dumps({"fingerprint": fingerprint}))
+    _artifacts.clear()
+    return True
+
+
+class _ArtifactCache:
+    """
+    Schema bytes + ETag per format, read from disk once per process.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, fmt):
+        entry = self._data.get(fmt)
+        if entry is None:
+            with self._lock:
+                path = schema_dir() / f"openapi.{fmt}"
+                try:
+                    body = path.read_bytes()
+                except OSError:
+                    return None
+                entry = self._data[fmt] = (body, '"%s"' % hashlib.sha256(body).hexdigest()[:32])
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_artifacts = _ArtifactCache()
+
+
+def artifact(fmt):
+    """
+    (body, etag) or None when the artifact hasn't been generated.
+    """
+    return _artifacts.get(fmt)
@@ -0,0 +1,44 @@
+# backend/config/serializers.py
+"""
+Per-class memoization of ModelSerializer field construction.
+
+ModelSerializer.get_fields() introspects the model on every instantiation:
+field info, the field-class mapping, choices, unique validators. For a
+given serializer class the result never changes, so CachedFieldsMixin
+builds it once per class and hands each instance cheap copies. Choice
+maps and validator lists are shared between the copies; nothing mutates
+them after construction.
+
+    class StudentSerializer(CachedFieldsMixin, serializers.ModelSerializer): ...
+
+Only for serializers whose get_fields() doesn't depend on the instance,
+context or request. Entries are keyed by the class object: a reloaded
+module defines new classes, which build their own entries, and the old
+ones go away with the old classes.
+"""
+import copy
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from rest_framework import serializers
+
+_prototypes = WeakKeyDictionary()
+
+
+def _clone(field):
+    # fields holding bound children (nested serializers, ListField, many=True relations)
+    # need their own children; everything else is a flat object
+    if isinstance(field, serializers.BaseSerializer) or hasattr(field, "child") or hasattr(field, "child_relation"):
+        return copy.deepcopy(field)
+    return copy.copy(field)
+
+
+class CachedFieldsMixin:
+    def get_fields(self):
+        if not getattr(settings, "SERIALIZER_FIELD_CACHE", True):
+            return super().get_fields()
+        cls = type(self)
+        prototypes = _prototypes.get(cls)
+        if prototypes is None:
+            prototypes = _prototypes[cls] = super().get_fields()
+        return {name: _clone(field) for name, field in prototypes.items()}
@@ -1,4 +1,5 @@
 # backend/config/settings.py
+import os
 from pathlib import Path
 from datetime import timedelta
 
@@ -31,16 +32,33 @@ INSTALLED_APPS = [
     "hallcore",        # keep if you actually have this app
     "users",
     "notices",
+    "jobs",            # background job queue (manage.py jobworker)
+    "notifications",   # batched email fan-out (runs on jobs)
 ]
 
+# HALL_API_ONLY=1: API worker profile. No admin site, browsable API, static
+# files, messages or Swagger; those apps aren't imported at startup at all.
+# `manage.py profile_startup` compares both profiles.
+API_ONLY = os.environ.get("HALL_API_ONLY") == "1"
+API_ONLY_SKIPPED_APPS = (
+    "django.contrib.admin",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "drf_yasg",
+)
+if API_ONLY:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_ONLY_SKIPPED_APPS]
+
 # --- Middleware ---
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # CORS should be high
+    "config.middleware.CompressionMiddleware",  # before anything that touches the body
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.db_router.ReplicaStickinessMiddleware",  # read-your-writes after a write
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -62,6 +80,10 @@ TEMPLATES = [
     },
 ]
 
+if API_ONLY:
+    MIDDLEWARE.remove("django.contrib.messages.middleware.MessageMiddleware")
+    TEMPLATES[0]["OPTIONS"]["context_processors"].remove("django.contrib.messages.context_processors.messages")
+
 WSGI_APPLICATION = "config.wsgi.application"
 
 # --- Database ---
@@ -82,6 +104,42 @@ DATABASES = {
     }
 }
 
+# Read replicas (config.db_router): aliases in DATABASES that serve GETs on
+# views marked with replica_reads / ReplicaReadsMixin
+DATABASE_REPLICAS = []
+DATABASE_REPLICA_STICKY_SECONDS = 5  # primary-only reads for a user after they write
+DATABASE_ROUTERS = ["config.db_router.ReplicaRouter"]
+
+if os.environ.get("HALL_DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.environ["HALL_DB_REPLICA_HOST"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = ["replica"]
+
+# HALL_SQLITE=1: local primary + replica pair of SQLite files, no MySQL needed.
+# The replica only changes when you run `manage.py sync_sqlite_replica`, which
+# makes replica lag (and stickiness) easy to observe.
+if os.environ.get("HALL_SQLITE"):
+    DATABASES = {
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "db.sqlite3"},
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db_replica.sqlite3",
+            "TEST": {"MIRROR": "default"},
+        },
+    }
+    DATABASE_REPLICAS = ["replica"]
+
+# --- Slow-query log (config.querylog; opt-in, for staging) ---
+# HALL_SLOW_QUERY_LOG=/path/slow_queries.jsonl turns it on; `manage.py slow_queries` reports on it
+SLOW_QUERY_LOG = os.environ.get("HALL_SLOW_QUERY_LOG") or None
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("HALL_SLOW_QUERY_MS", 100))
+SLOW_QUERY_EXPLAIN = True  # EXPLAIN each slow SELECT shape once per process
+if SLOW_QUERY_LOG:
+    MIDDLEWARE.insert(MIDDLEWARE.index("config.middleware.CompressionMiddleware") + 1, "config.querylog.SlowQueryMiddleware")
+
 # --- Password validation ---
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -102,6 +160,7 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+PROFILE_PHOTO_MAX_SIZE = 512  # px, longest side; applied by users.tasks.process_profile_photo
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -112,7 +171,7 @@ AUTH_USER_MODEL = "users.User"  # ✅ correct casing
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.TokenAuthentication",            # ✅ DRF tokens
-        "rest_framework_simplejwt.authentication.JWTAuthentication",    # optional JWT
+        "users.authentication.ClaimsJWTAuthentication",  # JWT; stateless on reads
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.AllowAny",  # you can tighten in production
@@ -120,15 +179,134 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
+    # every list is paginated; opt out per view with `pagination_class = None`
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.CountFreePagination",
+    "PAGE_SIZE": 50,
+    # token buckets per user (or IP) and scope; only unsafe methods spend tokens
+    "DEFAULT_THROTTLE_CLASSES": (
+        "config.throttling.CostThrottle",
+    ),
+    # anonymous callers are keyed on their address: REMOTE_ADDR by default, or the
+    # X-Forwarded-For entry added by the outermost of HALL_NUM_PROXIES trusted proxies.
+    # Left unset, DRF would trust the whole client-supplied header.
+    "NUM_PROXIES": int(os.environ.get("HALL_NUM_PROXIES", 0)),
+    "DEFAULT_THROTTLE_RATES": {
+        "auth": "20/min",           # register / login
+        "applications": "10/min",   # ApplicationCreateView, ApplicationIntakeView
+        "profile": "30/min",        # complete-profile / profile update
+        "notices": "60/min",        # notice writes (admins)
+    },
+    # orjson-backed when installed (pip install orjson), stock json otherwise.
+    # Swap back to rest_framework.renderers.JSONRenderer / parsers.JSONParser to disable.
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
+if API_ONLY:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("config.renderers.FastJSONRenderer",)
+
+# --- Serializers (config.serializers) ---
+SERIALIZER_FIELD_CACHE = True  # build ModelSerializer fields once per class; False rebuilds per instance
+
+# --- Pagination (config.pagination) ---
+PAGINATION_MAX_PAGE_SIZE = 200  # hard cap for ?page_size=
+# Unpaged requests (no ?page= / ?page_size=) get a bare list marked `Deprecation: true`,
+# cut at this many rows (rounded down to whole pages), with Link rel="next" to the rest.
+PAGINATION_LEGACY_LIMIT = 1000
+PAGINATION_LEGACY_SUNSET = None  # HTTP date announced in the Sunset header once it is set
+PAGINATION_COUNT_TTL = 60       # seconds a cached "count" may lag behind the table
+
+# --- OpenAPI schema (config.schema; built by `manage.py generate_schema`) ---
+OPENAPI_SCHEMA_DIR = BASE_DIR / "schema"
+OPENAPI_SCHEMA_MAX_AGE = 3600  # seconds; clients revalidate with the ETag afterwards
+OPENAPI_TITLE = "Hall Management API"
+OPENAPI_VERSION = "v1"
+SWAGGER_SETTINGS = {
+    "DEFAULT_FILTER_INSPECTORS": ["config.openapi_inspectors.OperationParametersInspector"],
+    "DEFAULT_PAGINATOR_INSPECTORS": [
+        "drf_yasg.inspectors.DjangoRestResponsePagination",
+        "config.openapi_inspectors.OperationParametersInspector",
+    ],
+    "SECURITY_DEFINITIONS": {
+        "Bearer": {"type": "apiKey", "name": "Authorization", "in": "header"},
+    },
+}
+
+# --- Throttling (config.throttling) ---
+THROTTLE_UPLOAD_COST = 5   # tokens for a multipart request...
+THROTTLE_COST_PER_MB = 1   # ...plus this per started MB of body
+
+# --- Response compression (config.middleware.CompressionMiddleware) ---
+# gzip always; br / zstd when the brotli / zstandard packages are installed.
+COMPRESSION_MIN_SIZE = 1024  # bytes; smaller bodies aren't worth the CPU
+COMPRESSION_PREFERENCE = ("zstd", "br", "gzip")  # tie-break when q-values are equal
 
 # --- Simple JWT (if you use it) ---
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "AUTH_HEADER_TYPES": ("Bearer",),
+    # rejects refresh tokens revoked at logout (users.revocation)
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.RevocationCheckingTokenRefreshSerializer",
 }
 
+# --- Stateless JWT reads (users.authentication) ---
+# GET/HEAD/OPTIONS authorize from role/is_verified/is_staff token claims instead
+# of loading the User row; writes always hit the DB. Deactivation and role /
+# staff changes revoke the user's tokens; refresh re-issues claims from the DB.
+JWT_STATELESS_READS = True
+JWT_VERIFIED_TOKEN_CACHE_TTL = 60      # seconds (never past the token's exp)
+JWT_VERIFIED_TOKEN_CACHE_SIZE = 4096   # tokens per process
+JWT_REVOCATION_SYNC_INTERVAL = 10      # seconds between denylist pulls from the DB
+
+# --- Background jobs (jobs app) ---
+JOBS_EAGER = False              # True: run jobs in-process right after commit (handy in tests)
+JOBS_VISIBILITY_TIMEOUT = 300   # seconds before a claimed-but-unfinished job is handed out again
+JOBS_RETRY_BACKOFF = 10         # seconds; doubles on every failed attempt
+
+# --- Application intake (hallcore.intake) ---
+INTAKE_BATCH_SIZE = 500           # submissions validated and promoted per transaction
+INTAKE_BATCH_DELAY = 2            # seconds submissions gather before a job processes them; None: only `process_intake --loop`
+INTAKE_VISIBILITY_TIMEOUT = 120   # seconds before a claimed-but-unfinished batch is handed out again
+INTAKE_POLL_INTERVAL = 2          # Retry-After (seconds) on receipts still being processed
+INTAKE_RETENTION = 7 * 86400      # seconds processed receipts stay pollable
+
+# --- Cache ---
+# per-process locmem by default; point at Redis/Memcached when running several workers
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "hall-management",
+    }
+}
+# config.cache: read-through entries for hot GET endpoints
+CACHE_STALE_GRACE = 30      # seconds an expired entry may still be served while one worker refreshes it
+CACHE_LOCK_TIMEOUT = 10     # seconds; upper bound for a recompute holding the refresh lock
+NOTICE_LIST_CACHE_TTL = 60  # seconds
+PROFILE_CACHE_TTL = 60      # seconds
+
+# --- Notice delta sync (notices.sync) ---
+NOTICE_TOMBSTONE_RETENTION = 30 * 86400  # seconds; older `since` values get a full resync
+NOTICE_SYNC_OVERLAP = 5                  # seconds re-scanned before `since` (late commits)
+NOTICE_SYNC_PAGE_SIZE = 200              # notices per ?since= response; `more: true` asks for another call
+
+# --- Rooms (users.rooms) ---
+HALL_ROOM_CAPACITY = 4  # beds per room
+ROOM_CACHE_TTL = 60     # seconds; room list / detail responses
+
+# --- Email / notifications ---
+# console in dev; smtp in production, locmem/filebased in tests
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+DEFAULT_FROM_EMAIL = "hall-office@localhost"
+NOTIFICATION_BATCH_SIZE = 100        # recipients per SMTP connection
+NOTIFICATION_MAX_CONNECTIONS = 4     # chunks sent concurrently per batch
+
 # --- CORS ---
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
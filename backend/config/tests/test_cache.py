@@ -0,0 +1,67 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from config.cache import get_or_compute, invalidate
+
+THREADS = 16
+
+
+class GetOrComputeTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def loader(self, value, seconds=0.1):
+        def compute():
+            with self.lock:
+                self.calls += 1
+            time.sleep(seconds)
+            return value
+        return compute
+
+    def concurrently(self, fn):
+        barrier = threading.Barrier(THREADS)
+        results = [None] * THREADS
+
+        def run(n):
+            barrier.wait()
+            results[n] = fn()
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_cold_miss_computes_once(self):
+        results = self.concurrently(lambda: get_or_compute("k", self.loader("fresh"), 60, beta=0))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, ["fresh"] * THREADS)
+
+    def test_expiry_recomputes_once_and_serves_stale_meanwhile(self):
+        cache.set("k", ("stale", 0.1, time.time() - 1), 60)  # expired, still within the grace period
+        results = self.concurrently(lambda: get_or_compute("k", self.loader("fresh"), 60, beta=0))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results.count("fresh"), 1)
+        self.assertEqual(results.count("stale"), THREADS - 1)
+        self.assertEqual(get_or_compute("k", self.loader("again"), 60, beta=0), "fresh")
+        self.assertEqual(self.calls, 1)
+
+    def test_each_expiry_window_recomputes_once(self):
+        for window in range(3):
+            cache.set("k", (f"v{window}", 0.1, time.time() - 1), 60)
+            self.concurrently(lambda: get_or_compute("k", self.loader("fresh", 0.05), 60, beta=0))
+            self.assertEqual(self.calls, window + 1)
+
+    def test_invalidated_recompute_is_not_stored(self):
+        def compute():
+            invalidate("k")  # a write lands while the value is being built
+            return "outdated"
+
+        self.assertEqual(get_or_compute("k", compute, 60), "outdated")
+        self.assertIsNone(cache.get("k"))
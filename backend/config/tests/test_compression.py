@@ -0,0 +1,81 @@
+import gzip
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from config.middleware import CompressionMiddleware, _accepted_encodings, _GzipCodec
+
+factory = RequestFactory()
+BODY = b'{"id": 1, "name": "Student"}' * 100
+
+
+class _Named:
+    def __init__(self, name):
+        self.name = name
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024, COMPRESSION_PREFERENCE=("zstd", "br", "gzip"))
+class NegotiationTests(SimpleTestCase):
+    def setUp(self):
+        self.middleware = CompressionMiddleware(lambda request: None)
+        self.middleware.codecs = [_Named("zstd"), _Named("br"), _Named("gzip")]
+
+    def negotiate(self, header):
+        codec = self.middleware._negotiate(header)
+        return codec and codec.name
+
+    def test_q_zero_is_kept_as_refused(self):
+        self.assertEqual(_accepted_encodings("gzip;q=0, br"), {"gzip": 0.0, "br": 1.0})
+
+    def test_highest_q_wins_then_preference(self):
+        self.assertEqual(self.negotiate("gzip;q=1.0, br;q=0.5"), "gzip")
+        self.assertEqual(self.negotiate("gzip, br"), "br")
+
+    def test_refused_coding_is_not_readmitted_by_wildcard(self):
+        self.assertEqual(self.negotiate("zstd;q=0, br;q=0, *"), "gzip")
+        self.middleware.codecs = [_Named("gzip")]
+        self.assertIsNone(self.negotiate("gzip;q=0, *"))
+
+    def test_nothing_acceptable(self):
+        self.assertIsNone(self.negotiate(""))
+        self.assertIsNone(self.negotiate("identity"))
+        self.assertIsNone(self.negotiate("*;q=0"))
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024, COMPRESSION_PREFERENCE=("gzip",))
+class CompressionMiddlewareTests(SimpleTestCase):
+    def run_middleware(self, response, accept="gzip"):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(factory.get("/", HTTP_ACCEPT_ENCODING=accept))
+
+    def test_compresses_large_body(self):
+        response = self.run_middleware(HttpResponse(BODY, headers={"ETag": '"abc"'}))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertEqual(response["ETag"], 'W/"abc"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_small_body_is_left_alone(self):
+        response = self.run_middleware(HttpResponse(b"{}"))
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, b"{}")
+
+    def test_refused_gzip_is_not_sent(self):
+        response = self.run_middleware(HttpResponse(BODY), accept="gzip;q=0, *")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, BODY)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_already_encoded_response_passes_through(self):
+        encoded = _GzipCodec().compress(BODY)
+        response = self.run_middleware(HttpResponse(encoded, headers={"Content-Encoding": "gzip"}))
+        self.assertEqual(response.content, encoded)
+        self.assertFalse(response.has_header("Vary"))
+
+    def test_streaming_response_is_compressed_chunk_by_chunk(self):
+        chunks = [b"[", BODY, b",", BODY, b"]"]
+        response = self.run_middleware(StreamingHttpResponse(iter(chunks)))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), b"".join(chunks))
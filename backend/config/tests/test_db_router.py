@@ -0,0 +1,112 @@
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.views import APIView
+
+from config.benchmark import FAST_HASHERS
+from config.db_router import PRIMARY, ReplicaReadsMixin, ReplicaRouter, pin_to_primary, read_alias_for, reading_from
+from notices.models import Notice
+
+factory = APIRequestFactory()
+
+# the HALL_SQLITE=1 pair (or HALL_DB_REPLICA_HOST) defines a "replica" alias
+HAS_REPLICA = "replica" in settings.DATABASES
+
+
+def request(method="get", user=None):
+    req = getattr(factory, method)("/")
+    req.user = user or AnonymousUser()
+    return req
+
+
+class _User:
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], DATABASE_REPLICA_STICKY_SECONDS=5)
+@skipUnless(HAS_REPLICA, "no replica alias configured")
+class ReadAliasTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_safe_reads_go_to_a_replica(self):
+        self.assertEqual(read_alias_for(request()), "replica")
+        self.assertEqual(read_alias_for(request(user=_User(1))), "replica")
+
+    def test_unsafe_requests_read_from_the_primary(self):
+        self.assertEqual(read_alias_for(request("post")), PRIMARY)
+
+    def test_pinned_user_reads_from_the_primary(self):
+        pin_to_primary(1)
+        self.assertEqual(read_alias_for(request(user=_User(1))), PRIMARY)
+        self.assertEqual(read_alias_for(request(user=_User(2))), "replica")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_means_primary(self):
+        self.assertEqual(read_alias_for(request()), PRIMARY)
+
+    def test_router_follows_the_read_alias_and_writes_to_primary(self):
+        router = ReplicaRouter()
+        self.assertEqual(router.db_for_read(Notice), PRIMARY)
+        with reading_from("replica"):
+            self.assertEqual(router.db_for_read(Notice), "replica")
+            self.assertEqual(router.db_for_write(Notice), PRIMARY)
+        self.assertEqual(router.db_for_read(Notice), PRIMARY)
+        self.assertFalse(router.allow_migrate("replica", "notices"))
+
+    def test_failing_view_does_not_leave_its_alias_behind(self):
+        class Failing(ReplicaReadsMixin, APIView):
+            def get(self, request):
+                raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            Failing.as_view()(factory.get("/"))
+        self.assertEqual(ReplicaRouter().db_for_read(Notice), PRIMARY)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=["replica"], DATABASE_REPLICA_STICKY_SECONDS=5)
+@skipUnless(HAS_REPLICA, "no replica alias configured")
+class EndpointRoutingTests(TransactionTestCase):
+    # committed rows: the replica connection can't see into the primary's test transaction
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.notice = Notice.objects.create(title="t", body="b")
+        self.admin = get_user_model().objects.create_user(
+            username="admin", email="admin@example.com", password="pw", is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.url = f"/api/notices/{self.notice.pk}/"
+
+    def queries(self, method, **data):
+        with CaptureQueriesContext(connections[PRIMARY]) as primary, \
+                CaptureQueriesContext(connections["replica"]) as replica:
+            response = getattr(self.client, method)(self.url, data, format="json")
+        self.assertLess(response.status_code, 400, response.content)
+        return len(primary), len(replica)
+
+    def test_read_goes_to_the_replica(self):
+        primary, replica = self.queries("get")
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_write_goes_to_the_primary_and_pins_the_writer(self):
+        primary, replica = self.queries("patch", title="edited")
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+        # read-your-writes: the next read stays on the primary
+        primary, replica = self.queries("get")
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
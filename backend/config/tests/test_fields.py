@@ -0,0 +1,50 @@
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from config.fields import model_columns, parse_selection, trim
+from hallcore.models import Application
+
+AVAILABLE = ["id", "full_name", "student_id", "address"]
+
+
+def select(query):
+    return parse_selection(QueryDict(query), AVAILABLE)
+
+
+class ParseSelectionTests(SimpleTestCase):
+    def test_no_parameters_keeps_everything(self):
+        self.assertIsNone(select(""))
+
+    def test_fields_keep_available_order(self):
+        self.assertEqual(select("fields=student_id, id,,"), ["id", "student_id"])
+
+    def test_exclude_and_both(self):
+        self.assertEqual(select("exclude=address"), ["id", "full_name", "student_id"])
+        self.assertEqual(select("fields=id,address&exclude=address"), ["id"])
+
+    def test_unknown_names_are_rejected_per_parameter(self):
+        with self.assertRaises(ValidationError) as ctx:
+            select("fields=id,nope&exclude=gone")
+        self.assertEqual(set(ctx.exception.detail), {"fields", "exclude"})
+        self.assertIn("nope", str(ctx.exception.detail["fields"][0]))
+
+    def test_trim(self):
+        data = {"id": 1, "full_name": "A", "address": "x"}
+        self.assertEqual(trim(data, ["address", "id", "student_id"]), {"address": "x", "id": 1})
+        self.assertIs(trim(data, None), data)
+
+
+class ModelColumnsTests(SimpleTestCase):
+    def test_concrete_fields_map_to_columns_plus_pk(self):
+        fields = {"full_name": serializers.CharField(), "status": serializers.CharField()}
+        for name, field in fields.items():
+            field.bind(name, None)
+        self.assertEqual(model_columns(fields, Application), ["id", "full_name", "status"])
+
+    def test_anything_else_disables_only(self):
+        for source in ("*", "suspected_duplicate_of.full_name", "not_a_column"):
+            field = serializers.CharField(source=source)
+            field.bind("x", None)
+            self.assertIsNone(model_columns({"x": field}, Application), source)
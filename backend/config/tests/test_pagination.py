@@ -0,0 +1,57 @@
+from django.test import TestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config.pagination import CountFreePagination
+from notices.models import Notice
+
+factory = APIRequestFactory()
+
+
+@override_settings(PAGINATION_MAX_PAGE_SIZE=10)
+class CountFreePaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Notice.objects.bulk_create(Notice(title=f"n{i}", body="b") for i in range(25))
+
+    def paginate(self, query=""):
+        paginator = CountFreePagination()
+        rows = paginator.paginate_queryset(Notice.objects.order_by("pk"), Request(factory.get(f"/x/{query}")))
+        return rows, paginator.get_paginated_response([row.pk for row in rows])
+
+    @override_settings(PAGINATION_LEGACY_LIMIT=30)
+    def test_unpaged_list_under_the_cap_is_complete(self):
+        rows, response = self.paginate()
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(response.data, sorted(Notice.objects.values_list("pk", flat=True)))
+        self.assertEqual(response["Deprecation"], "true")
+        self.assertFalse(response.has_header("Link"))
+        self.assertFalse(response.has_header("Sunset"))
+
+    @override_settings(PAGINATION_LEGACY_SUNSET="Sat, 01 May 2027 00:00:00 GMT")
+    def test_sunset_is_announced(self):
+        _, response = self.paginate()
+        self.assertEqual(response["Sunset"], "Sat, 01 May 2027 00:00:00 GMT")
+
+    @override_settings(PAGINATION_LEGACY_LIMIT=15)
+    def test_unpaged_list_is_cut_at_whole_pages_and_links_the_rest(self):
+        with self.assertLogs("config.pagination", "WARNING"):
+            rows, response = self.paginate()
+        self.assertEqual(len(rows), 10)  # 15 rounded down to whole pages of 10
+        self.assertIn("page_size=10", response["Link"])
+        self.assertIn("page=2", response["Link"])
+
+    @override_settings(PAGINATION_LEGACY_LIMIT=20)
+    def test_link_points_at_the_first_page_after_the_cut(self):
+        with self.assertLogs("config.pagination", "WARNING"):
+            rows, response = self.paginate()
+        self.assertEqual(len(rows), 20)
+        self.assertIn("page=3", response["Link"])
+        next_rows, _ = self.paginate("?page=3&page_size=10")
+        self.assertEqual(next_rows[0].pk, rows[-1].pk + 1)
+
+    def test_paged_envelope(self):
+        rows, response = self.paginate("?page=3&page_size=10")
+        self.assertEqual(len(rows), 5)
+        self.assertEqual((response.data["count"], response.data["next"]), (25, None))
+        self.assertFalse(response.has_header("Deprecation"))
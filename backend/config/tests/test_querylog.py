@@ -0,0 +1,87 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from config.querylog import SlowQueryLog, fingerprint, normalize, read_entries
+from notices.models import Notice
+
+
+class NormalizeTests(TestCase):
+    def test_literals_and_in_lists_collapse(self):
+        self.assertEqual(
+            normalize("SELECT *  FROM t WHERE a = 'x''y' AND b IN (%s, %s, %s) AND c > 12.5"),
+            "SELECT * FROM t WHERE a = ? AND b IN (...) AND c > ?",
+        )
+
+    def test_identifiers_with_digits_are_kept(self):
+        self.assertEqual(normalize('SELECT "t1"."col2" FROM t1'), 'SELECT "t1"."col2" FROM t1')
+
+
+class SlowQueryLogTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "slow.jsonl"
+
+    def run_queries(self, threshold_ms):
+        log = SlowQueryLog(self.path, threshold_ms=threshold_ms)
+        with log.active(path="/api/notices/", view="notices.views.NoticeViewSet"):
+            list(Notice.objects.filter(title="secret-title"))
+            list(Notice.objects.filter(title="other-title"))
+        return list(read_entries(self.path)) if self.path.exists() else []
+
+    def test_queries_below_threshold_are_not_logged(self):
+        self.assertEqual(self.run_queries(threshold_ms=60_000), [])
+
+    def test_slow_query_is_recorded_without_parameters(self):
+        first, second = self.run_queries(threshold_ms=0)
+        self.assertEqual(first["fingerprint"], second["fingerprint"])
+        self.assertEqual(first["fingerprint"], fingerprint(first["sql"]))
+        self.assertIn("notices_notice", first["sql"])
+        self.assertNotIn("secret-title", json.dumps(first))
+        self.assertEqual((first["alias"], first["path"]), (connection.alias, "/api/notices/"))
+        self.assertEqual(first["view"], "notices.views.NoticeViewSet")
+        self.assertTrue(any("test_querylog.py" in frame for frame in first["stack"]))
+        # EXPLAIN once per shape
+        self.assertTrue(first["explain"])
+        self.assertNotIn("explain", second)
+
+
+class SlowQueriesCommandTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "slow.jsonl"
+        entries = [
+            {"fingerprint": "aaa", "sql": "SELECT a", "ms": 5.0, "view": "v.A"},
+            {"fingerprint": "aaa", "sql": "SELECT a", "ms": 7.0, "view": "v.A"},
+            {"fingerprint": "bbb", "sql": "SELECT b", "ms": 9.0, "view": "v.B"},
+        ]
+        self.path.write_text("".join(json.dumps(e) + "\n" for e in entries) + '{"torn":\n')
+
+    def report(self, *args):
+        out = tempfile.TemporaryFile("w+")
+        call_command("slow_queries", "--log", str(self.path), "--json", *args, stdout=out)
+        out.seek(0)
+        return json.load(out)
+
+    def test_groups_by_fingerprint_and_ranks_by_total_time(self):
+        ranked = self.report()
+        self.assertEqual([(g["fingerprint"], g["calls"], g["total_ms"]) for g in ranked], [("aaa", 2, 12.0), ("bbb", 1, 9.0)])
+        self.assertEqual(ranked[0]["max_ms"], 7.0)
+
+    def test_top_and_view_filter(self):
+        self.assertEqual([g["fingerprint"] for g in self.report("--top", "1")], ["aaa"])
+        self.assertEqual([g["fingerprint"] for g in self.report("--view", "v.B")], ["bbb"])
+
+    def test_top_must_be_positive(self):
+        with self.assertRaises(CommandError):
+            self.report("--top", "0")
+
+    def test_missing_log_is_an_error(self):
+        with self.assertRaises(CommandError):
+            call_command("slow_queries", "--log", str(self.path.with_name("missing.jsonl")))
@@ -0,0 +1,48 @@
+import datetime
+import decimal
+import io
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from config import renderers
+from config.renderers import FastJSONParser, FastJSONRenderer
+
+
+@skipIf(renderers.orjson is None, "orjson is not installed")
+class FastJSONRendererTests(SimpleTestCase):
+    def assertMatchesStock(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_plain_data_matches_stock_renderer(self):
+        self.assertMatchesStock({"count": 2, "results": [{"id": 1, "name": "Ünal"}, {"id": 2, "name": None}]})
+
+    def test_fallback_types_match_stock_renderer(self):
+        self.assertMatchesStock({
+            "fee": decimal.Decimal("12.50"),
+            "at": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            "on": datetime.date(2025, 1, 2),
+        })
+
+    def test_line_separators_are_escaped(self):
+        rendered = FastJSONRenderer().render({"text": "a\u2028b\u2029c"})
+        self.assertEqual(rendered, b'{"text":"a\\u2028b\\u2029c"}')
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_indent_uses_stock_path(self):
+        rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        self.assertEqual(rendered, JSONRenderer().render({"a": 1}, "application/json; indent=2"))
+
+
+@skipIf(renderers.orjson is None, "orjson is not installed")
+class FastJSONParserTests(SimpleTestCase):
+    def test_parses_utf8(self):
+        self.assertEqual(FastJSONParser().parse(io.BytesIO('{"name": "Ünal"}'.encode())), {"name": "Ünal"})
+
+    def test_invalid_json_is_a_parse_error(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b"{nope"))
@@ -0,0 +1,24 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import path
+
+from config import schema
+from config.urls import urlpatterns as full_patterns
+
+# the API-only profile: same routes without admin/ and media/
+urlpatterns = [p for p in full_patterns if str(p.pattern).lstrip("^").startswith(schema.API_PREFIX)]
+
+
+class UrlFingerprintTests(SimpleTestCase):
+    def test_ignores_routes_outside_the_api(self):
+        full = schema.url_fingerprint()
+        with override_settings(ROOT_URLCONF=__name__):
+            self.assertEqual(schema.url_fingerprint(), full)
+
+    def test_changes_with_api_routes(self):
+        full = schema.url_fingerprint()
+        with override_settings(ROOT_URLCONF=__name__):
+            urlpatterns.append(path("api/extra/", schema.artifact, name="extra"))
+            try:
+                self.assertNotEqual(schema.url_fingerprint(), full)
+            finally:
+                urlpatterns.pop()
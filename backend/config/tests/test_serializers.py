@@ -0,0 +1,43 @@
+from django.test import SimpleTestCase, override_settings
+from rest_framework import serializers
+
+from config.serializers import CachedFieldsMixin, _prototypes
+from hallcore.models import Application
+from hallcore.serializers import ApplicationSerializer
+from notices.serializers import NoticeSerializer
+
+
+class _NoticeBatchSerializer(CachedFieldsMixin, serializers.Serializer):
+    notices = NoticeSerializer(many=True)
+    tags = serializers.ListField(child=serializers.CharField())
+
+
+class CachedFieldsMixinTests(SimpleTestCase):
+    def test_each_instance_gets_fresh_bound_fields(self):
+        first, second = NoticeSerializer(), NoticeSerializer()
+        self.assertEqual(list(first.fields), list(second.fields))  # .fields is built lazily
+        prototypes = _prototypes[NoticeSerializer]
+        for name in prototypes:
+            self.assertIsNot(first.fields[name], second.fields[name])
+            self.assertIsNot(first.fields[name], prototypes[name])
+            self.assertIs(first.fields[name].parent, first)
+            self.assertIs(second.fields[name].parent, second)
+
+    def test_nested_children_are_not_shared(self):
+        first, second = _NoticeBatchSerializer(), _NoticeBatchSerializer()
+        self.assertIsNot(first.fields["notices"].child, second.fields["notices"].child)
+        self.assertIsNot(first.fields["tags"].child, second.fields["tags"].child)
+        self.assertIs(first.fields["notices"].child.parent, first.fields["notices"])
+
+    def test_trimming_one_request_does_not_leak_into_the_next(self):
+        self.assertEqual(list(ApplicationSerializer(fields=["id", "status"]).fields), ["id", "status"])
+        self.assertIn("address", ApplicationSerializer().fields)
+
+    def test_output_matches_uncached_fields(self):
+        app = Application(
+            pk=1, full_name="A", student_id="S1", department="CSE", session="2024-25", gender="Male",
+            address="x", mobile="01710000000", email="a@example.com", payment_slip_no="P1",
+        )
+        cached = ApplicationSerializer(app).data
+        with override_settings(SERIALIZER_FIELD_CACHE=False):
+            self.assertEqual(ApplicationSerializer(app).data, cached)
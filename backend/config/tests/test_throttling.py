@@ -0,0 +1,85 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from config.throttling import TokenBucket, request_cost, scoped_throttle
+
+factory = APIRequestFactory()
+MB = 1024 * 1024
+
+
+class RequestCostTests(SimpleTestCase):
+    def test_json_costs_one(self):
+        self.assertEqual(request_cost(factory.post("/", {"a": 1}, format="json")), 1)
+
+    @override_settings(THROTTLE_UPLOAD_COST=5, THROTTLE_COST_PER_MB=1)
+    def test_multipart_costs_base_plus_started_megabytes(self):
+        request = factory.post("/", {"a": 1}, format="multipart")
+        self.assertEqual(request_cost(request), 5 + 1)
+        request.META["CONTENT_LENGTH"] = str(2 * MB + 1)
+        self.assertEqual(request_cost(request), 5 + 3)
+
+
+class TokenBucketTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.bucket = TokenBucket("throttle:test:user:1", capacity=10, interval=6.0)
+
+    def test_cost_is_taken_and_refills(self):
+        self.assertEqual(self.bucket.take(4, now=1000), 0.0)
+        self.assertAlmostEqual(self.bucket.tokens(now=1000), 6)
+        self.assertAlmostEqual(self.bucket.tokens(now=1012), 8)
+
+    def test_wait_covers_missing_tokens(self):
+        self.assertEqual(self.bucket.take(8, now=1000), 0.0)
+        self.assertAlmostEqual(self.bucket.take(5, now=1000), 3 * 6.0)
+        self.assertEqual(self.bucket.take(5, now=1018), 0.0)
+
+    def test_cost_above_capacity_drains_a_full_bucket(self):
+        self.assertEqual(self.bucket.take(25, now=1000), 0.0)
+        self.assertAlmostEqual(self.bucket.tokens(now=1000), 0)
+        # a partly refilled bucket waits until it is full, not forever
+        self.assertAlmostEqual(self.bucket.take(25, now=1030), 30.0)
+        self.assertEqual(self.bucket.take(25, now=1060), 0.0)
+
+
+@override_settings(THROTTLE_UPLOAD_COST=5, THROTTLE_COST_PER_MB=1)
+class CostThrottleTests(SimpleTestCase):
+    rates = {"DEFAULT_THROTTLE_RATES": {"test": "10/min"}}
+
+    def setUp(self):
+        cache.clear()
+        self.throttle = scoped_throttle("test")()
+
+    def allow(self, request):
+        request.user = None
+        return self.throttle.allow_request(request, view=None)
+
+    def test_charges_by_cost_and_reports_wait(self):
+        with self.settings(REST_FRAMEWORK=self.rates):
+            self.assertTrue(self.allow(factory.post("/", {"a": 1}, format="multipart")))  # 6 tokens
+            for _ in range(4):
+                self.assertTrue(self.allow(factory.post("/", {}, format="json")))
+            self.assertFalse(self.allow(factory.post("/", {}, format="json")))
+            self.assertAlmostEqual(self.throttle.wait(), 6.0, delta=0.1)
+
+    def test_safe_methods_are_free(self):
+        with self.settings(REST_FRAMEWORK=self.rates):
+            for _ in range(20):
+                self.assertTrue(self.allow(factory.get("/")))
+            self.assertIsNone(self.throttle.wait())
+
+    def test_oversized_upload_is_admitted_when_bucket_is_full(self):
+        with self.settings(REST_FRAMEWORK=self.rates):
+            request = factory.post("/", {"a": 1}, format="multipart")
+            request.META["CONTENT_LENGTH"] = str(20 * MB)
+            self.assertTrue(self.allow(request))
+            self.assertFalse(self.allow(factory.post("/", {}, format="json")))
+
+    def test_anonymous_ident_ignores_forwarded_for_without_trusted_proxies(self):
+        request = factory.post("/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.2.3.4")
+        request.user = None
+        with self.settings(REST_FRAMEWORK={**self.rates, "NUM_PROXIES": 0}):
+            self.assertEqual(self.throttle.get_ident(request), "ip:10.0.0.1")
+        with self.settings(REST_FRAMEWORK={**self.rates, "NUM_PROXIES": 1}):
+            self.assertEqual(self.throttle.get_ident(request), "ip:1.2.3.4")
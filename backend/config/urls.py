@@ -1,15 +1,14 @@
 # backend/config/urls.py
-from django.contrib import admin
-from django.urls import path, include
+from django.apps import apps
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
+from config.views import ThrottleStateView, openapi_schema_view
 from users.views import EmailOrUsernameTokenObtainPairView
 from rest_framework_simplejwt.views import TokenRefreshView
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
-
     path("api/users/", include("users.urls")),
     path("api/notices/", include("notices.urls")),
     path("api/", include("hallcore.urls")),
@@ -17,7 +16,19 @@ urlpatterns = [
     # JWT login (email OR username)
     path("api/token/", EmailOrUsernameTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+
+    # operators: inspect / reset throttle buckets
+    path("api/ops/throttles/", ThrottleStateView.as_view(), name="throttle-state"),
+
+    # OpenAPI schema, pre-generated by `manage.py generate_schema`
+    re_path(r"^api/schema\.(?P<fmt>json|yaml)$", openapi_schema_view, name="openapi-schema"),
 ]
 
+# not installed in API-only mode (HALL_API_ONLY=1)
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
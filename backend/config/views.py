@@ -0,0 +1,101 @@
+# backend/config/views.py
+"""
+Project-level endpoints (routed in config/urls.py): throttle state for
+operators and the pre-generated OpenAPI schema.
+"""
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.http import condition, require_safe
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+
+from . import schema
+from .throttling import bucket
+
+logger = logging.getLogger(__name__)
+
+
+class ThrottleStateView(APIView):
+    """
+    Operators: GET ?user=<id> or ?ip=<addr> shows every scope's bucket;
+    DELETE with the same query (optionally &scope=) refills them.
+    """
+    permission_classes = [IsAdminUser]
+
+    def _ident(self, request):
+        if request.query_params.get("user"):
+            return f"user:{request.query_params['user']}"
+        if request.query_params.get("ip"):
+            return f"ip:{request.query_params['ip']}"
+        return None
+
+    def _scopes(self, request):
+        scopes = api_settings.DEFAULT_THROTTLE_RATES
+        if request.query_params.get("scope"):
+            return {s: r for s, r in scopes.items() if s == request.query_params["scope"]}
+        return scopes
+
+    def get(self, request):
+        ident = self._ident(request)
+        if ident is None:
+            return Response({"error": "Pass ?user=<id> or ?ip=<address>"}, status=400)
+        now = time.time()
+        results = []
+        for scope, rate in self._scopes(request).items():
+            state = bucket(scope, ident)
+            tokens = state.tokens(now)
+            results.append({
+                "scope": scope,
+                "rate": rate,
+                "capacity": state.capacity,
+                "tokens": round(tokens, 2),
+                "full_in": round((state.capacity - tokens) * state.interval, 2),
+            })
+        return Response({"ident": ident, "buckets": results})
+
+    def delete(self, request):
+        ident = self._ident(request)
+        if ident is None:
+            return Response({"error": "Pass ?user=<id> or ?ip=<address>"}, status=400)
+        for scope in self._scopes(request):
+            bucket(scope, ident).reset()
+        return Response(status=204)
+
+
+_schema_checked = False
+
+
+def _ensure_schema():
+    """
+    DEBUG only: regenerate once per process if the URLconf changed since the
+    last build. Production runs `manage.py generate_schema` at deploy time.
+    """
+    global _schema_checked
+    if _schema_checked:
+        return
+    _schema_checked = True
+    if settings.DEBUG and apps.is_installed("drf_yasg") and schema.generate():
+        logger.info("OpenAPI schema regenerated (URLconf changed)")
+
+
+def _schema_etag(request, fmt):
+    _ensure_schema()
+    entry = schema.artifact(fmt)
+    return entry[1] if entry else None
+
+
+@require_safe
+@condition(etag_func=_schema_etag)
+def openapi_schema_view(request, fmt):
+    entry = schema.artifact(fmt)
+    if entry is None:
+        return JsonResponse({"error": "Schema not generated. Run `manage.py generate_schema`."}, status=503)
+    response = HttpResponse(entry[0], content_type=schema.FORMATS[fmt])
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'OPENAPI_SCHEMA_MAX_AGE', 3600)}"
+    return response
@@ -0,0 +1,111 @@
+# backend/hallcore/dedupe.py
+"""
+Fuzzy duplicate detection for hall applications.
+
+Each application stores three normalized lookup keys (indexed columns):
+  email_key     lowercased address; gmail dots and +tags removed
+  mobile_key    last 10 digits of the phone number
+  identity_key  sha1 of (sorted name tokens, dob)
+A new application that shares any key with an existing one is flagged via
+Application.suspected_duplicate_of. Each key is an indexed equality lookup,
+so the check never scans the table.
+"""
+import hashlib
+import re
+
+from django.db.models import Q
+
+_NON_DIGIT = re.compile(r"\D+")
+_NON_WORD = re.compile(r"[^a-z]+")
+
+
+def email_key(email):
+    email = (email or "").strip().lower()
+    local, _, domain = email.partition("@")
+    if not domain:
+        return email
+    local = local.split("+", 1)[0]
+    if domain in ("gmail.com", "googlemail.com"):
+        local, domain = local.replace(".", ""), "gmail.com"
+    return f"{local}@{domain}"
+
+
+def mobile_key(mobile):
+    digits = _NON_DIGIT.sub("", mobile or "")
+    return digits[-10:] if len(digits) >= 6 else ""  # too short to mean anything
+
+
+def identity_key(full_name, dob):
+    tokens = sorted(t for t in _NON_WORD.split((full_name or "").lower()) if t)
+    if not tokens or not dob:
+        return ""
+    raw = " ".join(tokens) + "|" + (dob.isoformat() if hasattr(dob, "isoformat") else str(dob))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def fill_keys(app):
+    app.email_key = email_key(app.email)
+    app.mobile_key = mobile_key(app.mobile)
+    app.identity_key = identity_key(app.full_name, app.dob)
+
+
+KEY_FIELDS = ("email_key", "mobile_key", "identity_key")
+
+
+def suspected_duplicates(app):
+    """
+    Other applications sharing any normalized key with `app` (OR of indexed lookups).
+    """
+    from .models import Application
+
+    q = Q()
+    for field in KEY_FIELDS:
+        value = getattr(app, field)
+        if value:
+            q |= Q(**{field: value})
+    if not q:
+        return Application.objects.none()
+    qs = Application.objects.filter(q)
+    if app.pk:
+        qs = qs.exclude(pk=app.pk)
+    return qs
+
+
+def find_suspected_duplicate(app):
+    """
+    Id of the oldest other application sharing a normalized key, or None.
+    """
+    return suspected_duplicates(app).order_by("pk").values_list("pk", flat=True).first()
+
+
+def find_suspected_duplicates(apps):
+    """
+    Batch version of find_suspected_duplicate for unsaved applications (all
+    keys filled): the oldest existing match per application, in order, from
+    one query instead of one per application.
+    """
+    from .models import Application
+
+    q = Q()
+    for field in KEY_FIELDS:
+        values = {getattr(app, field) for app in apps} - {""}
+        if values:
+            q |= Q(**{f"{field}__in": values})
+    if not q:
+        return [None] * len(apps)
+    oldest = {}
+    for pk, *keys in Application.objects.filter(q).order_by("pk").values_list("pk", *KEY_FIELDS):
+        for field, value in zip(KEY_FIELDS, keys):
+            if value:
+                oldest.setdefault((field, value), pk)
+    return [
+        min((oldest[key] for key in lookup_keys(app) if key in oldest), default=None)
+        for app in apps
+    ]
+
+
+def lookup_keys(app):
+    """
+    The (field, value) pairs of the non-empty normalized keys of `app`.
+    """
+    return [(field, getattr(app, field)) for field in KEY_FIELDS if getattr(app, field)]
@@ -0,0 +1,14 @@
+# backend/hallcore/filters.py
+import django_filters
+
+from .models import ApplicationStatusEvent
+
+
+class StatusHistoryFilter(django_filters.FilterSet):
+    # plain ids: the default ModelChoiceFilter would SELECT the user/application first
+    actor = django_filters.NumberFilter(field_name="actor_id")
+    application = django_filters.NumberFilter(field_name="application_id")
+
+    class Meta:
+        model = ApplicationStatusEvent
+        fields = ["actor", "application"]
@@ -0,0 +1,44 @@
+# backend/hallcore/history.py
+"""
+Application status history (ApplicationStatusEvent).
+
+Callers write events in the same transaction as the status UPDATE: one
+INSERT for a single change, batched INSERTs for bulk changes. Reads page
+with a cursor over the (application, created_at) / (actor, created_at)
+indexes, so they stay flat however large the table grows.
+"""
+from django.utils import timezone
+
+from .models import ApplicationStatusEvent
+
+BATCH_SIZE = 500
+
+
+def _actor_id(user):
+    return user.pk if user is not None and user.is_authenticated else None
+
+
+def record(app, old_status, actor=None):
+    return ApplicationStatusEvent.objects.create(
+        application_id=app.pk,
+        actor_id=_actor_id(actor),
+        from_status=old_status,
+        to_status=app.status,
+    )
+
+
+def record_many(changes, actor=None):
+    """
+    changes: iterable of (application_id, old_status, new_status).
+    """
+    actor_id = _actor_id(actor)
+    now = timezone.now()  # one decision, one timestamp
+    return ApplicationStatusEvent.objects.bulk_create(
+        [
+            ApplicationStatusEvent(
+                application_id=app_id, actor_id=actor_id, from_status=old, to_status=new, created_at=now
+            )
+            for app_id, old, new in changes
+        ],
+        batch_size=BATCH_SIZE,
+    )
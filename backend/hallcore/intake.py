@@ -0,0 +1,265 @@
+# backend/hallcore/intake.py
+"""
+Asynchronous, two-phase application intake.
+
+    POST /api/applications/intake/            -> 202 {"receipt": "...", "status": "received", ...}
+    GET  /api/applications/intake/<receipt>/  -> {"status": "accepted", "application": 123, ...}
+
+Phase 1, in the request: submit() appends the raw payload to the
+ApplicationSubmission staging table. That is one INSERT with no SELECT in
+front of it, and the applicant gets a receipt right away. The first
+submission in each INTAKE_BATCH_DELAY window also schedules a
+`process_intake` job. The schedule marker is a cache.add, so a burst of
+submissions schedules one job, not one per request.
+
+Phase 2, in the job worker (or `manage.py process_intake`): process_batch()
+claims up to INTAKE_BATCH_SIZE rows with a conditional UPDATE, so two
+processors never take the same row. Then it:
+- validates each payload with ApplicationSerializer (same rules as the
+  synchronous create view),
+- rejects reused student_id / payment_slip_no values with the create view's
+  messages: two indexed IN lookups for the whole batch, and the first
+  submission in the batch wins,
+- flags fuzzy duplicates (hallcore.dedupe) with one query per batch,
+- promotes the survivors with one bulk_create, and updates the stats
+  counters and the submissions in the same transaction.
+
+If a synchronous create wins a race for a unique value between the check
+and the INSERT, the batch is retried one row at a time under savepoints,
+and only the conflicting rows are rejected.
+
+Processed submissions stay pollable for INTAKE_RETENTION seconds; prune()
+deletes them after that.
+"""
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.queue import enqueue
+
+from . import dedupe, stats
+from .models import Application, ApplicationSubmission
+from .serializers import UNIQUE_FIELD_ERRORS, ApplicationSerializer, unique_violation_errors
+
+PROCESS_TASK = "hallcore.tasks.process_intake"
+SCHEDULE_KEY = "intake:scheduled"
+UNIQUE_FIELDS = ("student_id", "payment_slip_no")
+
+
+def batch_size():
+    return getattr(settings, "INTAKE_BATCH_SIZE", 500)
+
+
+def submit(payload):
+    """
+    Stage one submission and make sure a processing job is coming.
+    """
+    submission = ApplicationSubmission.objects.create(payload=payload)
+    schedule()
+    return submission
+
+
+def schedule():
+    delay = getattr(settings, "INTAKE_BATCH_DELAY", 2)
+    if delay is None:
+        return  # processed only by `manage.py process_intake --loop`
+    # the marker lives as long as the job's delay: later submissions in the window ride along
+    if cache.add(SCHEDULE_KEY, 1, max(delay, 1)):
+        enqueue(PROCESS_TASK, delay=delay)
+
+
+# -----------------------------
+# Processor side
+# -----------------------------
+def _claimable(now):
+    timeout = getattr(settings, "INTAKE_VISIBILITY_TIMEOUT", 120)
+    stale = now - timedelta(seconds=timeout)
+    return Q(status=ApplicationSubmission.RECEIVED) | Q(
+        status=ApplicationSubmission.PROCESSING, claimed_at__lt=stale
+    )
+
+
+def claim(limit):
+    """
+    Take up to `limit` of the oldest unprocessed submissions. Rows whose
+    processor died are handed out again after INTAKE_VISIBILITY_TIMEOUT.
+    """
+    now = timezone.now()
+    # ids first: MySQL refuses LIMIT inside an IN (subquery)
+    ids = list(
+        ApplicationSubmission.objects.filter(_claimable(now))
+        .order_by("pk")
+        .values_list("pk", flat=True)[:limit]
+    )
+    if not ids:
+        return []
+    token = uuid.uuid4().hex
+    ApplicationSubmission.objects.filter(_claimable(now), pk__in=ids).update(
+        status=ApplicationSubmission.PROCESSING, claimed_by=token, claimed_at=now
+    )
+    return list(ApplicationSubmission.objects.filter(pk__in=ids, claimed_by=token).order_by("pk"))
+
+
+def _reject(submission, errors):
+    submission.status = ApplicationSubmission.REJECTED
+    submission.errors = errors
+
+
+def _validate(submissions):
+    """
+    [(submission, unsaved Application)] for the submissions that pass; the rest are marked rejected.
+    """
+    candidates = []
+    for submission in submissions:
+        serializer = ApplicationSerializer(data=submission.payload)
+        if serializer.is_valid():
+            candidates.append((submission, Application(**serializer.validated_data)))
+        else:
+            _reject(submission, serializer.errors)
+    if not candidates:
+        return []
+
+    taken = {
+        field: set(
+            Application.objects.filter(**{f"{field}__in": {getattr(app, field) for _, app in candidates}})
+            .values_list(field, flat=True)
+        )
+        for field in UNIQUE_FIELDS
+    }
+    accepted = []
+    for submission, app in candidates:
+        errors = {field: [UNIQUE_FIELD_ERRORS[field]] for field in UNIQUE_FIELDS if getattr(app, field) in taken[field]}
+        if errors:
+            _reject(submission, errors)
+            continue
+        for field in UNIQUE_FIELDS:
+            taken[field].add(getattr(app, field))
+        accepted.append((submission, app))
+    return accepted
+
+
+def _flag_duplicates(accepted):
+    """
+    Set suspected_duplicate_of from existing rows; for a match inside the
+    batch, return {index: index of the earlier batch member} to resolve once
+    that one has a pk.
+    """
+    apps = [app for _, app in accepted]
+    for app in apps:
+        dedupe.fill_keys(app)
+    within, seen = {}, {}
+    for i, (app, existing) in enumerate(zip(apps, dedupe.find_suspected_duplicates(apps))):
+        app.suspected_duplicate_of_id = existing
+        keys = dedupe.lookup_keys(app)
+        earlier = min((seen[key] for key in keys if key in seen), default=None)
+        if existing is None and earlier is not None:
+            within[i] = earlier
+        for key in keys:
+            seen.setdefault(key, i)
+    return within
+
+
+def _insert_bulk(apps, within):
+    Application.objects.bulk_create(apps, batch_size=batch_size())
+    missing = [app for app in apps if app.pk is None]
+    if missing:
+        # MySQL doesn't return the ids of a multi-row INSERT
+        ids = dict(
+            Application.objects.filter(student_id__in=[app.student_id for app in missing])
+            .values_list("student_id", "pk")
+        )
+        for app in missing:
+            app.pk = ids[app.student_id]
+    linked = []
+    for i, earlier in within.items():
+        apps[i].suspected_duplicate_of_id = apps[earlier].pk
+        linked.append(apps[i])
+    if linked:
+        Application.objects.bulk_update(linked, ["suspected_duplicate_of"], batch_size=batch_size())
+
+
+def _insert_each(accepted, within):
+    for i, (submission, app) in enumerate(accepted):
+        if i in within:
+            app.suspected_duplicate_of_id = accepted[within[i]][1].pk
+        try:
+            with transaction.atomic():
+                app.save()
+        except IntegrityError as exc:
+            app.pk = None
+            _reject(submission, unique_violation_errors(exc, app))
+
+
+def _promote(submissions, accepted, within, bulk):
+    with transaction.atomic():
+        if bulk:
+            _insert_bulk([app for _, app in accepted], within)
+        else:
+            _insert_each(accepted, within)
+        created = []
+        for submission, app in accepted:
+            if submission.status != ApplicationSubmission.REJECTED:
+                submission.status = ApplicationSubmission.ACCEPTED
+                submission.application_id = app.pk
+                created.append(app)
+        stats.record_created_many(created)
+        _record_outcomes(submissions)
+
+
+def _record_outcomes(submissions):
+    # one plain UPDATE per outcome plus a single-column bulk_update for the per-row
+    # value: a four-column bulk_update builds 4 x batch CASE branches
+    now = timezone.now()
+    for outcome, field in ((ApplicationSubmission.ACCEPTED, "application"), (ApplicationSubmission.REJECTED, "errors")):
+        rows = [submission for submission in submissions if submission.status == outcome]
+        if not rows:
+            continue
+        ApplicationSubmission.objects.filter(pk__in=[row.pk for row in rows]).update(status=outcome, processed_at=now)
+        ApplicationSubmission.objects.bulk_update(rows, [field], batch_size=batch_size())
+    for submission in submissions:
+        submission.processed_at = now
+
+
+def process_batch(limit=None):
+    """
+    Claim, validate, dedupe and promote one batch; returns the number of submissions processed.
+    """
+    submissions = claim(limit or batch_size())
+    if not submissions:
+        return 0
+    accepted = _validate(submissions)
+    within = _flag_duplicates(accepted)
+    try:
+        _promote(submissions, accepted, within, bulk=True)
+    except IntegrityError:
+        # a synchronous create took one of the values after the check; the transaction rolled back
+        for _, app in accepted:
+            app.pk = None
+        _promote(submissions, accepted, within, bulk=False)
+    return len(submissions)
+
+
+def drain(limit=None):
+    """
+    Process batches until the staging table has nothing left to claim.
+    """
+    total = 0
+    while True:
+        processed = process_batch(limit)
+        if not processed:
+            return total
+        total += processed
+
+
+def prune():
+    """
+    Delete processed submissions older than INTAKE_RETENTION; their receipts then return 404.
+    """
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "INTAKE_RETENTION", 7 * 86400))
+    deleted, _ = ApplicationSubmission.objects.filter(processed_at__lt=cutoff).delete()
+    return deleted
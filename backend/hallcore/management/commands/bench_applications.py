@@ -0,0 +1,84 @@
+import datetime
+import time
+
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import Client
+
+from config.benchmark import BenchmarkCommand, measure, positive_int
+from hallcore import dedupe
+from hallcore.models import Application
+
+
+class Command(BenchmarkCommand):
+    help = "Application create path + fuzzy duplicate check against a large table (default 100k rows)."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--rows", type=positive_int, default=100_000)
+
+    def check_options(self, iterations, rows, **options):
+        # the reused-slip request i reuses seeded row i's slip
+        if iterations > rows:
+            raise CommandError(f"--iterations ({iterations}) can't exceed --rows ({rows}).")
+
+    def run_benchmark(self, iterations, rows, **options):
+        start = time.perf_counter()
+        batch = []
+        for i in range(rows):
+            app = Application(
+                full_name=f"Student {i} Rahman", student_id=f"S{i:07d}", department="CSE", session="2024-25",
+                dob=datetime.date(2000, 1, 1) + datetime.timedelta(days=i % 3000), gender="Male",
+                mobile=f"017{i:08d}", email=f"student{i}@example.com", address="Hall road",
+                payment_slip_no=f"P{i:07d}",
+            )
+            dedupe.fill_keys(app)
+            batch.append(app)
+            if len(batch) == 5000:
+                Application.objects.bulk_create(batch)
+                batch = []
+        Application.objects.bulk_create(batch)
+        self.stdout.write(f"seeded {rows:,} applications in {time.perf_counter() - start:.1f}s")
+
+        # matches one seeded row on identity only (same name tokens reordered, same dob)
+        target = min(4242, rows - 1)
+        probe = Application(
+            full_name=f"Rahman {target} Student", email="x@example.com", mobile="0",
+            dob=datetime.date(2000, 1, 1) + datetime.timedelta(days=target % 3000),
+        )
+        dedupe.fill_keys(probe)
+        self.report(measure("fuzzy duplicate lookup", lambda i: dedupe.find_suspected_duplicate(probe), iterations))
+
+        with connection.cursor() as cursor:
+            sql, params = dedupe.suspected_duplicates(probe).values_list("pk").query.sql_with_params()
+            cursor.execute("EXPLAIN " + ("QUERY PLAN " if connection.vendor == "sqlite" else "") + sql, params)
+            self.stdout.write(f"  plan: {cursor.fetchall()}")
+
+        client = Client()
+
+        def create(i):
+            r = client.post(
+                "/api/applications/create/",
+                {
+                    "full_name": f"New Applicant {i}", "student_id": f"N{i:07d}", "department": "EEE",
+                    "session": "2024-25", "dob": "2002-05-05", "gender": "Female", "mobile": f"018{i:08d}",
+                    "email": f"new{i}@example.com", "address": "Hall road", "payment_slip_no": f"NP{i:07d}",
+                },
+                content_type="application/json",
+            )
+            assert r.status_code == 201, r.content
+
+        def create_duplicate_slip(i):
+            r = client.post(
+                "/api/applications/create/",
+                {
+                    "full_name": f"Other {i}", "student_id": f"X{i:07d}", "department": "EEE",
+                    "session": "2024-25", "dob": "2002-05-05", "gender": "Female", "mobile": "0",
+                    "email": f"other{i}@example.com", "address": "Hall road", "payment_slip_no": f"P{i:07d}",
+                },
+                content_type="application/json",
+            )
+            assert r.status_code == 400 and "payment_slip_no" in r.json(), r.content
+
+        self.report(measure("POST applications/create/", create, iterations))
+        self.report(measure("  ... reused slip (400)", create_duplicate_slip, iterations))
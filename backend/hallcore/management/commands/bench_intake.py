@@ -0,0 +1,50 @@
+from django.test import Client
+
+from config.benchmark import BenchmarkCommand, measure, positive_int
+from hallcore import intake
+from hallcore.models import Application, ApplicationSubmission
+
+
+def form(prefix, i):
+    return {
+        "full_name": f"Applicant {prefix} {i}", "student_id": f"{prefix}{i:07d}", "department": "EEE",
+        "session": "2024-25", "dob": "2002-05-05", "gender": "Female", "mobile": f"018{i:08d}",
+        "email": f"{prefix.lower()}{i}@example.com", "address": "Hall road", "payment_slip_no": f"{prefix}P{i:07d}",
+    }
+
+
+class Command(BenchmarkCommand):
+    help = "Synchronous applications/create/ vs. intake submit + batch promotion (hallcore.intake)."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--batch", type=positive_int, default=500, help="Submissions per processed batch.")
+
+    def run_benchmark(self, iterations, batch, **options):
+        client = Client()
+
+        def create(i):
+            r = client.post("/api/applications/create/", form("C", i), content_type="application/json")
+            assert r.status_code == 201, r.content
+
+        def submit(i):
+            r = client.post("/api/applications/intake/", form("I", i), content_type="application/json")
+            assert r.status_code == 202, r.content
+
+        self.report(measure("POST applications/create/", create, iterations))
+        self.report(measure("POST applications/intake/", submit, iterations))
+        intake.drain()
+
+        # every 10th submission reuses a slip: the batch has rejections to record too
+        rows = [ApplicationSubmission(payload=form("B", i)) for i in range(batch * 5)]
+        for i in range(0, len(rows), 10):
+            rows[i].payload["payment_slip_no"] = f"CP{i % iterations:07d}"
+        ApplicationSubmission.objects.bulk_create(rows)
+        before = Application.objects.count()
+        timing = measure(f"process_batch({batch})", lambda i: intake.process_batch(batch), 5)
+        self.report(timing)
+        promoted = Application.objects.count() - before
+        self.stdout.write(
+            f"  promoted {promoted} of {len(rows)} staged "
+            f"({timing.per_call_ms / batch:.3f} ms, {timing.queries / batch:.3f} queries per submission)"
+        )
@@ -0,0 +1,123 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.loader import MigrationLoader
+
+from config.benchmark import positive_int
+
+
+def history_loader(connection):
+    """
+    The migration graph without the squashed migrations: what a database
+    part-way through the originals migrates with. As in Django's own loader,
+    a migration that depends on a squashed one is re-pointed at the last
+    migration it replaces.
+    """
+    loader = MigrationLoader(connection, replace_migrations=False)
+    for key, migration in loader.replacements.items():
+        loader.graph.remove_replacement_node(key, migration.replaces)
+    return loader
+
+
+def schema_snapshot(connection):
+    """
+    {table: (columns, constraints)} as the database reports them. Column order
+    and SQLite's placeholder names for unnamed constraints are left out: they
+    depend on how a table was built, not on what it is.
+    """
+    introspection = connection.introspection
+    snapshot = {}
+    with connection.cursor() as cursor:
+        for table in introspection.table_names(cursor):
+            columns = sorted(
+                ((c.name, str(c.type_code).lower(), c.null_ok, c.default)
+                 for c in introspection.get_table_description(cursor, table)),
+                key=repr,
+            )
+            constraints = sorted(
+                (
+                    (
+                        "" if name.startswith("__unnamed") else name,
+                        tuple(info["columns"] or ()), bool(info["primary_key"]), bool(info["unique"]),
+                        tuple(info["foreign_key"] or ()), bool(info["index"]), bool(info["check"]),
+                    )
+                    for name, info in introspection.get_constraints(cursor, table).items()
+                ),
+                key=repr,
+            )
+            snapshot[table] = (columns, constraints)
+    return snapshot
+
+
+def schema_differences(expected, actual):
+    """
+    Human-readable lines for every table that differs between two snapshots.
+    """
+    lines = []
+    for table in sorted(expected.keys() | actual.keys()):
+        if table not in actual:
+            lines.append(f"{table}: missing")
+        elif table not in expected:
+            lines.append(f"{table}: unexpected")
+        elif expected[table] != actual[table]:
+            for kind, want, got in zip(("columns", "constraints"), expected[table], actual[table]):
+                for item in sorted(set(want) - set(got), key=repr):
+                    lines.append(f"{table}: {kind} lacks {item}")
+                for item in sorted(set(got) - set(want), key=repr):
+                    lines.append(f"{table}: {kind} has extra {item}")
+    return lines
+
+
+class Command(BaseCommand):
+    help = (
+        "Time `migrate` from zero on a throwaway database (the path every fresh test database takes): "
+        "with the squashed migrations, and replaying the full migration history. "
+        "Fails if the two paths leave different schemas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=positive_int, default=3)
+
+    def handle(self, *args, runs, **options):
+        results, schemas = {}, {}
+        for label, squashed in (("squashed", True), ("full history", False)):
+            samples, steps = [], 0
+            for _ in range(runs):
+                elapsed, steps, schemas[label] = self._migrate_from_zero(squashed)
+                samples.append(elapsed)
+            results[label] = statistics.median(samples)
+            self.stdout.write(
+                f"{label:<14} median {results[label] * 1000:8.1f} ms   min {min(samples) * 1000:8.1f} ms"
+                f"   {steps} migrations   ({runs} runs, {connection.vendor})"
+            )
+        differences = schema_differences(schemas["full history"], schemas["squashed"])
+        if differences:
+            raise CommandError(
+                "The squashed migrations build a different schema than the full history:\n"
+                + "\n".join(differences)
+            )
+        self.stdout.write(f"same schema both ways ({len(schemas['squashed'])} tables)")
+        self.stdout.write(self.style.SUCCESS(
+            f"squashed saves {(1 - results['squashed'] / results['full history']):.0%} of migrate time"
+        ))
+
+    def _migrate_from_zero(self, squashed):
+        creation = connection.creation
+        old_name = connection.settings_dict["NAME"]
+        test_name = creation._create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+        connection.close()
+        connection.settings_dict["NAME"] = test_name
+        try:
+            executor = MigrationExecutor(connection)
+            if not squashed:
+                executor.loader = history_loader(connection)
+            targets = executor.loader.graph.leaf_nodes()
+            plan = executor.migration_plan(targets, clean_start=True)
+            start = time.perf_counter()
+            executor.migrate(targets, plan=plan)
+            return time.perf_counter() - start, len(plan), schema_snapshot(connection)
+        finally:
+            creation.destroy_test_db(old_name, verbosity=0)
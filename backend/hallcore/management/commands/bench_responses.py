@@ -0,0 +1,83 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from config.benchmark import positive_int
+from config.middleware import _available_codecs
+from config.renderers import FastJSONRenderer, orjson
+from hallcore.models import Application
+from hallcore.serializers import ApplicationSerializer
+from notices.models import Notice
+from notices.serializers import NoticeSerializer
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Command(BaseCommand):
+    help = "Measure JSON render time and compressed size of typical list payloads (no DB needed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=positive_int, default=500)
+        parser.add_argument("--repeat", type=positive_int, default=20)
+
+    def handle(self, *args, **opts):
+        rows, repeat = opts["rows"], opts["repeat"]
+        now = timezone.now()
+
+        notices = [
+            Notice(
+                id=i, title=f"Notice {i}: water supply schedule",
+                body="Dear residents, the water supply will be interrupted on floor 3. " * 12,
+                category="Maintenance", author="Provost Office", pinned=i % 10 == 0,
+                created_at=now, updated_at=now,
+            )
+            for i in range(rows)
+        ]
+        applications = [
+            Application(
+                id=i, full_name=f"Student {i}", student_id=f"{190000 + i}", department="CSE",
+                session="2019-20", dob=datetime.date(2001, 1, 1), gender="Male",
+                mobile="01700000000", email=f"student{i}@example.com",
+                address="Village, Post Office, Upazila, District, Bangladesh", payment_slip_no=f"SLIP-{i}",
+                status="Pending", created_at=now,
+            )
+            for i in range(rows)
+        ]
+        payloads = {
+            "notices": NoticeSerializer(notices, many=True).data,
+            "applications": ApplicationSerializer(applications, many=True).data,
+        }
+
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        codecs = _available_codecs()
+        if orjson is None:
+            self.stdout.write("orjson not installed: FastJSONRenderer falls back to stock json")
+
+        for name, data in payloads.items():
+            body = stock.render(data)
+            assert fast.render(data) == body, "FastJSONRenderer output differs from JSONRenderer"
+            t_stock = _best_of(lambda: stock.render(data), repeat)
+            t_fast = _best_of(lambda: fast.render(data), repeat)
+
+            self.stdout.write(f"\n{name}: {rows} rows, {len(body):,} bytes raw")
+            self.stdout.write(
+                f"  render   stock {t_stock * 1000:7.2f} ms   fast {t_fast * 1000:7.2f} ms"
+                f"   ({(1 - t_fast / t_stock) * 100:5.1f}% CPU saved)"
+            )
+            for codec in codecs.values():
+                out = codec.compress(body)
+                t = _best_of(lambda: codec.compress(body), repeat)
+                self.stdout.write(
+                    f"  {codec.name:<5}    {len(out):>9,} bytes ({(1 - len(out) / len(body)) * 100:5.1f}% saved)"
+                    f"   {t * 1000:7.2f} ms"
+                )
@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from config.benchmark import BenchmarkCommand, measure, positive_int
+from config.pagination import max_page_size
+from notices.models import Notice
+from notices.serializers import NoticeSerializer
+from users.models import Student, User
+from users.serializers import StudentSerializer
+from users.services import issue_tokens
+
+
+class Command(BenchmarkCommand):
+    help = (
+        "Serializer field construction per request on the profile and notice paths, with "
+        "SERIALIZER_FIELD_CACHE on and off: bare serializer work, then full requests."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--notices", type=positive_int, default=50, help="Notices per list page.")
+
+    def check_options(self, notices, **options):
+        # a larger ?page_size= is clamped, and the request case would render fewer rows than the label says
+        if notices > max_page_size():
+            raise CommandError(f"--notices ({notices}) can't exceed PAGINATION_MAX_PAGE_SIZE ({max_page_size()}).")
+
+    def run_benchmark(self, iterations, notices, **options):
+        user = User.objects.create(email="student@example.com", username="student@example.com", full_name="Student")
+        student = Student.objects.create(
+            user=user, student_id="S0000001", department="CSE", session="2024-25", room_no=101,
+            gender="Male", blood_group="O+", mobile_number="01700000000", address="Hall road",
+        )
+        Notice.objects.bulk_create([Notice(title=f"Notice {i}", body="Water supply schedule. " * 20) for i in range(notices)])
+        page = list(Notice.objects.all()[:notices])
+        access, _ = issue_tokens(user)
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        def profile_update(i):
+            serializer = StudentSerializer(student, data={"room_no": 101 + i % 2, "address": f"Hall road {i}"}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            return serializer.data
+
+        cases = [
+            ("student: validate + data", profile_update),
+            ("student: data", lambda i: StudentSerializer(student).data),
+            (f"notices: {notices} rows", lambda i: NoticeSerializer(page, many=True).data),
+            ("PATCH profile/update", lambda i: client.patch(
+                "/api/users/auth/profile/update/", {"address": f"Hall road {i}"}, content_type="application/json",
+            )),
+            ("GET notices ?page=1", lambda i: client.get(f"/api/notices/?page=1&page_size={notices}")),
+        ]
+        client.get("/api/notices/?page=1")  # warm-up: revocation list, URL resolver
+        for label, fn in cases:
+            timings = {}
+            for enabled in (False, True):
+                with override_settings(SERIALIZER_FIELD_CACHE=enabled):
+                    fn(0)
+                    cpu = time.process_time()
+                    timings[enabled] = measure(f"{label} ({'cached' if enabled else 'rebuilt'})", fn, iterations)
+                    timings[enabled].cpu_ms = (time.process_time() - cpu) / iterations * 1000
+                    self.report(timings[enabled])
+            saved = timings[False].cpu_ms - timings[True].cpu_ms
+            self.stdout.write(self.style.SUCCESS(
+                f"  CPU per call {timings[False].cpu_ms:.3f} -> {timings[True].cpu_ms:.3f} ms "
+                f"({saved:.3f} ms, {saved / timings[False].cpu_ms:.0%} saved)"
+            ))
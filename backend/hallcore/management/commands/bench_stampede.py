@@ -0,0 +1,102 @@
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from config.benchmark import positive_float, positive_int
+from config.cache import get_or_compute
+
+BENCH_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bench-stampede"}
+}
+
+
+def naive_get_or_compute(key, compute, ttl):
+    # what the views did before config.cache: get, miss, everyone recomputes
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, ttl)
+    return value
+
+
+class Command(BaseCommand):
+    help = (
+        "Concurrent readers on a few hot keys with a slow recompute: naive get/set vs "
+        "config.cache.get_or_compute. Reports recomputes per key per TTL window and the "
+        "most recomputes of one key that ever ran at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=positive_int, default=32)
+        parser.add_argument("--keys", type=positive_int, default=4)
+        parser.add_argument("--ttl", type=positive_float, default=2, help="Seconds.")
+        parser.add_argument("--compute-ms", type=positive_float, default=50, help="Duration of one recompute.")
+        parser.add_argument("--duration", type=positive_float, default=10, help="Seconds per strategy.")
+
+    def handle(self, *args, threads, keys, ttl, compute_ms, duration, **options):
+        windows = max(duration / ttl, 1)
+        # whole-second cache timeouts would otherwise round the TTL away
+        with override_settings(CACHES=BENCH_CACHES, CACHE_STALE_GRACE=ttl * 4, CACHE_LOCK_TIMEOUT=5):
+            for label, strategy in (("naive get/set", naive_get_or_compute), ("get_or_compute", get_or_compute)):
+                cache.clear()
+                result = self._run(strategy, threads, keys, ttl, compute_ms / 1000, duration)
+                per_window = result["computes"] / (keys * windows)
+                self.stdout.write(
+                    f"{label:<16} recomputes/key/window {per_window:6.2f}   max concurrent/key {result['peak']:3d}"
+                    f"   reads {result['reads']:8d}   read median {result['median_ms']:7.3f} ms"
+                    f"   p99 {result['p99_ms']:7.3f} ms"
+                )
+                if strategy is get_or_compute and result["peak"] > 1:
+                    raise CommandError(f"get_or_compute ran {result['peak']} recomputes of one key at once")
+
+    def _run(self, strategy, threads, keys, ttl, compute_s, duration):
+        lock = threading.Lock()
+        computes = Counter()
+        running = Counter()
+        peak = [0]
+        latencies = [[] for _ in range(threads)]
+
+        def compute_for(key):
+            def compute():
+                with lock:
+                    computes[key] += 1
+                    running[key] += 1
+                    peak[0] = max(peak[0], running[key])
+                time.sleep(compute_s)
+                with lock:
+                    running[key] -= 1
+                return {"key": key, "at": time.time()}
+            return compute
+
+        key_names = [f"bench:{i}" for i in range(keys)]
+        stop = time.monotonic() + duration
+
+        def reader(n):
+            rng = random.Random(n)
+            samples = latencies[n]
+            while time.monotonic() < stop:
+                key = rng.choice(key_names)
+                start = time.perf_counter()
+                strategy(key, compute_for(key), ttl)
+                samples.append(time.perf_counter() - start)
+
+        workers = [threading.Thread(target=reader, args=(n,)) for n in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        samples = sorted(s for per_thread in latencies for s in per_thread)
+        return {
+            "computes": sum(computes.values()),
+            "peak": peak[0],
+            "reads": len(samples),
+            "median_ms": statistics.median(samples) * 1000,
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+        }
@@ -0,0 +1,98 @@
+import datetime
+import time
+
+from django.test import Client
+from django.utils import timezone
+
+from config.benchmark import BenchmarkCommand, measure, positive_int
+from hallcore import dedupe
+from hallcore.models import Application, ApplicationStatusEvent
+from users.models import User
+from users.services import issue_tokens
+
+ACTORS = 20
+
+
+class Command(BenchmarkCommand):
+    help = "Status history reads and bulk status writes against a large event table (default 1M events)."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--events", type=positive_int, default=1_000_000)
+        parser.add_argument("--applications", type=positive_int, default=50_000)
+        parser.add_argument("--bulk-size", type=positive_int, default=100, help="ids per bulk status request.")
+
+    def run_benchmark(self, iterations, events, applications, bulk_size, **options):
+        start = time.perf_counter()
+        apps = []
+        for i in range(applications):
+            app = Application(
+                full_name=f"Student {i}", student_id=f"S{i:07d}", department="CSE", session="2024-25",
+                dob=datetime.date(2000, 1, 1), gender="Male", mobile=f"017{i:08d}",
+                email=f"student{i}@example.com", address="Hall road", payment_slip_no=f"P{i:07d}",
+            )
+            dedupe.fill_keys(app)
+            apps.append(app)
+        Application.objects.bulk_create(apps, batch_size=5000)
+        app_ids = list(Application.objects.order_by("pk").values_list("pk", flat=True))
+
+        admin = User.objects.create(email="admin@example.com", username="admin@example.com", role="admin", is_staff=True)
+        actors = [admin.pk] + [
+            u.pk for u in User.objects.bulk_create(
+                [User(email=f"warden{i}@example.com", username=f"warden{i}@example.com") for i in range(ACTORS - 1)]
+            )
+        ]
+
+        base = timezone.now() - datetime.timedelta(days=365)
+        for offset in range(0, events, 10_000):
+            batch = [
+                ApplicationStatusEvent(
+                    application_id=app_ids[i % len(app_ids)], actor_id=actors[i % ACTORS],
+                    from_status="Pending", to_status="Approved" if i % 3 else "Rejected",
+                    created_at=base + datetime.timedelta(seconds=i * 30),
+                )
+                for i in range(offset, min(offset + 10_000, events))
+            ]
+            ApplicationStatusEvent.objects.bulk_create(batch)
+        self.stdout.write(f"seeded {events:,} events in {time.perf_counter() - start:.1f}s")
+
+        access, _ = issue_tokens(admin)
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {access}")
+        client.get("/api/applications/history/")  # warm-up: loads the revocation list once
+
+        def get(url):
+            def call(i):
+                r = client.get(url(i))
+                assert r.status_code == 200, r.content
+            return call
+
+        self.report(measure("one application's history", get(lambda i: f"/api/applications/{app_ids[i * 7 % len(app_ids)]}/history/"), iterations))
+        self.report(measure("one actor, first page", get(lambda i: f"/api/applications/history/?actor={actors[i % ACTORS]}"), iterations))
+        self.report(measure("unfiltered, first page", get(lambda i: "/api/applications/history/"), iterations))
+
+        # follow the cursor up to page 21; small --events seeds may run out of pages earlier
+        deep, page = "/api/applications/history/?actor=%d" % admin.pk, 1
+        while page < 21:
+            r = client.get(deep)
+            assert r.status_code == 200, r.content
+            if not r.json()["next"]:
+                break
+            deep, page = r.json()["next"], page + 1
+        if page > 1:
+            self.report(measure(f"one actor, page {page} (cursor)", get(lambda i: deep), iterations))
+        else:
+            self.stdout.write("one actor, deep page: skipped (a single page of events per actor)")
+
+        bulk_size = min(bulk_size, len(app_ids))
+        pending = iter(range(0, len(app_ids) - bulk_size + 1, bulk_size))
+
+        def bulk(i):
+            first = next(pending)
+            r = client.post(
+                "/api/applications/status/bulk/",
+                {"status": "Approved", "ids": app_ids[first:first + bulk_size]},
+                content_type="application/json",
+            )
+            assert r.status_code == 200 and len(r.json()["updated"]) == bulk_size, r.content
+
+        self.report(measure(f"bulk status ({bulk_size} ids)", bulk, min(iterations, len(app_ids) // bulk_size)))
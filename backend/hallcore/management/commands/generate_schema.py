@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from config import schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-generate the OpenAPI schema (json + yaml) served at /api/schema.<fmt>. "
+        "Skipped when the URLconf fingerprint is unchanged; run at build/deploy time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Regenerate even if the URLconf is unchanged.")
+        parser.add_argument("--check", action="store_true", help="Exit 1 if the schema is missing or stale.")
+
+    def handle(self, *args, force, check, **options):
+        if check:
+            if not schema.is_current():
+                raise CommandError("OpenAPI schema is missing or stale; run `manage.py generate_schema`.")
+            self.stdout.write(self.style.SUCCESS("OpenAPI schema is current."))
+            return
+        if not apps.is_installed("drf_yasg"):
+            raise CommandError("drf_yasg is not installed (API-only mode?); generate the schema from a full build.")
+
+        if schema.generate(force=force):
+            self.stdout.write(self.style.SUCCESS(f"Wrote OpenAPI schema to {schema.schema_dir()}"))
+        else:
+            self.stdout.write("OpenAPI schema is up to date (URLconf unchanged).")
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.benchmark import positive_float, positive_int
+from config.loadtest import PROFILES, LoadTest
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay semester-start traffic (register, login, profile + photo upload, notice polling, "
+        "applications) against a running server and report throughput, error rate and latency "
+        "percentiles per endpoint. --serve starts a local dev server on the SQLite stand-in (HALL_SQLITE=1)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--serve", action="store_true",
+            help="Migrate the HALL_SQLITE databases and run `runserver` on a free port for the duration.",
+        )
+        parser.add_argument("--profile", choices=sorted(PROFILES), default="semester-start")
+        parser.add_argument("--users", type=positive_int, default=200, help="Virtual users in total.")
+        parser.add_argument("--ramp", type=float, default=30.0, help="Seconds over which users arrive.")
+        parser.add_argument("--concurrency", type=positive_int, default=100, help="Virtual users active at once.")
+        parser.add_argument("--polls", type=int, default=3, help="Notice polls per virtual user.")
+        parser.add_argument("--think", type=float, default=1.0, help="Mean think time between steps (s).")
+        parser.add_argument("--photo-kb", type=positive_int, default=200, help="Size of the uploaded profile photo.")
+        parser.add_argument("--timeout", type=positive_float, default=30.0, help="Per-request timeout (s).")
+        parser.add_argument(
+            "--single-ip", action="store_true",
+            help="Don't vary X-Forwarded-For: all users share one throttle identity.",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument("--json", action="store_true", dest="as_json", help="Machine-readable output.")
+
+    def handle(self, *args, base_url, serve, as_json, **options):
+        server = None
+        if serve:
+            base_url, server = self._serve()
+        try:
+            test = LoadTest(
+                base_url, profile=options["profile"], users=options["users"], ramp=options["ramp"],
+                concurrency=options["concurrency"], polls=options["polls"], think=options["think"],
+                photo_kb=options["photo_kb"], timeout=options["timeout"],
+                spread_ips=not options["single_ip"], seed=options["seed"],
+            )
+            result = asyncio.run(test.run())
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+        if as_json:
+            self.stdout.write(json.dumps(result, indent=2))
+            return
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{options['profile']}: {options['users']} users over {options['ramp']:g}s against {base_url}"
+        ))
+        self.stdout.write(
+            f"  {'step':<18}{'requests':>9}{'req/s':>9}{'errors':>8}{'p50 ms':>9}{'p90 ms':>9}"
+            f"{'p99 ms':>9}{'max ms':>9}   statuses"
+        )
+        for step, row in result["steps"].items():
+            statuses = " ".join(f"{code}:{n}" for code, n in row["statuses"].items())
+            self.stdout.write(
+                f"  {step:<18}{row['requests']:>9}{row['per_second']:>9.1f}{row['error_rate']:>8.1%}"
+                f"{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}   {statuses}"
+            )
+        style = self.style.SUCCESS if result["error_rate"] < 0.01 else self.style.WARNING
+        self.stdout.write(style(
+            f"  total {result['requests']} requests in {result['elapsed_s']:.1f}s = {result['per_second']:.1f} req/s, "
+            f"errors {result['error_rate']:.1%}, p50 {result['p50_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms"
+        ))
+
+    def _serve(self):
+        # one trusted proxy hop, so the per-user X-Forwarded-For is the throttle identity
+        env = {**os.environ, "HALL_SQLITE": "1", "HALL_NUM_PROXIES": "1"}
+        env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+        manage = [sys.executable, str(settings.BASE_DIR / "manage.py")]
+        for step in (["migrate", "-v0"], ["sync_sqlite_replica"]):
+            proc = subprocess.run(manage + step, env=env, cwd=settings.BASE_DIR, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise CommandError(f"{' '.join(step)} failed:\n{proc.stderr[-2000:]}")
+
+        port = _free_port()
+        server = subprocess.Popen(
+            manage + ["runserver", f"127.0.0.1:{port}", "--noreload"],
+            env=env, cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(f"{base_url}/api/users/test/", timeout=1)
+                return base_url, server
+            except OSError:
+                if server.poll() is not None:
+                    raise CommandError("runserver exited during startup")
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError("runserver did not come up within 30s")
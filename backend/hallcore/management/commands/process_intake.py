@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from config.benchmark import positive_float, positive_int
+from hallcore import intake
+
+
+class Command(BaseCommand):
+    help = (
+        "Promote staged intake submissions into applications (hallcore.intake). "
+        "The job worker does this on its own; use --loop for a dedicated processor."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=positive_int, default=None, help="Submissions per batch (INTAKE_BATCH_SIZE).")
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting once drained.")
+        parser.add_argument("--poll-interval", type=positive_float, default=1.0, help="Seconds to sleep when idle (--loop).")
+
+    def handle(self, *args, **opts):
+        total, pruned, next_prune = 0, 0, 0.0
+        while True:
+            close_old_connections()
+            if time.monotonic() >= next_prune:
+                pruned += intake.prune()
+                next_prune = time.monotonic() + 3600
+            start = time.perf_counter()
+            processed = intake.drain(opts["batch"])
+            if processed:
+                total += processed
+                self.stdout.write(f"processed {processed} submissions in {time.perf_counter() - start:.2f}s")
+            if not opts["loop"]:
+                break
+            if not processed:
+                time.sleep(opts["poll_interval"])
+        self.stdout.write(self.style.SUCCESS(f"processed {total} submissions, pruned {pruned} old receipts"))
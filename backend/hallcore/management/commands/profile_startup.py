@@ -0,0 +1,125 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.benchmark import positive_int
+
+# Runs in a fresh interpreter: django.setup(), build the WSGI app, serve one request
+PROBE = r"""
+import json, sys, time
+from io import BytesIO
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+app = get_wsgi_application()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "SERVER_NAME": "localhost", "SERVER_PORT": "80",
+    "HTTP_HOST": "localhost", "wsgi.input": BytesIO(), "wsgi.url_scheme": "http",
+}
+status = []
+b"".join(app(environ, lambda s, h: status.append(s)))
+done = time.perf_counter()
+print(json.dumps({"status": status[0], "setup": setup_done - start, "first_request": done - start}))
+"""
+
+PROJECT_PACKAGES = ("config", "hallcore", "users", "notices", "jobs", "notifications")
+
+
+def parse_importtime(stderr):
+    """
+    `python -X importtime` output -> {module: self time in microseconds}.
+    """
+    costs = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        costs[name.strip()] = int(self_us)
+    return costs
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile process startup: per-package import cost (python -X importtime) and time to "
+        "first request, for the full and the API-only (HALL_API_ONLY=1) profile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=positive_int, default=5, help="Fresh interpreters per profile.")
+        parser.add_argument("--top", type=positive_int, default=15, help="Packages / project modules to list.")
+        parser.add_argument("--path", default="/api/users/test/", help="URL of the first request.")
+        parser.add_argument("--profile", choices=["full", "api", "both"], default="both")
+        parser.add_argument("--json", action="store_true", dest="as_json", help="Machine-readable output.")
+
+    def handle(self, *args, runs, top, path, profile, as_json, **options):
+        profiles = {"full": "0", "api": "1"}
+        if profile != "both":
+            profiles = {profile: profiles[profile]}
+
+        # interleaved, so drift in machine load hits both profiles alike
+        samples = {name: [] for name in profiles}
+        for _ in range(runs):
+            for name, flag in profiles.items():
+                samples[name].append(self._probe(flag, path))
+        results = {name: self._summarize(runs) for name, runs in samples.items()}
+        if as_json:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for name, result in results.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name} profile (HALL_API_ONLY={profiles[name]})"))
+            self.stdout.write(
+                f"  django.setup() {result['setup_ms']:7.1f} ms   first request {result['first_request_ms']:7.1f} ms"
+                f"   {result['status']}   modules imported {result['modules']}   (median of {runs})"
+            )
+            self.stdout.write("  import cost by top-level package (self time):")
+            for package, ms in result["packages"][:top]:
+                self.stdout.write(f"    {ms:8.1f} ms  {package}")
+            self.stdout.write("  project modules:")
+            for module, ms in result["project"][:top]:
+                self.stdout.write(f"    {ms:8.1f} ms  {module}")
+
+        if len(results) == 2:
+            saved = results["full"]["first_request_ms"] - results["api"]["first_request_ms"]
+            self.stdout.write(self.style.SUCCESS(
+                f"API-only saves {saved:.1f} ms to first request "
+                f"({saved / results['full']['first_request_ms']:.0%})"
+            ))
+
+    def _probe(self, api_only, path):
+        env = {**os.environ, "HALL_API_ONLY": api_only}
+        env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(settings.BASE_DIR), env.get("PYTHONPATH")]))
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE, path],
+            env=env, cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise CommandError(f"startup probe failed:\n{proc.stderr[-2000:]}")
+        return json.loads(proc.stdout.strip().splitlines()[-1]), parse_importtime(proc.stderr)
+
+    def _summarize(self, runs):
+        timings = [timing for timing, _ in runs]
+        imports = [costs for _, costs in runs]
+        # per-module median across runs, then grouped
+        modules = {name: statistics.median(run.get(name, 0) for run in imports) for name in imports[0]}
+        packages = Counter()
+        for name, us in modules.items():
+            packages[name.split(".")[0]] += us
+        project = Counter({name: us for name, us in modules.items() if name.split(".")[0] in PROJECT_PACKAGES})
+        return {
+            "status": timings[0]["status"],
+            "setup_ms": statistics.median(t["setup"] for t in timings) * 1000,
+            "first_request_ms": statistics.median(t["first_request"] for t in timings) * 1000,
+            "modules": len(modules),
+            "packages": [(name, us / 1000) for name, us in packages.most_common()],
+            "project": [(name, us / 1000) for name, us in project.most_common()],
+        }
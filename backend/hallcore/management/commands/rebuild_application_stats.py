@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from hallcore import stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the ApplicationStats dashboard counters from the Application table."
+
+    def handle(self, *args, **options):
+        stats.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt application stats: {stats.summary()['by_status']}"))
@@ -0,0 +1,74 @@
+import json
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.benchmark import positive_int
+from config.querylog import read_entries
+
+
+class Command(BaseCommand):
+    help = (
+        "Top slow queries from the SLOW_QUERY_LOG file (config.querylog), grouped by normalized SQL "
+        "and ordered by total time, with the views that ran them, a stack and the EXPLAIN output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--log", default=None, help="Log file (default: settings.SLOW_QUERY_LOG).")
+        parser.add_argument("--top", type=positive_int, default=10, help="Number of query shapes to list.")
+        parser.add_argument("--view", default=None, help="Only queries from views containing this text.")
+        parser.add_argument("--no-explain", action="store_true", help="Leave out EXPLAIN output.")
+        parser.add_argument("--json", action="store_true", dest="as_json", help="Machine-readable output.")
+
+    def handle(self, *args, log, top, view, no_explain, as_json, **options):
+        path = log or getattr(settings, "SLOW_QUERY_LOG", None)
+        if not path:
+            raise CommandError("No log file: pass --log or set HALL_SLOW_QUERY_LOG.")
+        try:
+            groups = self._aggregate(read_entries(path), view)
+        except FileNotFoundError:
+            raise CommandError(f"{path} does not exist (no slow queries logged yet?)")
+
+        ranked = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)[:top]
+        if as_json:
+            self.stdout.write(json.dumps(ranked, indent=2, default=str))
+            return
+        if not ranked:
+            self.stdout.write("No slow queries logged.")
+            return
+        for rank, group in enumerate(ranked, 1):
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"#{rank} {group['fingerprint']}  total {group['total_ms']:.1f} ms  calls {group['calls']}  "
+                f"mean {group['total_ms'] / group['calls']:.1f} ms  max {group['max_ms']:.1f} ms"
+            ))
+            self.stdout.write(f"  {group['sql']}")
+            views = ", ".join(f"{name} ({n})" for name, n in group["views"].most_common(3))
+            self.stdout.write(f"  views: {views}")
+            for frame in group["stack"]:
+                self.stdout.write(f"    at {frame}")
+            if group["explain"] and not no_explain:
+                self.stdout.write("  explain:")
+                for row in group["explain"]:
+                    self.stdout.write(f"    {json.dumps(row, default=str)}")
+
+    @staticmethod
+    def _aggregate(entries, view_filter):
+        groups = {}
+        for entry in entries:
+            view = entry.get("view") or entry.get("path") or "?"
+            if view_filter and view_filter not in view:
+                continue
+            group = groups.setdefault(entry["fingerprint"], {
+                "fingerprint": entry["fingerprint"], "sql": entry["sql"], "calls": 0, "total_ms": 0.0,
+                "max_ms": 0.0, "views": Counter(), "stack": [], "explain": None,
+            })
+            group["calls"] += 1
+            group["total_ms"] += entry["ms"]
+            group["views"][view] += 1
+            if entry["ms"] >= group["max_ms"]:
+                group["max_ms"] = entry["ms"]
+                group["stack"] = entry.get("stack", [])
+            if entry.get("explain"):
+                group["explain"] = entry["explain"]
+        return groups
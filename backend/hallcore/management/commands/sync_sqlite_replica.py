@@ -0,0 +1,31 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the SQLite primary onto the SQLite replica(s) (HALL_SQLITE=1 setups). "
+        "Stands in for replication when testing replica routing locally."
+    )
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES["default"]
+        if primary["ENGINE"] != "django.db.backends.sqlite3":
+            raise CommandError("sync_sqlite_replica only works with a SQLite primary (set HALL_SQLITE=1).")
+
+        for alias in settings.DATABASE_REPLICAS:
+            replica = settings.DATABASES[alias]
+            if replica["ENGINE"] != "django.db.backends.sqlite3":
+                raise CommandError(f"Replica '{alias}' is not a SQLite database.")
+            connections[alias].close()
+            src = sqlite3.connect(str(primary["NAME"]))
+            dst = sqlite3.connect(str(replica["NAME"]))
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+                src.close()
+            self.stdout.write(self.style.SUCCESS(f"Synced {alias} <- default"))
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from config.cache import invalidate
+from notices.views import LIST_CACHE_KEY, cached_notice_list
+from users import services
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the read-through cache (config.cache) for the hot GET endpoints: the notice list and "
+        "the profiles of the most recently active users. Run after a deploy or a cache flush."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", type=int, default=500, help="Most recently logged-in users to warm (0 = none).")
+        parser.add_argument("--refresh", action="store_true", help="Recompute entries that are already cached.")
+
+    def handle(self, *args, profiles, refresh, **options):
+        start = time.perf_counter()
+        if refresh:
+            invalidate(LIST_CACHE_KEY)
+        notices = cached_notice_list()
+
+        user_ids = []
+        if profiles > 0:
+            user_ids = list(
+                User.objects.filter(is_active=True)
+                .order_by("-last_login", "-pk")
+                .values_list("pk", flat=True)[:profiles]
+            )
+        if refresh and user_ids:
+            invalidate(*(services.profile_cache_key(pk) for pk in user_ids))
+        for pk in user_ids:
+            services.cached_profile(pk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed notice list ({len(notices)} notices) and {len(user_ids)} profiles "
+            f"in {time.perf_counter() - start:.2f}s"
+        ))
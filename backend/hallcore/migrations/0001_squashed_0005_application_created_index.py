@@ -0,0 +1,78 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    replaces = [
+        ('hallcore', '0001_initial'),
+        ('hallcore', '0002_applicationstats'),
+        ('hallcore', '0003_application_dedupe_keys'),
+        ('hallcore', '0004_application_status_history'),
+        ('hallcore', '0005_application_created_index'),
+    ]
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Application',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('full_name', models.CharField(max_length=150)),
+                ('student_id', models.CharField(max_length=50, unique=True)),
+                ('department', models.CharField(max_length=100)),
+                ('session', models.CharField(max_length=50)),
+                ('dob', models.DateField()),
+                ('gender', models.CharField(choices=[('Male', 'Male'), ('Female', 'Female'), ('Other', 'Other')], max_length=10)),
+                ('mobile', models.CharField(max_length=20)),
+                ('email', models.EmailField(max_length=254)),
+                ('address', models.TextField()),
+                ('payment_slip_no', models.CharField(max_length=100, unique=True)),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Approved', 'Approved'), ('Rejected', 'Rejected')], default='Pending', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('email_key', models.CharField(blank=True, db_index=True, max_length=254)),
+                ('mobile_key', models.CharField(blank=True, db_index=True, max_length=20)),
+                ('identity_key', models.CharField(blank=True, db_index=True, max_length=40)),
+                ('suspected_duplicate_of', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='hallcore.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['created_at'], name='hallcore_app_created_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100)),
+                ('session', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('department', 'session', 'status')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(max_length=20)),
+                ('to_status', models.CharField(max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('application', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='status_events', to='hallcore.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['application', 'created_at'], name='hallcore_event_app_time_idx'), models.Index(fields=['actor', 'created_at'], name='hallcore_event_actor_time_idx'), models.Index(fields=['created_at'], name='hallcore_event_time_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:25
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_stats(apps, schema_editor):
+    Application = apps.get_model("hallcore", "Application")
+    ApplicationStats = apps.get_model("hallcore", "ApplicationStats")
+    rows = Application.objects.values("department", "session", "status").annotate(n=Count("id")).order_by()
+    ApplicationStats.objects.bulk_create(
+        [ApplicationStats(department=r["department"], session=r["session"], status=r["status"], count=r["n"]) for r in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hallcore', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100)),
+                ('session', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('department', 'session', 'status')},
+            },
+        ),
+        migrations.RunPython(build_stats, migrations.RunPython.noop),
+    ]
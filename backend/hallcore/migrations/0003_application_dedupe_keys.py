@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from hallcore import dedupe
+
+
+def fill_keys(apps, schema_editor):
+    Application = apps.get_model("hallcore", "Application")
+    batch = []
+    for app in Application.objects.only("id", "email", "mobile", "full_name", "dob").iterator(chunk_size=2000):
+        dedupe.fill_keys(app)
+        batch.append(app)
+        if len(batch) >= 2000:
+            Application.objects.bulk_update(batch, ["email_key", "mobile_key", "identity_key"])
+            batch = []
+    if batch:
+        Application.objects.bulk_update(batch, ["email_key", "mobile_key", "identity_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hallcore', '0002_applicationstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='email_key',
+            field=models.CharField(blank=True, db_index=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='identity_key',
+            field=models.CharField(blank=True, db_index=True, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='mobile_key',
+            field=models.CharField(blank=True, db_index=True, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='suspected_duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='hallcore.application'),
+        ),
+        migrations.RunPython(fill_keys, migrations.RunPython.noop),
+    ]
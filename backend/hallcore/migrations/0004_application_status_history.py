@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hallcore', '0003_application_dedupe_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(max_length=20)),
+                ('to_status', models.CharField(max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('application', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='status_events', to='hallcore.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['application', 'created_at'], name='hallcore_event_app_time_idx'), models.Index(fields=['actor', 'created_at'], name='hallcore_event_actor_time_idx'), models.Index(fields=['created_at'], name='hallcore_event_time_idx')],
+            },
+        ),
+    ]
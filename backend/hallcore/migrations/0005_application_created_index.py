@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:56
+
+from django.db import migrations, models
+
+from config.migration_ops import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hallcore', '0004_application_status_history'),
+    ]
+
+    operations = [
+        AddIndexOnline(
+            model_name='application',
+            index=models.Index(fields=['created_at'], name='hallcore_app_created_idx'),
+        ),
+    ]
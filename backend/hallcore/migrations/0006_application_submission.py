@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:02
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hallcore', '0001_squashed_0005_application_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSubmission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('receipt', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('payload', models.JSONField()),
+                ('status', models.CharField(choices=[('received', 'Received'), ('processing', 'Processing'), ('accepted', 'Accepted'), ('rejected', 'Rejected')], default='received', max_length=20)),
+                ('errors', models.JSONField(blank=True, null=True)),
+                ('received_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_by', models.CharField(blank=True, max_length=32)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('processed_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('application', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='hallcore.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'id'], name='hallcore_submission_queue_idx')],
+            },
+        ),
+    ]
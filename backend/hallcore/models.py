@@ -1,5 +1,11 @@
 
+import uuid
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+from . import dedupe
 
 class Application(models.Model):
     GENDER_CHOICES = [
@@ -27,5 +33,115 @@ class Application(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Normalized duplicate-detection keys (see hallcore.dedupe), filled on save
+    email_key = models.CharField(max_length=254, blank=True, db_index=True)
+    mobile_key = models.CharField(max_length=20, blank=True, db_index=True)
+    identity_key = models.CharField(max_length=40, blank=True, db_index=True)
+    suspected_duplicate_of = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="hallcore_app_created_idx"),  # list: newest first
+        ]
+
+    def save(self, *args, **kwargs):
+        dedupe.fill_keys(self)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.full_name} ({self.student_id}) - {self.status}"
+
+# Dashboard counters, kept in step with Application by hallcore.stats
+class ApplicationStats(models.Model):
+    department = models.CharField(max_length=100)
+    session = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("department", "session", "status")
+
+    def __str__(self):
+        return f"{self.department} / {self.session} / {self.status}: {self.count}"
+
+
+class AppendOnlyQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise TypeError("Status history is append-only")
+
+    def delete(self):
+        raise TypeError("Status history is append-only")
+
+
+# Append-only audit trail of Application.status changes (hallcore.history).
+# No DB-level FKs: events outlive deleted applications/users, and inserts
+# don't pay for constraint checks.
+class ApplicationStatusEvent(models.Model):
+    application = models.ForeignKey(
+        Application, on_delete=models.DO_NOTHING, db_constraint=False, related_name="status_events"
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True,
+        on_delete=models.DO_NOTHING, db_constraint=False, related_name="+",
+    )
+    from_status = models.CharField(max_length=20)
+    to_status = models.CharField(max_length=20)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    objects = AppendOnlyQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["application", "created_at"], name="hallcore_event_app_time_idx"),
+            models.Index(fields=["actor", "created_at"], name="hallcore_event_actor_time_idx"),
+            models.Index(fields=["created_at"], name="hallcore_event_time_idx"),  # unfiltered feed
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise TypeError("Status history is append-only")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("Status history is append-only")
+
+    def __str__(self):
+        return f"#{self.application_id}: {self.from_status} -> {self.to_status}"
+
+
+# Staging table for the asynchronous intake endpoint (hallcore.intake). The
+# request only INSERTs the raw payload and hands back `receipt`; the batch
+# processor validates, dedupes and promotes rows into Application.
+class ApplicationSubmission(models.Model):
+    RECEIVED = "received"
+    PROCESSING = "processing"
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+    STATUS_CHOICES = [
+        (RECEIVED, "Received"),
+        (PROCESSING, "Processing"),
+        (ACCEPTED, "Accepted"),
+        (REJECTED, "Rejected"),
+    ]
+
+    receipt = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=RECEIVED)
+    errors = models.JSONField(null=True, blank=True)  # same shape as a 400 from applications/create/
+    application = models.ForeignKey(
+        Application, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    received_at = models.DateTimeField(default=timezone.now)
+    claimed_by = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True, db_index=True)  # pruning
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "id"], name="hallcore_submission_queue_idx"),  # claim, oldest first
+        ]
+
     def __str__(self):
-        return f"{self.full_name} ({self.student_id}) - {self.status}"
\ No newline at end of file
+        return f"{self.receipt} - {self.status}"
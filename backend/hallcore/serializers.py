@@ -1,7 +1,53 @@
 from rest_framework import serializers
-from .models import Application
+from config.fields import SparseFieldsMixin
+from config.serializers import CachedFieldsMixin
+from .models import Application, ApplicationStatusEvent, ApplicationSubmission
 
-class ApplicationSerializer(serializers.ModelSerializer):
+UNIQUE_FIELD_ERRORS = {
+    "payment_slip_no": "An application with this payment slip number already exists.",
+    "student_id": "An application with this student ID already exists.",
+}
+
+
+def unique_violation_errors(exc, app):
+    """
+    Map a unique-constraint IntegrityError from saving `app` to field errors.
+    The rows holding its values are looked up: the error text is backend-specific
+    (MySQL names the key and quotes the value), so it can't be matched reliably.
+    """
+    errors = {
+        field: [text] for field, text in UNIQUE_FIELD_ERRORS.items()
+        if Application.objects.filter(**{field: getattr(app, field)}).exists()
+    }
+    if not errors:
+        raise exc
+    return errors
+
+
+class ApplicationSerializer(SparseFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Application
-        fields = "__all__"
+        exclude = ("email_key", "mobile_key", "identity_key")
+        read_only_fields = ("suspected_duplicate_of",)
+        # Uniqueness is enforced by the DB at INSERT time (see ApplicationCreateView),
+        # not by one UniqueValidator SELECT per field.
+        extra_kwargs = {
+            "student_id": {"validators": []},
+            "payment_slip_no": {"validators": []},
+        }
+
+
+class ApplicationStatusEventSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    actor_email = serializers.EmailField(source="actor.email", read_only=True, default=None)
+
+    class Meta:
+        model = ApplicationStatusEvent
+        fields = ("id", "application", "actor", "actor_email", "from_status", "to_status", "created_at")
+
+
+# Receipt status for the intake endpoint (hallcore.intake); the payload itself is never echoed back
+class ApplicationSubmissionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = ApplicationSubmission
+        fields = ("receipt", "status", "errors", "application", "received_at", "processed_at")
+        read_only_fields = fields
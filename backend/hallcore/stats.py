@@ -0,0 +1,107 @@
+# backend/hallcore/stats.py
+"""
+Incrementally maintained application counters for the admin dashboard.
+
+Every write that creates an Application or changes its status calls one of
+the record_* helpers inside the same transaction, so ApplicationStats never
+drifts from the real table. `manage.py rebuild_application_stats` recomputes
+it from scratch.
+"""
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import Application, ApplicationStats
+
+STATUSES = ("Pending", "Approved", "Rejected")
+
+
+def _bump(department, session, status, delta):
+    key = {"department": department, "session": session, "status": status}
+    if ApplicationStats.objects.filter(**key).update(count=F("count") + delta):
+        return
+    try:
+        with transaction.atomic():
+            ApplicationStats.objects.create(count=delta, **key)
+    except IntegrityError:
+        # another request created the row first
+        ApplicationStats.objects.filter(**key).update(count=F("count") + delta)
+
+
+def record_created(app):
+    _bump(app.department, app.session, app.status, 1)
+
+
+def record_created_many(apps):
+    """
+    Bulk version for bulk_create: one UPDATE per distinct counter row.
+    """
+    deltas = Counter((app.department, app.session, app.status) for app in apps)
+    for (department, session, status), delta in sorted(deltas.items()):
+        _bump(department, session, status, delta)
+
+
+def record_status_change(app, old_status):
+    if old_status == app.status:
+        return
+    _bump(app.department, app.session, old_status, -1)
+    _bump(app.department, app.session, app.status, 1)
+
+
+def record_status_changes(changes):
+    """
+    Bulk version: changes is an iterable of (department, session, old_status, new_status).
+    One UPDATE per distinct counter row instead of two per application.
+    """
+    deltas = Counter()
+    for department, session, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        deltas[(department, session, old_status)] -= 1
+        deltas[(department, session, new_status)] += 1
+    for (department, session, status), delta in sorted(deltas.items()):
+        if delta:
+            _bump(department, session, status, delta)
+
+
+def rebuild():
+    rows = (
+        Application.objects.values("department", "session", "status")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        ApplicationStats.objects.all().delete()
+        ApplicationStats.objects.bulk_create(
+            [
+                ApplicationStats(department=r["department"], session=r["session"], status=r["status"], count=r["n"])
+                for r in rows
+            ],
+            batch_size=500,
+        )
+
+
+def summary():
+    """
+    {"total", "by_status", "by_department", "by_session"} from the counter table.
+    """
+    by_status = {s: 0 for s in STATUSES}
+    by_department = defaultdict(lambda: {s: 0 for s in STATUSES})
+    by_session = defaultdict(lambda: {s: 0 for s in STATUSES})
+
+    for department, session, status, count in ApplicationStats.objects.values_list(
+        "department", "session", "status", "count"
+    ):
+        if not count:
+            continue
+        by_status[status] = by_status.get(status, 0) + count
+        by_department[department][status] = by_department[department].get(status, 0) + count
+        by_session[session][status] = by_session[session].get(status, 0) + count
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "by_department": dict(by_department),
+        "by_session": dict(by_session),
+    }
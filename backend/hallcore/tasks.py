@@ -0,0 +1,17 @@
+# backend/hallcore/tasks.py
+from django.core.cache import cache
+
+from jobs.queue import task
+
+from . import intake
+
+
+@task(max_attempts=5)
+def process_intake():
+    """
+    Promote staged intake submissions (hallcore.intake), batch by batch,
+    until none are left. Scheduled by intake.submit().
+    """
+    intake.drain()
+    if cache.add("intake:pruned", 1, 3600):  # at most hourly
+        intake.prune()
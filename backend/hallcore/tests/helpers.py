@@ -0,0 +1,28 @@
+import datetime
+
+from hallcore.models import Application
+
+FORM = {
+    "department": "CSE", "session": "2024-25", "dob": "2002-01-01", "gender": "Male", "address": "Hall road",
+}
+
+
+def name(i):
+    # dedupe.identity_key ignores digits, so distinct applicants need distinct letters
+    return "Applicant " + "".join(chr(ord("a") + int(digit)) for digit in str(i)).title()
+
+
+def form(i, **fields):
+    """
+    A valid create/intake body for applicant `i`; no fuzzy-duplicate key is shared with another `i`.
+    """
+    return {
+        **FORM,
+        "full_name": name(i), "student_id": f"S{i:05d}", "mobile": f"0171{i:07d}",
+        "email": f"applicant{i}@example.com", "payment_slip_no": f"P{i:05d}", **fields,
+    }
+
+
+def make_application(i, **fields):
+    data = {**form(i), "dob": datetime.date(2002, 1, 1), **fields}
+    return Application.objects.create(**data)
@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from hallcore.models import Application, ApplicationStatusEvent
+from jobs.models import Job
+from notifications.models import NotificationBatch
+
+from .helpers import make_application
+
+User = get_user_model()
+
+
+class BulkStatusTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create(email="admin@example.com", username="admin", role="admin", is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def post(self, ids, status="Approved"):
+        response = self.client.post("/api/applications/status/bulk/", {"status": status, "ids": ids}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_reports_updated_unchanged_and_missing_ids(self):
+        apps = [make_application(i) for i in range(3)]
+        Application.objects.filter(pk=apps[0].pk).update(status="Approved")
+        missing = apps[-1].pk + 100
+        body = self.post([a.pk for a in apps] + [missing])
+        self.assertEqual(body["updated"], [apps[1].pk, apps[2].pk])
+        self.assertEqual(body["unchanged"], [apps[0].pk])
+        self.assertEqual(body["missing"], [missing])
+        self.assertEqual(ApplicationStatusEvent.objects.count(), 2)
+
+    def test_one_notification_job_for_all_changed_applications(self):
+        apps = [make_application(i) for i in range(20)]
+        self.post([a.pk for a in apps])
+        batches = NotificationBatch.objects.all()
+        self.assertEqual(batches.count(), 20)
+        self.assertEqual(len({b.group for b in batches}), 1)
+        self.assertEqual(sorted(b.recipients[0] for b in batches), sorted(a.email for a in apps))
+        self.assertEqual(list(Job.objects.values_list("task", flat=True)), ["notifications.tasks.send_group"])
+
+    def test_query_count_does_not_grow_with_the_number_of_ids(self):
+        def queries(ids):
+            with CaptureQueriesContext(connection) as ctx:
+                self.post(ids)
+            return len(ctx.captured_queries)
+
+        queries([make_application(999).pk])  # creates the counter rows
+        small = queries([make_application(i).pk for i in range(2)])
+        large = queries([make_application(i).pk for i in range(100, 150)])
+        self.assertEqual(small, large)
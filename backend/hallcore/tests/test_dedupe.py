@@ -0,0 +1,99 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+
+from hallcore import dedupe
+from hallcore.models import Application
+from hallcore.serializers import UNIQUE_FIELD_ERRORS, unique_violation_errors
+
+from .helpers import form, make_application
+
+
+class KeyTests(SimpleTestCase):
+    def test_email_key(self):
+        self.assertEqual(dedupe.email_key(" J.Doe+hall@GoogleMail.com "), "jdoe@gmail.com")
+        self.assertEqual(dedupe.email_key("j.doe+x@example.com"), "j.doe@example.com")
+        self.assertEqual(dedupe.email_key("not-an-email"), "not-an-email")
+
+    def test_mobile_key(self):
+        self.assertEqual(dedupe.mobile_key("+880 1711-234567"), "1711234567")
+        self.assertEqual(dedupe.mobile_key("12345"), "")  # too short to mean anything
+
+    def test_identity_key_ignores_token_order_and_case(self):
+        dob = datetime.date(2002, 1, 1)
+        self.assertEqual(dedupe.identity_key("Rahim Uddin", dob), dedupe.identity_key("uddin,  RAHIM", dob))
+        self.assertNotEqual(dedupe.identity_key("Rahim Uddin", dob), dedupe.identity_key("Rahim Uddin", None))
+        self.assertEqual(dedupe.identity_key("", dob), "")
+
+
+class SuspectedDuplicateTests(TestCase):
+    def setUp(self):
+        self.first = make_application(1, email="rahim.uddin@gmail.com", full_name="Rahim Uddin")
+        self.second = make_application(2)
+
+    def candidate(self, **fields):
+        app = Application(**{**form(99), "dob": datetime.date(2002, 1, 1), **fields})
+        dedupe.fill_keys(app)
+        return app
+
+    def test_matches_on_any_key(self):
+        self.assertEqual(dedupe.find_suspected_duplicate(self.candidate(email="rahimuddin+x@gmail.com")), self.first.pk)
+        self.assertEqual(dedupe.find_suspected_duplicate(self.candidate(mobile=self.second.mobile)), self.second.pk)
+        self.assertEqual(dedupe.find_suspected_duplicate(self.candidate(full_name="uddin rahim")), self.first.pk)
+        self.assertIsNone(dedupe.find_suspected_duplicate(self.candidate()))
+
+    def test_oldest_match_wins(self):
+        app = self.candidate(email=self.second.email, mobile=self.first.mobile)
+        self.assertEqual(dedupe.find_suspected_duplicate(app), self.first.pk)
+
+    def test_an_application_does_not_match_itself(self):
+        self.assertIsNone(dedupe.find_suspected_duplicate(self.first))
+
+    def test_batch_lookup_agrees_with_single_lookup(self):
+        apps = [
+            self.candidate(email="rahimuddin@gmail.com"),
+            self.candidate(mobile=self.second.mobile),
+            self.candidate(email=self.second.email, mobile=self.first.mobile),
+            self.candidate(),
+        ]
+        with self.assertNumQueries(1):
+            batch = dedupe.find_suspected_duplicates(apps)
+        self.assertEqual(batch, [dedupe.find_suspected_duplicate(app) for app in apps])
+        self.assertEqual(batch, [self.first.pk, self.second.pk, self.first.pk, None])
+
+
+class CreateFlagsDuplicatesTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets
+
+    def test_create_flags_but_accepts_a_fuzzy_duplicate(self):
+        first = make_application(1)
+        response = APIClient().post("/api/applications/create/", form(2, mobile=first.mobile), format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["suspected_duplicate_of"], first.pk)
+
+    def test_create_rejects_reused_unique_values(self):
+        make_application(1)
+        client = APIClient()
+        response = client.post("/api/applications/create/", form(2, payment_slip_no="P00001"), format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()), ["payment_slip_no"])
+        response = client.post("/api/applications/create/", form(3, student_id="S00001"), format="json")
+        self.assertEqual(list(response.json()), ["student_id"])
+
+
+class UniqueViolationErrorsTests(TestCase):
+    # MySQL reports the value and the key name, not the column
+    MYSQL = IntegrityError(1062, "Duplicate entry 'P00001' for key 'hallcore_application.slip_uniq'")
+
+    def test_maps_by_existing_row_not_by_message(self):
+        make_application(1)
+        errors = unique_violation_errors(self.MYSQL, Application(student_id="S00002", payment_slip_no="P00001"))
+        self.assertEqual(errors, {"payment_slip_no": [UNIQUE_FIELD_ERRORS["payment_slip_no"]]})
+
+    def test_unexplained_error_is_reraised(self):
+        with self.assertRaises(IntegrityError):
+            unique_violation_errors(self.MYSQL, Application(student_id="S00002", payment_slip_no="P00002"))
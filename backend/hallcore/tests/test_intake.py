@@ -0,0 +1,150 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from hallcore import intake, stats
+from hallcore.models import Application, ApplicationStats, ApplicationSubmission
+from hallcore.serializers import UNIQUE_FIELD_ERRORS
+from jobs.models import Job
+
+from .helpers import form, make_application
+
+
+def stage(*payloads):
+    return [intake.submit(payload) for payload in payloads]
+
+
+def refreshed(submissions):
+    return [ApplicationSubmission.objects.get(pk=s.pk) for s in submissions]
+
+
+@override_settings(INTAKE_BATCH_DELAY=None, DATABASE_REPLICAS=[])
+class ProcessBatchTests(TestCase):
+    def test_valid_submissions_become_applications(self):
+        first, second = stage(form(1), form(2))
+        self.assertEqual(intake.drain(), 2)
+        first, second = refreshed([first, second])
+        self.assertEqual((first.status, second.status), ("accepted", "accepted"))
+        self.assertEqual(Application.objects.get(pk=first.application_id).student_id, "S00001")
+        self.assertIsNotNone(first.processed_at)
+
+    def test_invalid_payload_is_rejected_with_serializer_errors(self):
+        [submission] = refreshed(stage(form(1, email="not-an-email")))
+        intake.drain()
+        [submission] = refreshed([submission])
+        self.assertEqual(submission.status, "rejected")
+        self.assertIn("email", submission.errors)
+        self.assertFalse(Application.objects.exists())
+
+    def test_reused_unique_values_are_rejected(self):
+        make_application(1)
+        taken, first, repeat = stage(
+            form(2, student_id="S00001"), form(3), form(4, payment_slip_no="P00003"),
+        )
+        intake.drain()
+        taken, first, repeat = refreshed([taken, first, repeat])
+        self.assertEqual(taken.errors, {"student_id": [UNIQUE_FIELD_ERRORS["student_id"]]})
+        self.assertEqual(first.status, "accepted")
+        # the first submission in the batch wins
+        self.assertEqual(repeat.errors, {"payment_slip_no": [UNIQUE_FIELD_ERRORS["payment_slip_no"]]})
+
+    def test_fuzzy_duplicates_are_flagged(self):
+        existing = make_application(1)
+        against_db, original, within = stage(
+            form(2, email="applicant1@example.com"), form(3), form(4, mobile=form(3)["mobile"]),
+        )
+        intake.drain()
+        against_db, original, within = refreshed([against_db, original, within])
+        flagged = dict(Application.objects.values_list("pk", "suspected_duplicate_of"))
+        self.assertEqual(flagged[against_db.application_id], existing.pk)
+        self.assertIsNone(flagged[original.application_id])
+        self.assertEqual(flagged[within.application_id], original.application_id)
+
+    def test_counters_match_a_rebuild(self):
+        stage(*(form(i, department=("CSE", "EEE")[i % 2]) for i in range(5)))
+        intake.drain()
+        incremental = dict(ApplicationStats.objects.values_list("department", "count"))
+        self.assertEqual(incremental, {"CSE": 3, "EEE": 2})
+        stats.rebuild()
+        self.assertEqual(dict(ApplicationStats.objects.values_list("department", "count")), incremental)
+
+    def test_race_with_synchronous_create_rejects_only_the_conflict(self):
+        lost, kept = stage(form(1), form(2))
+        flag_duplicates = intake._flag_duplicates
+
+        def create_first(accepted):
+            make_application(9, student_id="S00001")  # lands between the check and the INSERT
+            return flag_duplicates(accepted)
+
+        with mock.patch.object(intake, "_flag_duplicates", create_first):
+            intake.drain()
+        lost, kept = refreshed([lost, kept])
+        self.assertEqual(lost.errors, {"student_id": [UNIQUE_FIELD_ERRORS["student_id"]]})
+        self.assertEqual(kept.status, "accepted")
+        self.assertEqual(Application.objects.count(), 2)
+
+    def test_process_intake_command_drains_in_batches(self):
+        submissions = stage(form(1), form(2), form(3))
+        call_command("process_intake", "--batch", "2", stdout=StringIO())
+        self.assertEqual({s.status for s in refreshed(submissions)}, {"accepted"})
+        for option in ("--batch", "--poll-interval"):
+            with self.subTest(option=option), self.assertRaises(CommandError):
+                call_command("process_intake", option, "0")
+
+    @override_settings(INTAKE_VISIBILITY_TIMEOUT=60)
+    def test_claim_skips_rows_held_by_a_live_processor(self):
+        stage(form(1), form(2))
+        self.assertEqual(len(intake.claim(10)), 2)
+        self.assertEqual(intake.claim(10), [])
+        ApplicationSubmission.objects.update(claimed_at=timezone.now() - timedelta(seconds=61))
+        self.assertEqual(len(intake.claim(10)), 2)
+
+    @override_settings(INTAKE_RETENTION=60)
+    def test_prune_drops_old_processed_submissions(self):
+        old, recent = stage(form(1), form(2))
+        intake.drain()
+        ApplicationSubmission.objects.filter(pk=old.pk).update(processed_at=timezone.now() - timedelta(seconds=61))
+        self.assertEqual(intake.prune(), 1)
+        self.assertEqual(list(ApplicationSubmission.objects.values_list("pk", flat=True)), [recent.pk])
+
+
+@override_settings(DATABASE_REPLICAS=[], JOBS_EAGER=False, INTAKE_BATCH_DELAY=2)
+class IntakeEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets and the schedule marker
+        self.client = APIClient()
+
+    def test_submit_returns_a_receipt_and_schedules_one_job(self):
+        for i in range(3):
+            response = self.client.post("/api/applications/intake/", {**form(i), "nickname": "x"}, format="json")
+            self.assertEqual(response.status_code, 202, response.content)
+            self.assertEqual(response["Location"], response.json()["status_url"])
+        self.assertEqual(Job.objects.filter(task=intake.PROCESS_TASK).count(), 1)
+        # fields the serializer doesn't take aren't staged
+        self.assertNotIn("nickname", ApplicationSubmission.objects.first().payload)
+
+    def test_non_object_body_is_rejected(self):
+        response = self.client.post("/api/applications/intake/", [form(1)], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_receipt_follows_the_submission(self):
+        status_url = self.client.post("/api/applications/intake/", form(1), format="json").json()["status_url"]
+        pending = self.client.get(status_url)
+        self.assertEqual(pending.json()["status"], "received")
+        self.assertEqual(pending["Retry-After"], "2")
+
+        intake.drain()
+        done = self.client.get(status_url)
+        self.assertEqual(done.json()["status"], "accepted")
+        self.assertEqual(done.json()["application"], Application.objects.get().pk)
+        self.assertFalse(done.has_header("Retry-After"))
+
+    def test_unknown_receipt_is_404(self):
+        response = self.client.get("/api/applications/intake/00000000-0000-0000-0000-000000000000/")
+        self.assertEqual(response.status_code, 404)
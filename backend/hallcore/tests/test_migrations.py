@@ -0,0 +1,47 @@
+import tempfile
+from pathlib import Path
+
+from django.db import connections
+from django.db.migrations.executor import MigrationExecutor
+from django.db.utils import load_backend
+from django.test import TestCase
+
+from hallcore.management.commands.bench_migrate import history_loader, schema_differences, schema_snapshot
+
+ALIAS = "migration_check"
+
+
+class SquashedMigrationTests(TestCase):
+    """
+    Fresh databases build from the 0001_squashed_* migrations, part-migrated
+    ones from the originals: both must end up with the same schema.
+    """
+
+    def migrated_schema(self, squashed):
+        with tempfile.TemporaryDirectory() as tmp:
+            # a throwaway SQLite database; not in settings.DATABASES, so the test database guard lets it through
+            settings_dict = {
+                **connections["default"].settings_dict,
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": str(Path(tmp) / "schema.sqlite3"),
+            }
+            connection = connections[ALIAS] = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(
+                settings_dict, ALIAS
+            )
+            try:
+                executor = MigrationExecutor(connection)
+                if not squashed:
+                    executor.loader = history_loader(connection)
+                targets = executor.loader.graph.leaf_nodes()
+                # data migrations read the (empty) test database; only the schema matters here
+                executor.migrate(targets, plan=executor.migration_plan(targets, clean_start=True))
+                return schema_snapshot(connection)
+            finally:
+                connection.close()
+                del connections[ALIAS]
+
+    def test_squashed_and_full_history_build_the_same_schema(self):
+        squashed = self.migrated_schema(squashed=True)
+        history = self.migrated_schema(squashed=False)
+        self.assertIn("notices_notice", squashed)
+        self.assertEqual(schema_differences(history, squashed), [])
@@ -0,0 +1,49 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .helpers import make_application
+
+URL = "/api/applications/"
+
+
+def column(name):
+    return connection.ops.quote_name(name)
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        self.app = make_application(1)
+        self.client = APIClient()
+
+    def get(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(URL, {"page": 1, **params})
+        return response, [q["sql"] for q in queries if "hallcore_application" in q["sql"]]
+
+    def test_fields_trim_rows_and_columns(self):
+        response, sql = self.get({"fields": "id,full_name"})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["results"], [{"id": self.app.pk, "full_name": self.app.full_name}])
+        self.assertEqual(len(sql), 1)
+        self.assertNotIn(column("address"), sql[0])
+        self.assertNotIn(column("payment_slip_no"), sql[0])
+
+    def test_exclude_drops_the_field_and_its_column(self):
+        response, sql = self.get({"exclude": "address"})
+        row = response.json()["results"][0]
+        self.assertNotIn("address", row)
+        self.assertIn("student_id", row)
+        self.assertNotIn(column("address"), sql[0])
+
+    def test_unknown_field_is_a_400(self):
+        response, _ = self.get({"fields": "id,email_key"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email_key", response.json()["fields"][0])
+
+    def test_no_selection_is_the_full_representation(self):
+        response, sql = self.get({})
+        self.assertIn("address", response.json()["results"][0])
+        self.assertIn(column("address"), sql[0])
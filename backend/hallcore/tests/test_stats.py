@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from hallcore import stats
+from hallcore.models import ApplicationStats
+
+from .helpers import form, make_application
+
+User = get_user_model()
+
+
+def counters():
+    return {
+        (row.department, row.session, row.status): row.count
+        for row in ApplicationStats.objects.all()
+        if row.count
+    }
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class StatsCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets
+        self.client = APIClient()
+
+    def assertMatchesRebuild(self):
+        incremental = counters()
+        stats.rebuild()
+        self.assertEqual(counters(), incremental)
+
+    def test_create_counts_pending(self):
+        for i, department in enumerate(("CSE", "CSE", "EEE")):
+            response = self.client.post("/api/applications/create/", form(i, department=department), format="json")
+            self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(counters(), {("CSE", "2024-25", "Pending"): 2, ("EEE", "2024-25", "Pending"): 1})
+        self.assertMatchesRebuild()
+
+    def test_rejected_create_counts_nothing(self):
+        self.client.post("/api/applications/create/", form(1), format="json")
+        response = self.client.post("/api/applications/create/", form(2, student_id=form(1)["student_id"]), format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(counters(), {("CSE", "2024-25", "Pending"): 1})
+
+    def test_status_change_moves_the_count(self):
+        app = make_application(1)
+        stats.record_created(app)
+        response = self.client.patch(f"/api/applications/{app.pk}/status/", {"status": "Approved"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        # repeating the same status must not count twice
+        self.client.patch(f"/api/applications/{app.pk}/status/", {"status": "Approved"}, format="json")
+        self.assertEqual(counters(), {("CSE", "2024-25", "Approved"): 1})
+        self.assertMatchesRebuild()
+
+    def test_bulk_status_change(self):
+        apps = [make_application(i, department="CSE" if i % 2 else "EEE") for i in range(4)]
+        for app in apps:
+            stats.record_created(app)
+        admin = User.objects.create(email="admin@example.com", username="admin", role="admin", is_staff=True)
+        self.client.force_authenticate(admin)
+        response = self.client.post(
+            "/api/applications/status/bulk/", {"status": "Rejected", "ids": [a.pk for a in apps[:3]]}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            counters(),
+            {("EEE", "2024-25", "Rejected"): 2, ("CSE", "2024-25", "Rejected"): 1, ("CSE", "2024-25", "Pending"): 1},
+        )
+        self.assertMatchesRebuild()
+
+    def test_summary(self):
+        for i in range(3):
+            stats.record_created(make_application(i, department="EEE" if i else "CSE"))
+        summary = stats.summary()
+        self.assertEqual(summary["total"], 3)
+        self.assertEqual(summary["by_status"], {"Pending": 3, "Approved": 0, "Rejected": 0})
+        self.assertEqual(summary["by_department"]["EEE"]["Pending"], 2)
+        self.assertEqual(self.client.get("/api/applications/stats/").json(), summary)
@@ -1,8 +1,24 @@
 from django.urls import path
-from .views import ApplicationCreateView, ApplicationListView, ApplicationUpdateStatusView
+from .views import (
+    ApplicationCreateView,
+    ApplicationIntakeView,
+    ApplicationReceiptView,
+    ApplicationListView,
+    ApplicationUpdateStatusView,
+    ApplicationBulkStatusView,
+    ApplicationStatsView,
+    StatusHistoryView,
+    ApplicationHistoryView,
+)
 
 urlpatterns = [
     path('applications/', ApplicationListView.as_view(), name='application-list'),
     path('applications/create/', ApplicationCreateView.as_view(), name='application-create'),
+    path('applications/intake/', ApplicationIntakeView.as_view(), name='application-intake'),
+    path('applications/intake/<uuid:receipt>/', ApplicationReceiptView.as_view(), name='application-intake-receipt'),
+    path('applications/stats/', ApplicationStatsView.as_view(), name='application-stats'),
+    path('applications/status/bulk/', ApplicationBulkStatusView.as_view(), name='application-bulk-status'),
+    path('applications/history/', StatusHistoryView.as_view(), name='application-status-history'),
     path('applications/<int:pk>/status/', ApplicationUpdateStatusView.as_view(), name='application-update-status'),
-]
\ No newline at end of file
+    path('applications/<int:pk>/history/', ApplicationHistoryView.as_view(), name='application-history'),
+]
@@ -1,31 +1,182 @@
-from rest_framework import generics, status
+import functools
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from rest_framework import generics, serializers, status
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from .models import Application
-from .serializers import ApplicationSerializer
+from config.db_router import ReplicaReadsMixin
+from config.fields import SparseFieldsViewMixin
+from .filters import StatusHistoryFilter
+from .models import Application, ApplicationStatusEvent, ApplicationSubmission
+from .serializers import (
+    ApplicationSerializer,
+    ApplicationStatusEventSerializer,
+    ApplicationSubmissionSerializer,
+    unique_violation_errors,
+)
+from . import dedupe, history, intake, stats
+from notifications.services import notify_application_status, notify_application_statuses
 
 # Existing views (keep them)
 class ApplicationCreateView(generics.CreateAPIView):
     queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
+    throttle_scope = "applications"
+
+    def perform_create(self, serializer):
+        # flag fuzzy duplicates (indexed key lookups) before the single INSERT
+        candidate = Application(**serializer.validated_data)
+        dedupe.fill_keys(candidate)
+        duplicate_of = dedupe.find_suspected_duplicate(candidate)
+
+        try:
+            with transaction.atomic():
+                app = serializer.save(suspected_duplicate_of_id=duplicate_of)
+                stats.record_created(app)
+        except IntegrityError as exc:
+            raise serializers.ValidationError(unique_violation_errors(exc, candidate))
+
+# Asynchronous intake (hallcore.intake): stage the raw form, answer 202 with a receipt
+class ApplicationIntakeView(APIView):
+    throttle_scope = "applications"
+
+    def post(self, request):
+        if not hasattr(request.data, "items"):
+            return Response({"error": "Expected a JSON object"}, status=status.HTTP_400_BAD_REQUEST)
+        fields = intake_fields()
+        payload = {name: value for name, value in request.data.items() if name in fields}
+        submission = intake.submit(payload)
+        status_url = request.build_absolute_uri(reverse("application-intake-receipt", args=[submission.receipt]))
+        response = Response(
+            {"receipt": submission.receipt, "status": submission.status, "status_url": status_url},
+            status=status.HTTP_202_ACCEPTED,
+        )
+        response["Location"] = status_url
+        return response
+
 
-class ApplicationListView(generics.ListAPIView):
+@functools.lru_cache(maxsize=None)
+def intake_fields():
+    # writable ApplicationSerializer fields; anything else in the body isn't stored
+    return frozenset(name for name, field in ApplicationSerializer().fields.items() if not field.read_only)
+
+
+# Receipt polling; the receipt (a random UUID) is the only key, so no login is needed
+class ApplicationReceiptView(generics.RetrieveAPIView):
+    queryset = ApplicationSubmission.objects.all()
+    serializer_class = ApplicationSubmissionSerializer
+    lookup_field = "receipt"
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        if response.data["status"] in (ApplicationSubmission.RECEIVED, ApplicationSubmission.PROCESSING):
+            response["Retry-After"] = str(getattr(settings, "INTAKE_POLL_INTERVAL", 2))
+        return response
+
+# ?fields=id,full_name,status trims the JSON and the SELECT list
+class ApplicationListView(SparseFieldsViewMixin, ReplicaReadsMixin, generics.ListAPIView):
     queryset = Application.objects.all().order_by("-created_at")
     serializer_class = ApplicationSerializer
 
 # New view to update status (Approve/Reject)
 class ApplicationUpdateStatusView(APIView):
     def patch(self, request, pk):
-        try:
-            app = Application.objects.get(pk=pk)
-        except Application.DoesNotExist:
-            return Response({"error": "Application not found"}, status=status.HTTP_404_NOT_FOUND)
+        with transaction.atomic():
+            # row lock: concurrent approve/reject must not double-count in stats
+            try:
+                app = Application.objects.select_for_update().get(pk=pk)
+            except Application.DoesNotExist:
+                return Response({"error": "Application not found"}, status=status.HTTP_404_NOT_FOUND)
+
+            status_value = request.data.get("status")
+            if status_value not in ["Approved", "Rejected"]:
+                return Response({"error": "Invalid status"}, status=status.HTTP_400_BAD_REQUEST)
 
+            old_status = app.status
+            app.status = status_value
+            app.save()
+            if old_status != status_value:
+                history.record(app, old_status, actor=request.user)
+                stats.record_status_change(app, old_status)
+                notify_application_status(app)  # queued; mail goes out from the job worker
+        serializer = ApplicationSerializer(app)
+        return Response(serializer.data)
+
+# Approve/Reject many applications at once: one UPDATE, batched history INSERTs, one notification job
+class ApplicationBulkStatusView(APIView):
+    permission_classes = [IsAdminUser]
+    max_ids = 500
+
+    def post(self, request):
         status_value = request.data.get("status")
         if status_value not in ["Approved", "Rejected"]:
             return Response({"error": "Invalid status"}, status=status.HTTP_400_BAD_REQUEST)
+        ids = request.data.get("ids")
+        if not isinstance(ids, list) or not ids or len(ids) > self.max_ids:
+            return Response(
+                {"error": f"ids must be a list of 1-{self.max_ids} application ids"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            ids = sorted({int(pk) for pk in ids})
+        except (TypeError, ValueError):
+            return Response({"error": "ids must be integers"}, status=status.HTTP_400_BAD_REQUEST)
 
-        app.status = status_value
-        app.save()
-        serializer = ApplicationSerializer(app)
-        return Response(serializer.data)
\ No newline at end of file
+        with transaction.atomic():
+            locked = list(Application.objects.select_for_update().filter(pk__in=ids).order_by("pk"))
+            apps = [app for app in locked if app.status != status_value]
+            changes = [(app, app.status) for app in apps]
+            if apps:
+                Application.objects.filter(pk__in=[app.pk for app in apps]).update(status=status_value)
+                for app in apps:
+                    app.status = status_value
+                history.record_many(
+                    ((app.pk, old_status, status_value) for app, old_status in changes), actor=request.user
+                )
+                stats.record_status_changes(
+                    (app.department, app.session, old_status, status_value) for app, old_status in changes
+                )
+                notify_application_statuses(apps)  # one INSERT + one job for all the mails
+
+        found = {app.pk for app in locked}
+        updated = {app.pk for app in apps}
+        return Response({
+            "status": status_value,
+            "updated": sorted(updated),
+            "unchanged": [pk for pk in ids if pk in found and pk not in updated],  # already in that status
+            "missing": [pk for pk in ids if pk not in found],
+        })
+
+# Status history, newest first (cursor paginated: no COUNT, no OFFSET)
+class StatusHistoryPagination(CursorPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-created_at", "-id")
+
+
+class StatusHistoryView(generics.ListAPIView):
+    """
+    All status changes; ?actor=<user id> for one admin's decisions.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = ApplicationStatusEventSerializer
+    pagination_class = StatusHistoryPagination
+    filterset_class = StatusHistoryFilter
+    queryset = ApplicationStatusEvent.objects.select_related("actor")
+
+
+class ApplicationHistoryView(StatusHistoryView):
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # schema generation
+            return ApplicationStatusEvent.objects.none()
+        return super().get_queryset().filter(application_id=self.kwargs["pk"])
+
+# Dashboard counters (pending/approved/rejected, per department and session)
+class ApplicationStatsView(APIView):
+    def get(self, request):
+        return Response(stats.summary())
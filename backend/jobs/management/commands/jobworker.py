@@ -0,0 +1,69 @@
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from config.benchmark import positive_float, positive_int
+from jobs.queue import claim, purge_finished, run_job
+
+
+def _run_in_thread(job):
+    try:
+        return run_job(job)
+    finally:
+        # each pool thread has its own DB connection
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (DB-backed queue, no broker)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=positive_int, default=4, help="Worker threads.")
+        parser.add_argument("--poll-interval", type=positive_float, default=1.0, help="Seconds to sleep when idle.")
+        parser.add_argument("--once", action="store_true", help="Drain the queue, then exit.")
+        parser.add_argument("--keep-done-days", type=int, default=7, help="Purge finished jobs older than this.")
+
+    def handle(self, *args, **opts):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        concurrency = opts["concurrency"]
+        keep_done = timedelta(days=opts["keep_done_days"])
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        self.stdout.write(f"jobworker {worker_id}: {concurrency} threads")
+        processed, next_purge = 0, 0.0
+        running = set()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while not self._stopping:
+                close_old_connections()
+                if time.monotonic() >= next_purge:
+                    purge_finished(keep_done)
+                    next_purge = time.monotonic() + 3600
+
+                # top up free threads only: a slow job doesn't hold back the others
+                free = concurrency - len(running)
+                jobs = claim(free, worker_id) if free else []
+                running.update(pool.submit(_run_in_thread, job) for job in jobs)
+                if not running:
+                    if opts["once"]:
+                        break
+                    time.sleep(opts["poll_interval"])
+                    continue
+
+                done, running = wait(running, timeout=opts["poll_interval"], return_when=FIRST_COMPLETED)
+                processed += len(done)
+
+            done, _ = wait(running)  # let jobs in flight finish on shutdown
+            processed += len(done)
+
+        self.stdout.write(f"jobworker {worker_id}: stopped after {processed} jobs")
+
+    def _stop(self, signum, frame):
+        self._stopping = True
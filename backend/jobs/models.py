@@ -0,0 +1,38 @@
+# backend/jobs/models.py
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),  # raised on its last attempt
+        ("dead", "Dead"),      # its worker died on the last attempt (lease expired)
+    ]
+
+    task = models.CharField(max_length=200)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+
+    # Visibility timeout: a "running" job whose lock expired is handed out again
+    locked_until = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="jobs_job_status_run_after"),
+            models.Index(fields=["status", "locked_until"], name="jobs_job_status_locked"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
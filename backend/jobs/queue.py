@@ -0,0 +1,186 @@
+# backend/jobs/queue.py
+"""
+DB-backed job queue: no broker, works on a single box and in tests.
+
+    # in <app>/tasks.py
+    from jobs.queue import task
+
+    @task(max_attempts=5)
+    def send_welcome_mail(user_id): ...
+
+    # in a view
+    from jobs.queue import enqueue
+    enqueue(send_welcome_mail, user_id=user.id)
+
+enqueue() only inserts a row, inside the caller's transaction, so the job
+exists iff the surrounding write committed. `manage.py jobworker` claims and
+runs jobs. With JOBS_EAGER = True jobs run in-process right after commit.
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+class Task:
+    def __init__(self, func, name, max_attempts, visibility_timeout):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.visibility_timeout = visibility_timeout
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, **kwargs):
+        return enqueue(self, **kwargs)
+
+
+def task(func=None, *, name=None, max_attempts=3, visibility_timeout=None):
+    """
+    Register a function as a job. Payload kwargs must be JSON-serializable.
+    """
+    def decorator(f):
+        t = Task(
+            f,
+            name or f"{f.__module__}.{f.__name__}",
+            max_attempts,
+            visibility_timeout or getattr(settings, "JOBS_VISIBILITY_TIMEOUT", 300),
+        )
+        _registry[t.name] = t
+        return t
+
+    return decorator(func) if func is not None else decorator
+
+
+def get_task(name):
+    return _registry.get(name)
+
+
+def enqueue(task_or_name, *, delay=0, **payload):
+    t = task_or_name if isinstance(task_or_name, Task) else get_task(task_or_name)
+    if t is None:
+        raise LookupError(f"Unknown task: {task_or_name!r}")
+
+    job = Job.objects.create(
+        task=t.name,
+        payload=payload,
+        max_attempts=t.max_attempts,
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+    if getattr(settings, "JOBS_EAGER", False):
+        transaction.on_commit(lambda: _eager_run(job.pk))
+    return job
+
+
+def _eager_run(job_pk):
+    job = claim_one(job_pk, worker_id="eager")
+    if job is not None:
+        run_job(job)
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+def _claimable(now):
+    # an expired lease means the worker died mid-run: retry only while attempts remain
+    return Q(status="queued", run_after__lte=now) | Q(
+        status="running", locked_until__lt=now, attempts__lt=F("max_attempts")
+    )
+
+
+def reap_dead(now=None):
+    """
+    Mark jobs dead whose lease expired on their last attempt, so a job that
+    keeps crashing (or killing) its worker isn't handed out forever.
+    """
+    now = now or timezone.now()
+    return Job.objects.filter(status="running", locked_until__lt=now, attempts__gte=F("max_attempts")).update(
+        status="dead",
+        finished_at=now,
+        locked_until=None,
+        last_error=Concat(F("last_error"), Value("\nLease expired on the last attempt: the worker died mid-run.")),
+    )
+
+
+def claim_one(job_pk, worker_id):
+    """
+    Atomically take one job: a conditional UPDATE, so two workers can never
+    both win (no SELECT ... FOR UPDATE needed, works on SQLite too).
+    """
+    now = timezone.now()
+    job = Job.objects.filter(pk=job_pk).only("task").first()
+    if job is None:
+        return None
+    t = get_task(job.task)
+    timeout = t.visibility_timeout if t else getattr(settings, "JOBS_VISIBILITY_TIMEOUT", 300)
+    claimed = Job.objects.filter(_claimable(now), pk=job_pk).update(
+        status="running",
+        attempts=F("attempts") + 1,
+        locked_until=now + timedelta(seconds=timeout),
+        locked_by=worker_id,
+    )
+    return Job.objects.get(pk=job_pk) if claimed else None
+
+
+def claim(limit, worker_id):
+    now = timezone.now()
+    reap_dead(now)
+    candidates = (
+        Job.objects.filter(_claimable(now))
+        .order_by("run_after")
+        .values_list("pk", flat=True)[: limit * 2]
+    )
+    jobs = []
+    for pk in candidates:
+        job = claim_one(pk, worker_id)
+        if job is not None:
+            jobs.append(job)
+            if len(jobs) >= limit:
+                break
+    return jobs
+
+
+def run_job(job):
+    """
+    Execute a claimed job and record the outcome (retry with backoff on error).
+    """
+    t = get_task(job.task)
+    try:
+        if t is None:
+            raise LookupError(f"Unknown task: {job.task!r}")
+        t.func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning("Job %s (%s) failed, attempt %s/%s", job.pk, job.task, job.attempts, job.max_attempts)
+        if job.attempts >= job.max_attempts:
+            fields = {"status": "failed", "finished_at": timezone.now()}
+        else:
+            backoff = getattr(settings, "JOBS_RETRY_BACKOFF", 10) * 2 ** (job.attempts - 1)
+            fields = {"status": "queued", "run_after": timezone.now() + timedelta(seconds=backoff)}
+        Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+            last_error=error, locked_until=None, **fields
+        )
+        return False
+
+    Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+        status="done", finished_at=timezone.now(), locked_until=None
+    )
+    return True
+
+
+def purge_finished(older_than):
+    cutoff = timezone.now() - older_than
+    deleted, _ = Job.objects.filter(status="done", finished_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import claim, claim_one, enqueue, reap_dead, run_job, task
+
+calls = []
+
+
+@task(max_attempts=2)
+def record(value):
+    calls.append(value)
+
+
+@task(max_attempts=2)
+def explode():
+    raise RuntimeError("boom")
+
+
+@override_settings(JOBS_EAGER=False, JOBS_RETRY_BACKOFF=10)
+class QueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_claim_run(self):
+        job = enqueue(record, value=1)
+        [claimed] = claim(10, "w1")
+        self.assertEqual((claimed.pk, claimed.status, claimed.attempts), (job.pk, "running", 1))
+        self.assertTrue(run_job(claimed))
+        self.assertEqual(calls, [1])
+        job.refresh_from_db()
+        self.assertEqual(job.status, "done")
+        self.assertIsNone(job.locked_until)
+
+    def test_a_job_is_claimed_once(self):
+        job = enqueue(record, value=1)
+        self.assertIsNotNone(claim_one(job.pk, "w1"))
+        self.assertIsNone(claim_one(job.pk, "w2"))
+        self.assertEqual(claim(10, "w2"), [])
+
+    def test_delayed_jobs_wait(self):
+        enqueue(record, delay=60, value=1)
+        self.assertEqual(claim(10, "w1"), [])
+
+    def test_failure_retries_with_backoff_then_fails(self):
+        job = enqueue(explode)
+        with self.assertLogs("jobs.queue", "WARNING"):
+            self.assertFalse(run_job(claim_one(job.pk, "w1")))
+        job.refresh_from_db()
+        self.assertEqual(job.status, "queued")
+        self.assertIn("RuntimeError: boom", job.last_error)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=5))
+
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        with self.assertLogs("jobs.queue", "WARNING"):
+            self.assertFalse(run_job(claim_one(job.pk, "w1")))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("failed", 2))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_expired_lease_is_reclaimed_while_attempts_remain(self):
+        job = enqueue(record, value=1)
+        claim_one(job.pk, "crashed")
+        Job.objects.filter(pk=job.pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+        [again] = claim(10, "w2")
+        self.assertEqual((again.pk, again.attempts, again.locked_by), (job.pk, 2, "w2"))
+
+    def test_expired_lease_on_the_last_attempt_marks_the_job_dead(self):
+        job = enqueue(record, value=1)
+        Job.objects.filter(pk=job.pk).update(
+            status="running", attempts=2, locked_until=timezone.now() - timedelta(seconds=1), last_error="earlier"
+        )
+        self.assertEqual(claim(10, "w2"), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, "dead")
+        self.assertTrue(job.last_error.startswith("earlier\nLease expired"))
+        self.assertEqual(reap_dead(), 0)
+        self.assertEqual(calls, [])
+
+    def test_a_stale_worker_cannot_overwrite_the_new_owner(self):
+        job = enqueue(record, value=1)
+        stale = claim_one(job.pk, "w1")
+        Job.objects.filter(pk=job.pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+        fresh = claim_one(job.pk, "w2")
+        run_job(stale)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), ("running", "w2"))
+        run_job(fresh)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "done")
+
+    @override_settings(JOBS_EAGER=True)
+    def test_eager_mode_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue(record, value=7)
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [7])
+
+
+class WorkerOptionsTests(SimpleTestCase):
+    def test_counts_and_intervals_must_be_positive(self):
+        for option, value in (("--concurrency", "0"), ("--poll-interval", "0"), ("--poll-interval", "-1")):
+            with self.subTest(option=option, value=value), self.assertRaises(CommandError):
+                call_command("jobworker", "--once", option, value)
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    replaces = [
+        ('notices', '0001_initial'),
+        ('notices', '0002_alter_notice_options_remove_notice_expires_on_and_more'),
+        ('notices', '0003_notice_delta_sync'),
+        ('notices', '0004_notice_list_index'),
+    ]
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NoticeDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notice_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Notice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('category', models.CharField(choices=[('General', 'General'), ('Exam', 'Exam'), ('Maintenance', 'Maintenance'), ('Event', 'Event'), ('Emergency', 'Emergency')], default='General', max_length=32)),
+                ('author', models.CharField(default='Admin', max_length=120)),
+                ('pinned', models.BooleanField(default=False)),
+                ('attachment_url', models.URLField(blank=True, null=True)),
+                ('expires_at', models.DateField(blank=True, db_column='expires_on', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'notices_notice',
+                'ordering': ['-pinned', '-created_at'],
+                'indexes': [models.Index(fields=['pinned', 'created_at'], name='notices_pinned_created_idx'), models.Index(fields=['updated_at'], name='notices_updated_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:44
+
+from django.db import migrations, models
+
+from config.migration_ops import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notices', '0002_alter_notice_options_remove_notice_expires_on_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NoticeDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notice_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        AddIndexOnline(
+            model_name='notice',
+            index=models.Index(fields=['updated_at'], name='notices_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:56
+
+from django.db import migrations, models
+
+from config.migration_ops import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notices', '0003_notice_delta_sync'),
+    ]
+
+    operations = [
+        AddIndexOnline(
+            model_name='notice',
+            index=models.Index(fields=['pinned', 'created_at'], name='notices_pinned_created_idx'),
+        ),
+    ]
@@ -30,6 +30,19 @@ class Notice(models.Model):
     class Meta:
         ordering = ["-pinned", "-created_at"]  # same as your queryset
         db_table = "notices_notice"  # leave default if you didn't change it earlier
+        indexes = [
+            models.Index(fields=["pinned", "created_at"], name="notices_pinned_created_idx"),  # list order
+            models.Index(fields=["updated_at"], name="notices_updated_at_idx"),  # ?since= delta sync
+        ]
 
     def __str__(self):
         return self.title
+
+
+# Tombstones for ?since= delta sync (notices.sync); pruned after NOTICE_TOMBSTONE_RETENTION
+class NoticeDeletion(models.Model):
+    notice_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"notice {self.notice_id} deleted {self.deleted_at}"
@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from config.serializers import CachedFieldsMixin
 from .models import Notice
 
-class NoticeSerializer(serializers.ModelSerializer):
+class NoticeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Notice
         fields = [
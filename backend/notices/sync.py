@@ -0,0 +1,106 @@
+# backend/notices/sync.py
+"""
+Delta sync for the notice board (GET /api/notices/?since=<timestamp>).
+
+Changes come from the updated_at index, deletions from NoticeDeletion
+tombstones written in the same transaction as the delete. The returned
+`until` is the newest timestamp actually seen (safe with lagging replicas),
+but never later than NOTICE_SYNC_OVERLAP seconds ago. That way a write that
+committed late, with an older timestamp, is still picked up next time.
+Clients should treat changes as upserts; a very recent notice can arrive
+twice.
+
+Tombstones are kept for NOTICE_TOMBSTONE_RETENTION. A client whose `since`
+is older than that gets `full: true` and should replace its copy.
+
+Changes come in pages of at most NOTICE_SYNC_PAGE_SIZE notices, oldest
+update first. `more: true` means the page was cut short: ask again with
+the returned `until` right away. A full resync is paged by id instead:
+its pages also return `after`, and the next page is
+`?since=<until>&after=<after>`. `until` stays the time the resync
+started, so once `more` is false the ordinary deltas pick up whatever
+changed while the pages were being fetched.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Notice, NoticeDeletion
+
+
+def _retention():
+    return timedelta(seconds=getattr(settings, "NOTICE_TOMBSTONE_RETENTION", 30 * 86400))
+
+
+def record_deletion(notice_id):
+    NoticeDeletion.objects.create(notice_id=notice_id)
+    NoticeDeletion.objects.filter(deleted_at__lt=timezone.now() - _retention()).delete()
+
+
+def _page(queryset, limit):
+    """
+    (notices, more): up to `limit` notices by updated_at. A page never ends
+    inside a run of equal timestamps, so `updated_at > last` resumes it.
+    """
+    rows = list(queryset.order_by("updated_at", "pk")[:limit + 1])
+    if len(rows) <= limit:
+        return rows, False
+    boundary = rows[limit].updated_at
+    page = [n for n in rows[:limit] if n.updated_at < boundary]
+    if not page:
+        # more than `limit` notices share one timestamp: they go out together
+        page = list(queryset.filter(updated_at__lte=boundary).order_by("pk"))
+    return page, True
+
+
+def _full_page(queryset, limit, after, until):
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+    rows = list(queryset.order_by("pk")[:limit + 1])
+    more = len(rows) > limit
+    return {
+        "full": True,
+        "changed": rows[:limit],
+        "deleted": [],
+        "until": until,
+        "more": more,
+        "after": rows[limit - 1].pk if more else None,
+    }
+
+
+def changes_since(since, queryset=None, after=None):
+    """
+    -> {"full", "changed": [Notice], "deleted": [id], "until", "more", "after"}
+
+    `after` (the previous page's `after`) continues a full resync.
+    """
+    queryset = Notice.objects.all() if queryset is None else queryset
+    now = timezone.now()
+    settled = now - timedelta(seconds=getattr(settings, "NOTICE_SYNC_OVERLAP", 5))
+    limit = getattr(settings, "NOTICE_SYNC_PAGE_SIZE", 200)
+    if after is not None:
+        return _full_page(queryset, limit, after, until=since)
+    if since < now - _retention():
+        return _full_page(queryset, limit, None, until=settled)
+
+    changed, more = _page(queryset.filter(updated_at__gt=since), limit)
+    deletions = list(
+        NoticeDeletion.objects.filter(deleted_at__gt=since).values_list("notice_id", "deleted_at")
+    )
+    deleted_ids = {notice_id for notice_id, _ in deletions}
+    if more:
+        # resume right after this page; the overlap only matters for the newest one
+        until = changed[-1].updated_at
+    else:
+        newest = max([since] + [n.updated_at for n in changed] + [deleted_at for _, deleted_at in deletions])
+        until = max(since, min(newest, settled))
+    return {
+        "full": False,
+        # a notice deleted after being edited shows up only as a tombstone
+        "changed": [n for n in changed if n.pk not in deleted_ids],
+        "deleted": sorted(deleted_ids),
+        "until": until,
+        "more": more,
+        "after": None,
+    }
@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from config.benchmark import FAST_HASHERS
+from notices import sync
+from notices.models import Notice, NoticeDeletion
+
+
+def make_notices(count, updated_at=None):
+    notices = Notice.objects.bulk_create(Notice(title=f"n{i}", body="b") for i in range(count))
+    if updated_at is not None:
+        Notice.objects.filter(pk__in=[n.pk for n in notices]).update(updated_at=updated_at)
+    return notices
+
+
+@override_settings(DATABASE_REPLICAS=[], PAGINATION_MAX_PAGE_SIZE=5)
+class NoticeListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        make_notices(8)
+
+    @override_settings(PAGINATION_LEGACY_LIMIT=10)
+    def test_unpaged_list_under_the_cap_is_complete_and_deprecated(self):
+        response = self.client.get("/api/notices/")
+        self.assertEqual(len(response.json()), 8)
+        self.assertEqual(response["Deprecation"], "true")
+        self.assertFalse(response.has_header("Link"))
+
+    @override_settings(PAGINATION_LEGACY_LIMIT=5)
+    def test_capped_list_links_the_rest(self):
+        with self.assertLogs("config.pagination", "WARNING"):
+            response = self.client.get("/api/notices/")
+        self.assertEqual(len(response.json()), 5)
+        self.assertIn("page=2", response["Link"])
+        next_url = response["Link"].split(">")[0].lstrip("<")
+        self.assertEqual(len(self.client.get(next_url).json()["results"]), 3)
+
+
+@override_settings(DATABASE_REPLICAS=[], NOTICE_SYNC_PAGE_SIZE=3, NOTICE_SYNC_OVERLAP=0)
+class SyncPagingTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.old = self.now - timedelta(days=365)
+
+    def follow(self, since):
+        """Every notice id the client ends up with, and the number of calls."""
+        seen, calls, more, after = set(), 0, True, None
+        while more:
+            delta = sync.changes_since(since, after=after)
+            seen |= {n.pk for n in delta["changed"]}
+            since, more, after, calls = delta["until"], delta["more"], delta["after"], calls + 1
+            self.assertLess(calls, 20)
+        self.assertFalse(sync.changes_since(since)["full"])
+        return seen, calls
+
+    def test_full_resync_is_paged(self):
+        notices = make_notices(7)
+        for i, notice in enumerate(notices):
+            Notice.objects.filter(pk=notice.pk).update(updated_at=self.now - timedelta(minutes=10 - i))
+        delta = sync.changes_since(self.old)
+        self.assertTrue(delta["full"] and delta["more"])
+        self.assertEqual(len(delta["changed"]), 3)
+        self.assertEqual(self.follow(self.old), ({n.pk for n in notices}, 3))
+
+    @override_settings(NOTICE_TOMBSTONE_RETENTION=86400)
+    def test_full_resync_of_notices_older_than_retention_finishes(self):
+        notices = make_notices(7, self.now - timedelta(days=10))
+        first = sync.changes_since(self.old)
+        second = sync.changes_since(first["until"], after=first["after"])
+        self.assertEqual([n.pk for n in first["changed"]], [n.pk for n in notices[:3]])
+        self.assertEqual([n.pk for n in second["changed"]], [n.pk for n in notices[3:6]])
+        self.assertEqual(second["until"], first["until"])
+        self.assertEqual(self.follow(self.old), ({n.pk for n in notices}, 3))
+
+    def test_changes_during_a_full_resync_come_with_the_next_delta(self):
+        notices = make_notices(4, self.now - timedelta(days=60))
+        first = sync.changes_since(self.old)
+        Notice.objects.filter(pk=notices[0].pk).update(updated_at=timezone.now(), title="edited")
+        rest = sync.changes_since(first["until"], after=first["after"])
+        self.assertFalse(rest["more"])
+        delta = sync.changes_since(rest["until"])
+        self.assertEqual([n.title for n in delta["changed"]], ["edited"])
+
+    def test_page_never_splits_equal_timestamps(self):
+        first = make_notices(2, self.now - timedelta(minutes=3))
+        tied = make_notices(3, self.now - timedelta(minutes=2))
+        delta = sync.changes_since(self.now - timedelta(minutes=4))
+        self.assertEqual({n.pk for n in delta["changed"]}, {n.pk for n in first})
+        self.assertTrue(delta["more"])
+        seen, _ = self.follow(self.now - timedelta(minutes=4))
+        self.assertEqual(seen, {n.pk for n in first + tied})
+
+    def test_run_longer_than_a_page_goes_out_together(self):
+        tied = make_notices(5, self.now - timedelta(minutes=2))
+        delta = sync.changes_since(self.now - timedelta(minutes=4))
+        self.assertEqual({n.pk for n in delta["changed"]}, {n.pk for n in tied})
+        self.assertEqual(self.follow(self.now - timedelta(minutes=4)), ({n.pk for n in tied}, 2))
+
+
+@override_settings(
+    PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=[], NOTICE_SYNC_OVERLAP=5, NOTICE_TOMBSTONE_RETENTION=86400
+)
+class DeltaSyncTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            username="admin", email="admin@example.com", password="pw", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+        self.since = timezone.now() - timedelta(minutes=1)
+
+    def sync(self, since):
+        response = self.client.get("/api/notices/", {"since": since.isoformat()})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_changes_and_tombstones_since(self):
+        kept, edited, dropped = make_notices(3, self.since - timedelta(minutes=1))
+        self.client.patch(f"/api/notices/{edited.pk}/", {"title": "edited"}, format="json")
+        self.assertEqual(self.client.delete(f"/api/notices/{dropped.pk}/").status_code, 204)
+        body = self.sync(self.since)
+        self.assertFalse(body["full"])
+        self.assertEqual([n["id"] for n in body["changed"]], [edited.pk])
+        self.assertEqual(body["deleted"], [dropped.pk])
+        self.assertNotIn(kept.pk, [n["id"] for n in body["changed"]])
+
+    def test_edited_then_deleted_is_only_a_tombstone(self):
+        [notice] = make_notices(1)
+        self.client.patch(f"/api/notices/{notice.pk}/", {"title": "edited"}, format="json")
+        self.client.delete(f"/api/notices/{notice.pk}/")
+        body = self.sync(self.since)
+        self.assertEqual((body["changed"], body["deleted"]), ([], [notice.pk]))
+
+    def test_until_stays_behind_the_overlap(self):
+        make_notices(1)
+        body = self.sync(self.since)
+        until = datetime.fromisoformat(body["until"].replace("Z", "+00:00"))
+        self.assertLessEqual(until, timezone.now() - timedelta(seconds=5))
+        self.assertGreaterEqual(until, self.since)
+        # a notice written inside the overlap window comes again on the next call
+        self.assertEqual(len(self.sync(until)["changed"]), 1)
+
+    def test_since_older_than_retention_is_a_full_resync(self):
+        notices = make_notices(2, timezone.now() - timedelta(days=3))
+        body = self.sync(timezone.now() - timedelta(days=2))
+        self.assertTrue(body["full"])
+        self.assertEqual({n["id"] for n in body["changed"]}, {n.pk for n in notices})
+        self.assertEqual(body["deleted"], [])
+
+    def test_old_tombstones_are_pruned(self):
+        first, second = make_notices(2)
+        self.client.delete(f"/api/notices/{first.pk}/")
+        NoticeDeletion.objects.update(deleted_at=timezone.now() - timedelta(days=2))
+        self.client.delete(f"/api/notices/{second.pk}/")
+        self.assertEqual(list(NoticeDeletion.objects.values_list("notice_id", flat=True)), [second.pk])
+
+    def test_full_resync_pages_through_the_endpoint(self):
+        make_notices(3, timezone.now() - timedelta(days=3))
+        with self.settings(NOTICE_SYNC_PAGE_SIZE=2):
+            first = self.sync(timezone.now() - timedelta(days=2))
+            response = self.client.get(
+                "/api/notices/", {"since": first["until"].replace("Z", "+00:00"), "after": first["after"]}
+            )
+        rest = response.json()
+        self.assertEqual((first["full"], first["more"], rest["full"], rest["more"]), (True, True, True, False))
+        self.assertEqual(len(first["changed"]) + len(rest["changed"]), 3)
+        self.assertEqual(self.client.get("/api/notices/", {"since": first["until"], "after": "x"}).status_code, 400)
+
+    def test_bad_since_is_rejected(self):
+        response = self.client.get("/api/notices/", {"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.json())
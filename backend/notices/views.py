@@ -1,14 +1,92 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, make_aware
 from rest_framework import viewsets
+from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticatedOrReadOnly
+from config.cache import get_or_compute, invalidate_on_commit
+from config.db_router import PRIMARY, ReplicaReadsMixin, reading_from
+from config.pagination import bare_list_response, legacy_limit
+from . import sync
 from .models import Notice
 from .serializers import NoticeSerializer
+from notifications.services import notify_emergency_notice
 
-class NoticeViewSet(viewsets.ModelViewSet):
+# serialized unfiltered notice list, shared by every reader
+LIST_CACHE_KEY = "notices:list"
+
+
+def cached_notice_list():
+    """
+    The unpaged notice list: legacy_limit() + 1 notices (the extra one flags a next page).
+    """
+    # from the primary: a lagging replica must not seed the shared entry
+    def compute():
+        with reading_from(PRIMARY):
+            return NoticeSerializer(NoticeViewSet.queryset.all()[:legacy_limit() + 1], many=True).data
+    return get_or_compute(LIST_CACHE_KEY, compute, getattr(settings, "NOTICE_LIST_CACHE_TTL", 60))
+
+
+class NoticeViewSet(ReplicaReadsMixin, viewsets.ModelViewSet):
     queryset = Notice.objects.all().order_by("-pinned", "-created_at")
     serializer_class = NoticeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    throttle_scope = "notices"
 
     def get_permissions(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
             return [IsAdminUser()]
         return [AllowAny()]
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            notice = serializer.save()
+            if notice.category == "Emergency":
+                notify_emergency_notice(notice)
+            invalidate_on_commit(LIST_CACHE_KEY)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+            invalidate_on_commit(LIST_CACHE_KEY)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            notice_id = instance.pk
+            instance.delete()
+            sync.record_deletion(notice_id)
+            invalidate_on_commit(LIST_CACHE_KEY)
+
+    def list(self, request, *args, **kwargs):
+        if "since" not in request.query_params:
+            if request.query_params:
+                return super().list(request, *args, **kwargs)
+            # same body as CountFreePagination's unpaged (bare list) response
+            notices = cached_notice_list()
+            size = legacy_limit()
+            return bare_list_response(request, notices[:size], len(notices) > size)
+
+        # "+" in an unencoded query string arrives as a space
+        since = parse_datetime(request.query_params["since"].replace(" ", "+"))
+        if since is None:
+            return Response({"since": ["Expected an ISO 8601 timestamp, e.g. a previous `until`."]}, status=400)
+        if is_naive(since):
+            since = make_aware(since)
+
+        after = request.query_params.get("after")
+        if after is not None:
+            try:
+                after = int(after)
+            except ValueError:
+                return Response({"after": ["Expected a notice id, e.g. a previous `after`."]}, status=400)
+
+        delta = sync.changes_since(since, self.filter_queryset(self.get_queryset()), after=after)
+        return Response({
+            "full": delta["full"],
+            "until": delta["until"],
+            "changed": self.get_serializer(delta["changed"], many=True).data,
+            "deleted": delta["deleted"],
+            "more": delta["more"],
+            "after": delta["after"],
+        })
@@ -0,0 +1,5 @@
+from django.contrib import admin
+from .models import NotificationBatch, NotificationChunk
+
+admin.site.register(NotificationBatch)
+admin.site.register(NotificationChunk)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationchunk',
+            name='failed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='notificationchunk',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
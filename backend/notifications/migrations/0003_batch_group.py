@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_chunk_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationbatch',
+            name='group',
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+    ]
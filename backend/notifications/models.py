@@ -0,0 +1,62 @@
+# backend/notifications/models.py
+from django.db import models
+
+STATUS_CHOICES = [
+    ("pending", "Pending"),
+    ("sending", "Sending"),
+    ("done", "Done"),
+    ("failed", "Failed"),
+]
+
+
+class NotificationBatch(models.Model):
+    """
+    One message (rendered once) going to many recipients.
+    """
+    AUDIENCE_CHOICES = [
+        ("emails", "Explicit email list"),
+        ("all_users", "All active users"),
+    ]
+
+    kind = models.CharField(max_length=50)  # e.g. "application_status", "emergency_notice"
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    audience = models.CharField(max_length=20, choices=AUDIENCE_CHOICES, default="emails")
+    recipients = models.JSONField(default=list, blank=True)  # only for audience="emails"
+    # batches created together (one personal mail each) and sent by one send_group job
+    group = models.UUIDField(null=True, blank=True, db_index=True)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    total = models.PositiveIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.kind}: {self.subject} ({self.sent}/{self.total})"
+
+
+class NotificationChunk(models.Model):
+    """
+    A slice of a batch's recipients, sent over one SMTP connection.
+    Chunks already marked done are skipped when a batch job is retried, and a
+    retried chunk resumes at `position`: recipients before it already got
+    the mail (or were refused) and aren't sent to again.
+    """
+    batch = models.ForeignKey(NotificationBatch, on_delete=models.CASCADE, related_name="chunks")
+    index = models.PositiveIntegerField()
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    position = models.PositiveIntegerField(default=0)  # recipients[:position] were attempted
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)    # refused, plus the unsent rest after an error
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        unique_together = ("batch", "index")
+        ordering = ["batch", "index"]
+
+    def __str__(self):
+        return f"batch {self.batch_id} chunk {self.index} ({self.status})"
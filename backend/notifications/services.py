@@ -0,0 +1,80 @@
+# backend/notifications/services.py
+"""
+Notification fan-out.
+
+Views call notify_*(); that renders the template once, stores a
+NotificationBatch and enqueues notifications.tasks.send_batch. Nothing is
+sent inside the request.
+"""
+import uuid
+
+from django.template.loader import render_to_string
+
+from jobs.queue import enqueue
+
+from .models import NotificationBatch
+from .tasks import send_batch, send_group
+
+
+def _render(template, context):
+    subject = render_to_string(f"notifications/{template}_subject.txt", context)
+    body = render_to_string(f"notifications/{template}.txt", context)
+    return " ".join(subject.split()), body.strip() + "\n"
+
+
+def create_batch(kind, template, context, *, recipients=None, audience="emails"):
+    subject, body = _render(template, context)
+    recipients = [r for r in (recipients or []) if r]
+    batch = NotificationBatch.objects.create(
+        kind=kind,
+        subject=subject,
+        body=body,
+        audience=audience,
+        recipients=recipients,
+        total=len(recipients),
+    )
+    enqueue(send_batch, batch_id=batch.pk)
+    return batch
+
+
+def notify_application_status(application):
+    if not application.email:
+        return None
+    return create_batch(
+        "application_status",
+        "application_status",
+        {"application": application},
+        recipients=[application.email],
+    )
+
+
+def notify_application_statuses(applications):
+    """
+    notify_application_status for many applications at once: each mail is
+    still personal (one batch per application), but all of them take one
+    bulk INSERT and one send_group job.
+    """
+    group = uuid.uuid4()
+    batches = []
+    for application in applications:
+        if not application.email:
+            continue
+        subject, body = _render("application_status", {"application": application})
+        batches.append(NotificationBatch(
+            kind="application_status", subject=subject, body=body,
+            recipients=[application.email], total=1, group=group,
+        ))
+    if not batches:
+        return 0
+    NotificationBatch.objects.bulk_create(batches, batch_size=500)
+    enqueue(send_group, group=str(group))
+    return len(batches)
+
+
+def notify_emergency_notice(notice):
+    return create_batch(
+        "emergency_notice",
+        "emergency_notice",
+        {"notice": notice},
+        audience="all_users",
+    )
@@ -0,0 +1,134 @@
+# backend/notifications/tasks.py
+import smtplib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.queue import task
+
+from .models import NotificationBatch, NotificationChunk
+
+
+def _recipients(batch):
+    if batch.audience == "all_users":
+        User = get_user_model()
+        return (
+            User.objects.filter(is_active=True)
+            .exclude(email="")
+            .order_by("pk")
+            .values_list("email", flat=True)
+            .iterator(chunk_size=2000)
+        )
+    return iter(batch.recipients)
+
+
+def _materialize_chunks(batch):
+    """
+    Split the audience into NotificationChunk rows (once per batch).
+    """
+    size = getattr(settings, "NOTIFICATION_BATCH_SIZE", 100)
+    chunks, current, total = [], [], 0
+    for email in _recipients(batch):
+        current.append(email)
+        total += 1
+        if len(current) >= size:
+            chunks.append(NotificationChunk(batch=batch, index=len(chunks), recipients=current))
+            current = []
+    if current:
+        chunks.append(NotificationChunk(batch=batch, index=len(chunks), recipients=current))
+    NotificationChunk.objects.bulk_create(chunks, batch_size=500)
+    NotificationBatch.objects.filter(pk=batch.pk).update(total=total)
+
+
+def _send_chunk(batch, chunk, conn=None):
+    recipients = chunk.recipients
+    position, sent = chunk.position, chunk.sent
+    error = ""
+    try:
+        # one connection for the whole chunk (or the caller's), one message per
+        # call: when the connection breaks we know exactly who already has the mail
+        with nullcontext(conn) if conn is not None else get_connection() as conn:
+            while position < len(recipients):
+                message = EmailMessage(batch.subject, batch.body, settings.DEFAULT_FROM_EMAIL, [recipients[position]])
+                try:
+                    sent += 1 if conn.send_messages([message]) else 0
+                except smtplib.SMTPRecipientsRefused:
+                    pass  # this address will never work; don't hold the rest of the chunk back for it
+                position += 1
+    except Exception:
+        error = traceback.format_exc()
+
+    refused = position - sent
+    failed = refused + (len(recipients) - position)
+    NotificationChunk.objects.filter(pk=chunk.pk).update(
+        status="failed" if error else "done", position=position, sent=sent, failed=failed, last_error=error
+    )
+    # deltas against the previous attempt: a resumed chunk moves its recipients from failed to sent
+    NotificationBatch.objects.filter(pk=batch.pk).update(
+        sent=F("sent") + (sent - chunk.sent), failed=F("failed") + (failed - chunk.failed)
+    )
+    return not error
+
+
+def _send_chunk_in_thread(batch, chunk):
+    try:
+        return _send_chunk(batch, chunk)
+    finally:
+        connection.close()  # each pool thread has its own DB connection
+
+
+def _deliver(batch, conn=None):
+    """
+    Send a batch's unfinished chunks; returns the number that failed. With
+    `conn`, the chunks go out one after another over that connection.
+    """
+    NotificationBatch.objects.filter(pk=batch.pk).update(status="sending")
+    if not batch.chunks.exists():
+        _materialize_chunks(batch)
+
+    # failed chunks from a previous attempt are retried; done chunks are skipped
+    pending = list(batch.chunks.exclude(status="done"))
+    workers = max(1, getattr(settings, "NOTIFICATION_MAX_CONNECTIONS", 4))
+    if conn is not None or workers == 1 or len(pending) <= 1:
+        results = [_send_chunk(batch, chunk, conn) for chunk in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda c: _send_chunk_in_thread(batch, c), pending))
+
+    failed = results.count(False)
+    if failed:
+        NotificationBatch.objects.filter(pk=batch.pk).update(status="failed")
+    else:
+        NotificationBatch.objects.filter(pk=batch.pk).update(status="done", finished_at=timezone.now())
+    return failed
+
+
+@task(max_attempts=3)
+def send_batch(batch_id):
+    batch = NotificationBatch.objects.filter(pk=batch_id).first()
+    if batch is None or batch.status == "done":
+        return
+    failed = _deliver(batch)
+    if failed:
+        # let the job queue retry the failed chunks with backoff
+        raise RuntimeError(f"{failed} chunks failed for batch {batch.pk}")
+
+
+@task(max_attempts=3)
+def send_group(group):
+    """
+    Send every unfinished batch of a group (one personal mail each) over a single connection.
+    """
+    batches = list(NotificationBatch.objects.filter(group=group).exclude(status="done").order_by("pk"))
+    with get_connection() as conn:
+        for batch in batches:
+            if _deliver(batch, conn):
+                # the connection is likely gone: leave the rest to the retry
+                raise RuntimeError(f"batch {batch.pk} of group {group} failed")
@@ -0,0 +1,116 @@
+import smtplib
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+
+from hallcore.tests.helpers import make_application
+from notifications.models import NotificationBatch
+from notifications.services import notify_application_statuses
+from notifications.tasks import send_batch, send_group
+
+RECIPIENTS = [f"r{i}@example.com" for i in range(5)]
+
+
+class FlakyBackend(EmailBackend):
+    """
+    locmem backend whose connection breaks before the `break_at`-th message,
+    and which refuses the addresses in `refused`.
+    """
+    break_at = None
+    refused = ()
+    calls = 0
+
+    def send_messages(self, messages):
+        type(self).calls += 1
+        if type(self).calls == self.break_at:
+            raise smtplib.SMTPServerDisconnected("connection dropped")
+        for message in messages:
+            if message.to[0] in self.refused:
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b"no such user")})
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND="notifications.tests.FlakyBackend", NOTIFICATION_BATCH_SIZE=10, NOTIFICATION_MAX_CONNECTIONS=1
+)
+class SendBatchTests(TestCase):
+    def setUp(self):
+        FlakyBackend.break_at, FlakyBackend.refused, FlakyBackend.calls = None, (), 0
+        self.batch = NotificationBatch.objects.create(
+            kind="test", subject="Hello", body="Body", recipients=RECIPIENTS, total=len(RECIPIENTS)
+        )
+
+    def delivered(self):
+        return [message.to[0] for message in mail.outbox]
+
+    def test_sends_every_recipient_once(self):
+        send_batch(self.batch.pk)
+        self.batch.refresh_from_db()
+        self.assertEqual(self.delivered(), RECIPIENTS)
+        self.assertEqual((self.batch.status, self.batch.sent, self.batch.failed), ("done", 5, 0))
+
+    def test_retry_resumes_after_the_last_delivered_recipient(self):
+        FlakyBackend.break_at = 3
+        with self.assertRaises(RuntimeError):
+            send_batch(self.batch.pk)
+        self.batch.refresh_from_db()
+        self.assertEqual(self.delivered(), RECIPIENTS[:2])
+        self.assertEqual((self.batch.status, self.batch.sent, self.batch.failed), ("failed", 2, 3))
+
+        send_batch(self.batch.pk)  # the job queue's retry
+        self.batch.refresh_from_db()
+        self.assertEqual(self.delivered(), RECIPIENTS)  # nobody got it twice
+        self.assertEqual((self.batch.status, self.batch.sent, self.batch.failed), ("done", 5, 0))
+        chunk = self.batch.chunks.get()
+        self.assertEqual((chunk.position, chunk.sent, chunk.failed, chunk.last_error), (5, 5, 0, ""))
+
+    def test_refused_recipient_does_not_block_the_rest(self):
+        FlakyBackend.refused = {RECIPIENTS[1]}
+        send_batch(self.batch.pk)
+        self.batch.refresh_from_db()
+        self.assertEqual(self.delivered(), RECIPIENTS[:1] + RECIPIENTS[2:])
+        self.assertEqual((self.batch.status, self.batch.sent, self.batch.failed), ("done", 4, 1))
+
+    @override_settings(NOTIFICATION_BATCH_SIZE=2)
+    def test_done_chunks_are_skipped_on_retry(self):
+        FlakyBackend.break_at = 4  # second message of the second chunk
+        with self.assertRaises(RuntimeError):
+            send_batch(self.batch.pk)
+        self.assertEqual(self.delivered(), RECIPIENTS[:3] + RECIPIENTS[4:])
+        send_batch(self.batch.pk)
+        self.batch.refresh_from_db()
+        self.assertEqual(sorted(self.delivered()), RECIPIENTS)
+        self.assertEqual((self.batch.sent, self.batch.failed), (5, 0))
+
+
+@override_settings(EMAIL_BACKEND="notifications.tests.FlakyBackend")
+class SendGroupTests(TestCase):
+    def setUp(self):
+        FlakyBackend.break_at, FlakyBackend.refused, FlakyBackend.calls = None, (), 0
+        self.apps = [make_application(i, status="Approved") for i in range(3)]
+
+    def test_personal_mails_over_one_connection(self):
+        self.assertEqual(notify_application_statuses(self.apps), 3)
+        group = NotificationBatch.objects.first().group
+        with mock.patch.object(FlakyBackend, "open", autospec=True, side_effect=EmailBackend.open) as opened:
+            send_group(str(group))
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual([m.to[0] for m in mail.outbox], [a.email for a in self.apps])
+        self.assertIn(self.apps[1].student_id, mail.outbox[1].body)
+        self.assertFalse(NotificationBatch.objects.exclude(status="done").exists())
+
+    def test_retry_sends_only_the_unfinished_batches(self):
+        notify_application_statuses(self.apps)
+        group = str(NotificationBatch.objects.first().group)
+        FlakyBackend.break_at = 2
+        with self.assertRaises(RuntimeError):
+            send_group(group)
+        send_group(group)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(a.email for a in self.apps))
+
+    def test_applications_without_email_are_skipped(self):
+        self.apps[0].email = ""
+        self.assertEqual(notify_application_statuses(self.apps), 2)
+        self.assertEqual(notify_application_statuses(self.apps[:1]), 0)
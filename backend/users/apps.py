@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from django.db.models.signals import post_delete
+
+        from . import rooms
+        from .models import Student
+
+        post_delete.connect(rooms.record_delete, sender=Student, dispatch_uid="users.rooms.record_delete")
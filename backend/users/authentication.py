@@ -0,0 +1,127 @@
+# backend/users/authentication.py
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .revocation import revoked_tokens
+
+# Claims embedded at issue time so read-only requests can authorize without the User row
+USER_CLAIMS = ("role", "is_verified", "is_staff")
+
+
+def add_user_claims(token, user):
+    """
+    Copy authorization-relevant user fields into a (refresh) token.
+    Access tokens derived from it via `.access_token` inherit the claims.
+    """
+    token["role"] = getattr(user, "role", "student") or "student"
+    token["is_verified"] = bool(getattr(user, "is_verified", False))
+    token["is_staff"] = bool(user.is_staff)
+    return token
+
+
+class _VerifiedTokenCache:
+    """
+    Small in-process LRU of raw JWT -> validated token.
+
+    An entry lives for at most `ttl` seconds and never past the token's own
+    `exp`, so a hit is exactly as trustworthy as re-verifying the signature.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, raw_token):
+        with self._lock:
+            entry = self._data.get(raw_token)
+            if entry is None:
+                return None
+            expires_at, token = entry
+            if expires_at <= time.time():
+                del self._data[raw_token]
+                return None
+            self._data.move_to_end(raw_token)
+            return token
+
+    def set(self, raw_token, token):
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        expires_at = min(time.time() + self.ttl, token.get("exp", 0))
+        with self._lock:
+            self._data[raw_token] = (expires_at, token)
+            self._data.move_to_end(raw_token)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+verified_tokens = _VerifiedTokenCache(
+    maxsize=getattr(settings, "JWT_VERIFIED_TOKEN_CACHE_SIZE", 4096),
+    ttl=getattr(settings, "JWT_VERIFIED_TOKEN_CACHE_TTL", 60),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    SimpleJWT authentication with a verified-token cache in front of the
+    signature check. Still loads the User row (use for endpoints that need it).
+    Revocation (the token's jti, or all of its user's tokens) is checked on
+    every request, cache hit or not.
+    """
+
+    def get_validated_token(self, raw_token):
+        token = verified_tokens.get(raw_token)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            verified_tokens.set(raw_token, token)
+        if revoked_tokens.is_token_revoked(token):
+            raise InvalidToken(_("Token has been revoked"))
+        return token
+
+
+class ClaimsJWTAuthentication(CachedJWTAuthentication):
+    """
+    Stateless mode: on safe (read-only) requests the user is a TokenUser built
+    from the token claims (role / is_verified / is_staff) - no DB hit.
+    Writes, and tokens issued before the claims existed, fall back to the
+    regular User lookup. Claims can't go stale for long: deactivating a user
+    or changing their role / staff flag revokes their tokens (User.save),
+    and every refresh re-issues the claims from the DB.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        if (
+            getattr(settings, "JWT_STATELESS_READS", True)
+            and request.method in SAFE_METHODS
+            and all(claim in validated_token for claim in USER_CLAIMS)
+        ):
+            return self.get_token_user(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_token_user(self, validated_token):
+        if jwt_settings.USER_ID_CLAIM not in validated_token:
+            return self.get_user(validated_token)  # raises InvalidToken
+        return jwt_settings.TOKEN_USER_CLASS(validated_token)
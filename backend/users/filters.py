@@ -0,0 +1,16 @@
+# backend/users/filters.py
+import django_filters
+
+from .models import Student
+
+
+class StudentDirectoryFilter(django_filters.FilterSet):
+    # prefix matches only, so the student_id / full_name indexes are usable
+    student_id = django_filters.CharFilter(field_name="student_id", lookup_expr="istartswith")
+    name = django_filters.CharFilter(field_name="user__full_name", lookup_expr="istartswith")
+    # plain CharFilter: the generated ChoiceFilter breaks on django-filter 23.2 + Django 5
+    blood_group = django_filters.CharFilter()
+
+    class Meta:
+        model = Student
+        fields = ["department", "session", "room_no", "blood_group"]
@@ -0,0 +1,48 @@
+from django.test import Client
+
+from config.benchmark import BenchmarkCommand, measure
+
+
+class Command(BenchmarkCommand):
+    help = "Per-request cost (time + queries) of the auth endpoints: register, login, profile."
+
+    def run_benchmark(self, iterations, **options):
+        client = Client()
+        tokens = []
+
+        def register(i):
+            r = client.post(
+                "/api/users/auth/register/",
+                {
+                    "email": f"bench{i}@example.com", "password": "secret123", "full_name": f"Bench {i}",
+                    "student_id": f"B{i:06d}", "department": "CSE",
+                },
+                content_type="application/json",
+            )
+            assert r.status_code == 201, r.content
+            tokens.append(r.json()["access"])
+
+        def register_duplicate(i):
+            r = client.post(
+                "/api/users/auth/register/",
+                {"email": f"bench{i}@example.com", "password": "secret123", "full_name": f"Bench {i}"},
+                content_type="application/json",
+            )
+            assert r.status_code == 400, r.content
+
+        def login(i):
+            r = client.post(
+                "/api/users/auth/login/",
+                {"email": f"bench{i}@example.com", "password": "secret123"},
+                content_type="application/json",
+            )
+            assert r.status_code == 200, r.content
+
+        def profile(i):
+            r = client.get("/api/users/auth/profile/", HTTP_AUTHORIZATION=f"Bearer {tokens[i]}")
+            assert r.status_code == 200, r.content
+
+        self.report(measure("POST auth/register/", register, iterations))
+        self.report(measure("POST auth/register/ (dup)", register_duplicate, iterations))
+        self.report(measure("POST auth/login/", login, iterations))
+        self.report(measure("GET  auth/profile/", profile, iterations))
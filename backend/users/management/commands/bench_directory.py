@@ -0,0 +1,77 @@
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import CommandError
+from django.test import Client
+
+from config.benchmark import BenchmarkCommand, measure, positive_int
+from users.models import Student, User
+from users.services import issue_tokens
+from users.views import StudentDirectoryPagination
+
+DEPARTMENTS = ["CSE", "EEE", "ME", "CE", "ChE", "IPE", "BME", "Math", "Physics", "Chemistry"]
+SESSIONS = [f"20{y}-{y + 1}" for y in range(15, 25)]
+BLOOD_GROUPS = ["A+", "A-", "B+", "B-", "AB+", "AB-", "O+", "O-"]
+QUERY_BUDGET = 2  # COUNT + page (auth is claims-only on GET)
+
+
+class Command(BenchmarkCommand):
+    help = "Student directory search latency and query count against a large table (default 100k students)."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--rows", type=positive_int, default=100_000)
+        parser.add_argument(
+            "--page", type=positive_int, default=None,
+            help="Page of the unfiltered listing to time (default: 20, or the last page if there are fewer).",
+        )
+
+    def check_options(self, rows, page, **options):
+        pages = -(-rows // StudentDirectoryPagination.page_size)
+        if page is not None and page > pages:
+            raise CommandError(f"--page {page} is past the last page ({pages}) of {rows:,} seeded students")
+
+    def run_benchmark(self, iterations, rows, page, **options):
+        page = page or min(20, -(-rows // StudentDirectoryPagination.page_size))
+        start = time.perf_counter()
+        password = make_password("unused")
+        for offset in range(0, rows, 5000):
+            users = User.objects.bulk_create([
+                User(
+                    email=f"s{i}@example.com", username=f"s{i}@example.com", password=password,
+                    full_name=f"{['Rahim', 'Karim', 'Nusrat', 'Tasnim', 'Arif'][i % 5]} {i}", role="student",
+                )
+                for i in range(offset, min(offset + 5000, rows))
+            ])
+            Student.objects.bulk_create([
+                Student(
+                    user=u, student_id=f"{190000000 + i}", department=DEPARTMENTS[i % 10],
+                    session=SESSIONS[(i // 10) % 10], room_no=100 + i % 400, blood_group=BLOOD_GROUPS[i % 8],
+                    mobile_number="01700000000",
+                )
+                for i, u in zip(range(offset, offset + 5000), users)
+            ])
+        self.stdout.write(f"seeded {rows:,} students in {time.perf_counter() - start:.1f}s")
+
+        admin = User.objects.create(email="admin@example.com", username="admin@example.com", role="admin", is_staff=True)
+        access, _ = issue_tokens(admin)
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {access}")
+        client.get("/api/users/students/")  # warm-up: loads the revocation list once
+
+        searches = {
+            "department + session": "department=CSE&session=2019-20",
+            "room_no": "room_no=214",
+            "blood_group": "blood_group=O-",
+            "student_id prefix": "student_id=19000123",
+            "name prefix": "name=Nusrat 77",
+            f"unfiltered page {page}": f"page={page}",
+        }
+        for label, qs in searches.items():
+            def search(i, qs=qs):
+                r = client.get(f"/api/users/students/?{qs}")
+                assert r.status_code == 200, r.content
+
+            timing = measure(label, search, iterations)
+            self.report(timing)
+            if timing.queries > QUERY_BUDGET:
+                self.stderr.write(f"  over budget: {timing.queries:g} > {QUERY_BUDGET} queries")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from users import rooms
+from users.models import RoomOccupancy
+
+
+class Command(BaseCommand):
+    help = "Recompute the RoomOccupancy counters from Student.room_no."
+
+    def handle(self, *args, **options):
+        rooms.rebuild()
+        occupied = RoomOccupancy.objects.filter(occupants__gt=0).count()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt room occupancy: {occupied} occupied rooms"))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:27
+
+from django.db import migrations, models
+
+from config.migration_ops import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_revokedtoken'),
+    ]
+
+    operations = [
+        AddIndexOnline(
+            model_name='student',
+            index=models.Index(fields=['department', 'session'], name='users_stud_dept_session_idx'),
+        ),
+        AddIndexOnline(
+            model_name='student',
+            index=models.Index(fields=['room_no'], name='users_stud_room_no_idx'),
+        ),
+        AddIndexOnline(
+            model_name='student',
+            index=models.Index(fields=['blood_group'], name='users_stud_blood_group_idx'),
+        ),
+        AddIndexOnline(
+            model_name='user',
+            index=models.Index(fields=['full_name'], name='users_user_full_name_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:31
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_occupancy(apps, schema_editor):
+    Student = apps.get_model("users", "Student")
+    RoomOccupancy = apps.get_model("users", "RoomOccupancy")
+    rows = Student.objects.exclude(room_no=0).values("room_no").annotate(n=Count("id")).order_by()
+    RoomOccupancy.objects.bulk_create(
+        [RoomOccupancy(room_no=r["room_no"], occupants=r["n"]) for r in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_directory_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('room_no', models.IntegerField(unique=True)),
+                ('occupants', models.IntegerField(db_index=True, default=0)),
+            ],
+            options={
+                'ordering': ['room_no'],
+            },
+        ),
+        migrations.RunPython(build_occupancy, migrations.RunPython.noop),
+    ]
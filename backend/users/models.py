@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser, Group, Permission
 
 # Custom User model
@@ -25,6 +25,36 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'role']
 
+    # Fields whose change invalidates every token already issued to the user
+    # (their claims, or the account itself, no longer hold); see users.revocation
+    TOKEN_FIELDS = ("is_active", "role", "is_staff")
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["full_name"], name="users_user_full_name_idx"),  # directory prefix search
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user._loaded_token_fields = user._token_fields()
+        return user
+
+    def _token_fields(self):
+        # deferred fields are left out: they weren't loaded, so they can't have been changed
+        return {name: self.__dict__[name] for name in self.TOKEN_FIELDS if name in self.__dict__}
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        loaded = getattr(self, "_loaded_token_fields", None)
+        current = self._token_fields()
+        if loaded and any(loaded[name] != current.get(name, loaded[name]) for name in loaded):
+            from .revocation import revoked_tokens
+
+            pk = self.pk
+            transaction.on_commit(lambda: revoked_tokens.revoke_user(pk))
+        self._loaded_token_fields = current
+
     def __str__(self):
         return self.email
 
@@ -49,6 +79,14 @@ class Student(models.Model):
     address = models.TextField(blank=True)
     photo_url = models.ImageField(upload_to='profile_photos/', null=True, blank=True)
 
+    class Meta:
+        # student directory filters (users.filters.StudentDirectoryFilter)
+        indexes = [
+            models.Index(fields=["department", "session"], name="users_stud_dept_session_idx"),
+            models.Index(fields=["room_no"], name="users_stud_room_no_idx"),
+            models.Index(fields=["blood_group"], name="users_stud_blood_group_idx"),
+        ]
+
     def is_profile_complete(self):
         """Check if all required profile fields are filled"""
         required_fields = [
@@ -59,3 +97,37 @@ class Student(models.Model):
 
     def __str__(self):
         return f"{self.user.email} - {self.student_id}"
+
+
+# Revoked JWTs (logout). Read through users.revocation, not directly.
+class RevokedToken(models.Model):
+    jti = models.CharField(max_length=64, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.jti} (until {self.expires_at})"
+
+
+# Per-room occupant counts, kept in step with Student.room_no by users.rooms
+class RoomOccupancy(models.Model):
+    room_no = models.IntegerField(unique=True)
+    occupants = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        ordering = ["room_no"]
+
+    def __str__(self):
+        return f"Room {self.room_no}: {self.occupants}"
+
+
+# "Every token of this user issued up to revoked_at is revoked": written when
+# the account is deactivated or its role / staff flag changes. Read through
+# users.revocation, not directly.
+class UserTokenRevocation(models.Model):
+    user_id = models.BigIntegerField(db_index=True)
+    revoked_at = models.DateTimeField(db_index=True)
+    expires_at = models.DateTimeField(db_index=True)  # no token issued before revoked_at outlives this
+
+    def __str__(self):
+        return f"user {self.user_id}: tokens up to {self.revoked_at}"
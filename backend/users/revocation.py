@@ -0,0 +1,168 @@
+# backend/users/revocation.py
+"""
+Server-side JWT revocation.
+
+Revoked jti's are persisted in `RevokedToken` and mirrored in a per-process
+set of 64-bit jti hashes (-> token exp), so `is_revoked()` is an O(1) dict
+lookup. Each process rebuilds the set from the DB on first use and then
+pulls only newly revoked rows every JWT_REVOCATION_SYNC_INTERVAL seconds;
+entries drop out once the token would have expired anyway (at most
+REFRESH_TOKEN_LIFETIME).
+
+revoke_user() revokes every token issued to a user so far (deactivation,
+role or staff changes; see User.save). It stores one
+`UserTokenRevocation` cutoff per event, mirrored per process as
+user id -> cutoff time, and tokens whose `iat` isn't after the cutoff are
+refused. Those rows are synced the same way as the jti's.
+"""
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+
+def _key(jti):
+    return int.from_bytes(hashlib.blake2b(jti.encode(), digest_size=8).digest(), "big")
+
+
+def _user_key(user_id):
+    # the claim is a string or an int depending on how the token was built
+    return str(user_id)
+
+
+class RevocationList:
+    def __init__(self, sync_interval):
+        self.sync_interval = sync_interval
+        self._entries = {}      # jti hash -> exp (unix time)
+        self._users = {}        # user id -> (cutoff, exp) (unix times)
+        self._lock = threading.Lock()
+        self._watermark = None  # newest revoked_at seen in the DB
+        self._user_watermark = None
+        self._next_sync = 0.0
+
+    # -- queries ---------------------------------------------------------
+    def is_revoked(self, jti):
+        if not jti:
+            return False
+        self._maybe_sync()
+        exp = self._entries.get(_key(jti))
+        return exp is not None and exp > time.time()
+
+    def is_token_revoked(self, token):
+        """
+        The token's own jti is revoked, or it was issued before a revoke_user() for its user.
+        """
+        if self.is_revoked(token.get("jti")):
+            return True
+        user_id = token.get(jwt_settings.USER_ID_CLAIM)
+        entry = self._users.get(_user_key(user_id)) if user_id is not None else None
+        if entry is None:
+            return False
+        cutoff, exp = entry
+        # iat has whole-second resolution: a token from the revocation's own second is refused too
+        return exp > time.time() and token.get("iat", 0) <= cutoff
+
+    # -- writes ----------------------------------------------------------
+    def revoke(self, jti, exp):
+        """
+        Revoke a jti until `exp` (unix time). Idempotent.
+        """
+        from .models import RevokedToken
+
+        now = timezone.now()
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=datetime.fromtimestamp(exp, tz=dt_timezone.utc))],
+            ignore_conflicts=True,
+        )
+        # Rows past their exp can't authenticate anything; keep the table small
+        RevokedToken.objects.filter(expires_at__lte=now).delete()
+        with self._lock:
+            self._entries[_key(jti)] = exp
+
+    def revoke_token(self, token):
+        self.revoke(token["jti"], token["exp"])
+
+    def revoke_user(self, user_id):
+        """
+        Revoke every token issued to `user_id` up to now.
+        """
+        from .models import UserTokenRevocation
+
+        now = timezone.now()
+        expires_at = now + jwt_settings.REFRESH_TOKEN_LIFETIME
+        UserTokenRevocation.objects.create(user_id=user_id, revoked_at=now, expires_at=expires_at)
+        UserTokenRevocation.objects.filter(expires_at__lte=now).delete()
+        with self._lock:
+            self._add_user(self._users, user_id, now.timestamp(), expires_at.timestamp())
+
+    # -- sync ------------------------------------------------------------
+    def rebuild(self):
+        from .models import RevokedToken, UserTokenRevocation
+
+        now = timezone.now()
+        rows = RevokedToken.objects.filter(expires_at__gt=now).values_list("jti", "expires_at", "revoked_at")
+        entries, watermark = {}, None
+        for jti, expires_at, revoked_at in rows.iterator():
+            entries[_key(jti)] = expires_at.timestamp()
+            if watermark is None or revoked_at > watermark:
+                watermark = revoked_at
+        users, user_watermark = {}, None
+        user_rows = UserTokenRevocation.objects.filter(expires_at__gt=now).values_list(
+            "user_id", "revoked_at", "expires_at"
+        )
+        for user_id, revoked_at, expires_at in user_rows.iterator():
+            self._add_user(users, user_id, revoked_at.timestamp(), expires_at.timestamp())
+            if user_watermark is None or revoked_at > user_watermark:
+                user_watermark = revoked_at
+        with self._lock:
+            self._entries = entries
+            self._users = users
+            self._watermark = watermark
+            self._user_watermark = user_watermark
+            self._next_sync = time.monotonic() + self.sync_interval
+
+    @staticmethod
+    def _add_user(users, user_id, cutoff, exp):
+        key = _user_key(user_id)
+        old = users.get(key)
+        if old is None or cutoff > old[0]:
+            users[key] = (cutoff, exp)
+
+    def _maybe_sync(self):
+        if time.monotonic() < self._next_sync:
+            return
+        if self._watermark is None and self._user_watermark is None:
+            self.rebuild()
+            return
+
+        from .models import RevokedToken, UserTokenRevocation
+
+        rows = RevokedToken.objects.values_list("jti", "expires_at", "revoked_at")
+        if self._watermark is not None:
+            rows = rows.filter(revoked_at__gte=self._watermark)
+        rows = list(rows)
+        user_rows = UserTokenRevocation.objects.values_list("user_id", "revoked_at", "expires_at")
+        if self._user_watermark is not None:
+            user_rows = user_rows.filter(revoked_at__gte=self._user_watermark)
+        user_rows = list(user_rows)
+        now = time.time()
+        with self._lock:
+            for jti, expires_at, revoked_at in rows:
+                self._entries[_key(jti)] = expires_at.timestamp()
+                self._watermark = max(self._watermark or revoked_at, revoked_at)
+            for user_id, revoked_at, expires_at in user_rows:
+                self._add_user(self._users, user_id, revoked_at.timestamp(), expires_at.timestamp())
+                self._user_watermark = max(self._user_watermark or revoked_at, revoked_at)
+            # TTL eviction
+            for key in [k for k, exp in self._entries.items() if exp <= now]:
+                del self._entries[key]
+            for key in [k for k, (_, exp) in self._users.items() if exp <= now]:
+                del self._users[key]
+            self._next_sync = time.monotonic() + self.sync_interval
+
+
+revoked_tokens = RevocationList(sync_interval=getattr(settings, "JWT_REVOCATION_SYNC_INTERVAL", 10))
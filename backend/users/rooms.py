@@ -0,0 +1,127 @@
+# backend/users/rooms.py
+"""
+Room occupancy read model.
+
+RoomOccupancy keeps one row per room with its occupant count; member lists
+come from the indexed Student.room_no column. Profile views call
+record_move() in the same transaction as the Student save, whenever room_no
+changes. Deletes can come from anywhere (the admin, a cascading User delete),
+so those are caught by record_delete(), a post_delete receiver connected in
+UsersConfig.ready(). Room 0 means "not assigned" and is not tracked.
+
+Responses are cached for ROOM_CACHE_TTL seconds and invalidated on commit.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import RoomOccupancy, Student
+
+LIST_KEY = "rooms:list"
+
+
+def room_key(room_no):
+    return f"rooms:{room_no}"
+
+
+def capacity():
+    return getattr(settings, "HALL_ROOM_CAPACITY", 4)
+
+
+def cache_ttl():
+    return getattr(settings, "ROOM_CACHE_TTL", 60)
+
+
+def _bump(room_no, delta):
+    if not room_no:
+        return
+    if RoomOccupancy.objects.filter(room_no=room_no).update(occupants=F("occupants") + delta):
+        return
+    try:
+        with transaction.atomic():
+            RoomOccupancy.objects.create(room_no=room_no, occupants=delta)
+    except IntegrityError:
+        RoomOccupancy.objects.filter(room_no=room_no).update(occupants=F("occupants") + delta)
+
+
+def _invalidate(*room_nos):
+    keys = [LIST_KEY] + [room_key(n) for n in room_nos if n]
+    # after commit, so a concurrent reader can't re-cache the pre-move state
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def record_move(old_room, new_room):
+    old_room, new_room = old_room or 0, new_room or 0
+    if old_room == new_room:
+        return
+    _bump(old_room, -1)
+    _bump(new_room, 1)
+    _invalidate(old_room, new_room)
+
+
+def record_delete(sender, instance, **kwargs):
+    # post_delete runs inside the delete's transaction, like record_move
+    record_move(instance.room_no, 0)
+
+
+def rebuild():
+    counts = (
+        Student.objects.exclude(room_no=0)
+        .values("room_no")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        stale = set(RoomOccupancy.objects.values_list("room_no", flat=True))
+        RoomOccupancy.objects.all().delete()
+        RoomOccupancy.objects.bulk_create(
+            [RoomOccupancy(room_no=r["room_no"], occupants=r["n"]) for r in counts],
+            batch_size=500,
+        )
+        _invalidate(*stale, *(r["room_no"] for r in counts))
+
+
+def _room_payload(room_no, occupants):
+    return {
+        "room_no": room_no,
+        "occupants": occupants,
+        "capacity": capacity(),
+        "free_beds": max(capacity() - occupants, 0),
+    }
+
+
+def room_list():
+    data = cache.get(LIST_KEY)
+    if data is None:
+        data = [
+            _room_payload(room_no, occupants)
+            for room_no, occupants in RoomOccupancy.objects.filter(occupants__gt=0).values_list("room_no", "occupants")
+        ]
+        cache.set(LIST_KEY, data, cache_ttl())
+    return data
+
+
+def room_detail(room_no):
+    key = room_key(room_no)
+    data = cache.get(key)
+    if data is None:
+        members = list(
+            Student.objects.filter(room_no=room_no)
+            .select_related("user")
+            .order_by("student_id")
+            .values("student_id", "department", "session", "mobile_number", "user__full_name")
+        )
+        data = _room_payload(room_no, len(members))
+        data["members"] = [
+            {
+                "student_id": m["student_id"],
+                "full_name": m["user__full_name"],
+                "department": m["department"],
+                "session": m["session"],
+                "mobile_number": m["mobile_number"],
+            }
+            for m in members
+        ]
+        cache.set(key, data, cache_ttl())
+    return data
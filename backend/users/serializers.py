@@ -1,6 +1,7 @@
 # backend/users/serializers.py
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from config.serializers import CachedFieldsMixin
 from .models import Student
 
 User = get_user_model()
@@ -8,7 +9,7 @@ User = get_user_model()
 # -----------------------------
 # User registration / base serializer
 # -----------------------------
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     email = serializers.EmailField(required=True)
     password = serializers.CharField(write_only=True, min_length=6)
     full_name = serializers.CharField(required=True)
@@ -20,10 +21,9 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ["email", "password", "full_name", "role"]
 
     def validate_email(self, value: str):
-        value = (value or "").strip().lower()
-        if User.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
+        # Uniqueness is enforced by the DB constraint at INSERT time
+        # (see users.services.register_user), not with a pre-check query.
+        return (value or "").strip().lower()
 
     def create(self, validated_data):
         """
@@ -32,6 +32,8 @@ class UserSerializer(serializers.ModelSerializer):
         - username = email
         - hashed password
         - role defaulted to 'student' if not provided
+        - optional student_id / department passed via save(...)
+        - password_hash passed via save(...) skips hashing here
         """
         email = validated_data["email"].lower()
         password = validated_data["password"]
@@ -43,9 +45,14 @@ class UserSerializer(serializers.ModelSerializer):
             username=email,   # Use email as username
             full_name=full_name,
             role=role,
+            student_id=validated_data.get("student_id", ""),
+            department=validated_data.get("department", ""),
             is_active=True,
         )
-        user.set_password(password)
+        if validated_data.get("password_hash"):
+            user.password = validated_data["password_hash"]
+        else:
+            user.set_password(password)
         user.save()
         return user
 
@@ -53,7 +60,7 @@ class UserSerializer(serializers.ModelSerializer):
 # -----------------------------
 # Student profile serializer
 # -----------------------------
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         # 'user' is NOT required in fields because we pass it in views via save(user=request.user)
@@ -79,10 +86,37 @@ class StudentSerializer(serializers.ModelSerializer):
         return value
 
 
+# -----------------------------
+# Student directory (admin search)
+# -----------------------------
+class StudentDirectorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    full_name = serializers.CharField(source="user.full_name", read_only=True)
+    email = serializers.EmailField(source="user.email", read_only=True)
+
+    class Meta:
+        model = Student
+        fields = [
+            "id",
+            "student_id",
+            "full_name",
+            "email",
+            "department",
+            "session",
+            "room_no",
+            "blood_group",
+            "mobile_number",
+            "emergency_number",
+        ]
+
+
 # -----------------------------
 # SimpleJWT: email OR username login
 # -----------------------------
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from .authentication import add_user_claims
+from .revocation import revoked_tokens
 
 class EmailOrUsernameTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
@@ -90,6 +124,11 @@ class EmailOrUsernameTokenObtainPairSerializer(TokenObtainPairSerializer):
       { "email": "...", "password": "..." }  OR
       { "username": "...", "password": "..." }
     """
+    @classmethod
+    def get_token(cls, user):
+        # role / is_verified / is_staff claims for stateless reads
+        return add_user_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         # SimpleJWT puts identifier in "username"
         identifier = attrs.get("username")
@@ -111,3 +150,30 @@ class EmailOrUsernameTokenObtainPairSerializer(TokenObtainPairSerializer):
                 pass
 
         return super().validate(attrs)
+
+
+class RevocationCheckingTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    TokenRefreshSerializer that refuses revoked refresh tokens (logout, or
+    all of a user's tokens) and inactive users, and copies the user's current
+    role / is_verified / is_staff into the new access token instead of the
+    claims frozen at login. Wired via SIMPLE_JWT["TOKEN_REFRESH_SERIALIZER"].
+    """
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if revoked_tokens.is_token_revoked(refresh):
+            raise InvalidToken("Token has been revoked")
+        user = User.objects.filter(pk=refresh.get(jwt_settings.USER_ID_CLAIM), is_active=True).first()
+        if user is None:
+            raise InvalidToken("User is inactive or deleted")
+        add_user_claims(refresh, user)
+
+        data = {"access": str(refresh.access_token)}
+        if jwt_settings.ROTATE_REFRESH_TOKENS:
+            if jwt_settings.BLACKLIST_AFTER_ROTATION:
+                revoked_tokens.revoke_token(refresh)
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
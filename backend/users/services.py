@@ -0,0 +1,175 @@
+# backend/users/services.py
+"""
+Auth service layer shared by the users views.
+
+One code path per operation:
+  - login loads the user and the student profile in a single query
+  - register is one transaction with at most two INSERTs; duplicates are
+    detected from the unique constraints, and the password is hashed before
+    the transaction opens
+  - every endpoint builds its "user" block with `user_payload`
+  - GET profile is served from a per-user cache (config.cache); profile
+    writes invalidate it
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config.cache import get_or_compute, invalidate_on_commit
+from config.db_router import PRIMARY
+
+from .authentication import add_user_claims
+from .models import Student
+from .serializers import StudentSerializer, UserSerializer
+
+User = get_user_model()
+
+
+# -----------------------------
+# Tokens / response building
+# -----------------------------
+def issue_tokens(user):
+    """
+    Returns (access, refresh) as strings, with role/is_verified/is_staff claims.
+    """
+    refresh = add_user_claims(RefreshToken.for_user(user), user)
+    return str(refresh.access_token), str(refresh)
+
+
+def user_payload(user, *, with_ids=False):
+    data = {
+        "id": user.id,
+        "email": user.email,
+        "username": user.username,
+        "full_name": getattr(user, "full_name", ""),
+    }
+    if with_ids:
+        data["student_id"] = getattr(user, "student_id", "")
+        data["department"] = getattr(user, "department", "")
+    data["role"] = getattr(user, "role", "student")
+    data["is_verified"] = getattr(user, "is_verified", True)
+    return data
+
+
+def student_payload(student):
+    return StudentSerializer(student).data if student else None
+
+
+def cached_student(user):
+    """
+    The user's Student profile or None, using the select_related cache when present.
+    """
+    try:
+        return user.student
+    except Student.DoesNotExist:
+        return None
+
+
+@lru_cache(maxsize=None)
+def student_fields():
+    # names accepted by ?fields= / ?exclude= on the profile endpoint
+    return tuple(StudentSerializer().fields)
+
+
+def profile_payload(user):
+    return {"user": user_payload(user), "student": student_payload(cached_student(user))}
+
+
+# -----------------------------
+# Profile cache
+# -----------------------------
+def profile_cache_key(user_id):
+    return f"profile:{user_id}"
+
+
+def cached_profile(user_id):
+    """
+    profile_view's body (None if the user is missing/inactive), cached for PROFILE_CACHE_TTL.
+    """
+    def compute():
+        user = load_user(user_id)
+        if user is None:
+            # may just not have replicated yet
+            user = load_user(user_id, using=PRIMARY)
+        return profile_payload(user) if user is not None else None
+
+    return get_or_compute(profile_cache_key(user_id), compute, getattr(settings, "PROFILE_CACHE_TTL", 60))
+
+
+def invalidate_profile(user_id):
+    invalidate_on_commit(profile_cache_key(user_id))
+
+
+# -----------------------------
+# Operations
+# -----------------------------
+def load_user(user_id, *, using=None):
+    """
+    User + Student profile in one query. None if missing or inactive.
+    `using` forces a database alias instead of the router's choice.
+    """
+    users = User.objects.using(using) if using else User.objects
+    return users.select_related("student").filter(pk=user_id, is_active=True).first()
+
+
+def authenticate_credentials(email, password):
+    """
+    Email + password check. Returns the user (student profile preloaded) or None;
+    None for a deactivated account too, as with /api/token/.
+    """
+    user = User.objects.select_related("student").filter(email__iexact=email).first()
+    if user is None or not user.check_password(password) or not user.is_active:
+        return None
+    return user
+
+
+def _unique_violation_errors(exc, email, student_id):
+    """
+    Map a unique-constraint IntegrityError from register_user to field errors.
+
+    The error text is backend-specific (MySQL quotes the duplicate value and the
+    key name, not the column), so the conflicting rows are looked up instead. The
+    failed INSERT's transaction has rolled back by now; this only runs on conflict.
+    """
+    errors = {}
+    if student_id and Student.objects.filter(student_id=student_id).exists():
+        errors["student_id"] = ["A student with this student ID already exists."]
+    if User.objects.filter(Q(email=email) | Q(username=email)).exists():
+        errors["email"] = ["A user with this email already exists."]
+    if not errors:
+        raise exc
+    return errors
+
+
+def register_user(data):
+    """
+    Create a user (+ Student shell when student_id/department are given).
+    Returns (user, None) or (None, errors).
+    """
+    serializer = UserSerializer(data=data)
+    if not serializer.is_valid():
+        return None, serializer.errors
+
+    student_id = data.get("student_id")
+    department = data.get("department")
+
+    # PBKDF2 is the slow part of registration; keep it out of the transaction
+    password_hash = make_password(serializer.validated_data["password"])
+
+    try:
+        with transaction.atomic():
+            user = serializer.save(
+                password_hash=password_hash,
+                student_id=student_id if student_id is not None else "",
+                department=department if department is not None else "",
+            )
+            if student_id or department:
+                Student.objects.create(user=user, student_id=student_id or "", department=department or "")
+    except IntegrityError as exc:
+        return None, _unique_violation_errors(exc, serializer.validated_data["email"], student_id)
+    return user, None
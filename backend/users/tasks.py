@@ -0,0 +1,37 @@
+# backend/users/tasks.py
+from django.conf import settings
+
+from jobs.queue import task
+from .models import Student
+
+
+@task(max_attempts=3)
+def process_profile_photo(student_pk):
+    """
+    Downscale an uploaded profile photo in place (keeps name and format).
+    Runs in the job worker so the upload request returns immediately.
+    """
+    # Pillow is only needed here; don't pay for it when web workers start
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    student = Student.objects.filter(pk=student_pk).only("photo_url").first()
+    if student is None or not student.photo_url:
+        return
+
+    max_side = getattr(settings, "PROFILE_PHOTO_MAX_SIZE", 512)
+    with student.photo_url.open("rb") as fh:
+        try:
+            img = Image.open(fh)
+            img.load()
+        except UnidentifiedImageError:
+            return  # not an image Pillow can read; leave it as uploaded
+    fmt = img.format
+
+    if max(img.size) <= max_side:
+        return
+    img = ImageOps.exif_transpose(img)
+    img.thumbnail((max_side, max_side))
+    if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    with student.photo_url.storage.open(student.photo_url.name, "wb") as out:
+        img.save(out, format=fmt, optimize=True)
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from users.authentication import ClaimsJWTAuthentication, add_user_claims, verified_tokens
+from users.models import UserTokenRevocation
+from users.revocation import RevocationList, revoked_tokens
+
+User = get_user_model()
+
+DIRECTORY_URL = "/api/users/students/"
+REFRESH_URL = "/api/token/refresh/"
+
+
+def make_user(email, **fields):
+    return User.objects.create(email=email, username=email, **{"role": "student", **fields})
+
+
+def tokens(user):
+    refresh = add_user_claims(RefreshToken.for_user(user), user)
+    return str(refresh.access_token), str(refresh)
+
+
+class ClaimsAuthTests(TestCase):
+    def setUp(self):
+        revoked_tokens.rebuild()
+        verified_tokens.clear()
+        self.admin = make_user("admin@example.com", role="admin", is_staff=True)
+        self.access, self.refresh = tokens(self.admin)
+        self.client = APIClient()
+
+    def get_directory(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.get(DIRECTORY_URL)
+
+    def reload_admin(self):
+        # a fresh instance, as a view or the admin site would load it
+        return User.objects.get(pk=self.admin.pk)
+
+    def test_safe_request_authorizes_from_claims_without_a_query(self):
+        request = RequestFactory().get(DIRECTORY_URL, HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        with self.assertNumQueries(0):
+            user, token = ClaimsJWTAuthentication().authenticate(request)
+        self.assertTrue(user.is_staff)
+        self.assertEqual(token["role"], "admin")
+
+    def test_unsafe_request_loads_the_user(self):
+        request = RequestFactory().post(DIRECTORY_URL, HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        user, _ = ClaimsJWTAuthentication().authenticate(request)
+        self.assertIsInstance(user, User)
+
+    def test_deactivation_revokes_existing_tokens(self):
+        self.assertEqual(self.get_directory(self.access).status_code, 200)
+        admin = self.reload_admin()
+        admin.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.save()
+        self.assertEqual(self.get_directory(self.access).status_code, 401)
+        self.assertEqual(self.client.post(REFRESH_URL, {"refresh": self.refresh}).status_code, 401)
+
+    def test_demotion_revokes_existing_tokens(self):
+        admin = self.reload_admin()
+        admin.is_staff = False
+        admin.role = "student"
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.save()
+        self.assertEqual(self.get_directory(self.access).status_code, 401)
+        # tokens issued afterwards (the next second: iat has whole-second resolution) carry the new claims
+        UserTokenRevocation.objects.update(revoked_at=timezone.now() - timedelta(seconds=2))
+        revoked_tokens.rebuild()
+        access, _ = tokens(admin)
+        self.assertEqual(self.get_directory(access).status_code, 403)
+
+    def test_unrelated_changes_keep_tokens_valid(self):
+        admin = self.reload_admin()
+        admin.full_name = "Hall Admin"
+        admin.is_verified = True
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            admin.save()
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.get_directory(self.access).status_code, 200)
+
+    def test_refresh_reissues_claims_from_the_database(self):
+        User.objects.filter(pk=self.admin.pk).update(is_verified=True)
+        response = self.client.post(REFRESH_URL, {"refresh": self.refresh})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(AccessToken(self.access)["is_verified"])
+        self.assertTrue(AccessToken(response.json()["access"])["is_verified"])
+
+    def test_refresh_refuses_inactive_users(self):
+        # deactivated without going through User.save (e.g. a queryset update)
+        User.objects.filter(pk=self.admin.pk).update(is_active=False)
+        self.assertEqual(self.client.post(REFRESH_URL, {"refresh": self.refresh}).status_code, 401)
+
+    def test_user_revocation_reaches_other_processes(self):
+        other = RevocationList(sync_interval=0)
+        other.rebuild()
+        self.assertFalse(other.is_token_revoked(AccessToken(self.access)))
+        revoked_tokens.revoke_user(self.admin.pk)
+        self.assertTrue(other.is_token_revoked(AccessToken(self.access)))
@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from users.models import Student
+
+User = get_user_model()
+
+URL = "/api/users/students/"
+
+
+def make_student(student_id, full_name, **fields):
+    email = f"{student_id}@example.com"
+    user = User.objects.create_user(username=email, email=email, full_name=full_name)
+    return Student.objects.create(user=user, student_id=student_id, **{"department": "CSE", **fields})
+
+
+@override_settings(DATABASE_REPLICAS=[])
+class StudentDirectoryTests(TestCase):
+    def setUp(self):
+        make_student("S003", "Rahim Uddin", session="2023-24", room_no=101, blood_group="A+")
+        make_student("S001", "Karim Ali", session="2024-25", room_no=102, blood_group="O+")
+        make_student("S002", "Rahima Khatun", department="EEE", session="2024-25", room_no=101)
+        self.admin = User.objects.create_user(username="admin@example.com", email="admin@example.com", is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def search(self, **params):
+        response = self.client.get(URL, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [row["student_id"] for row in response.json()["results"]]
+
+    def test_admin_only(self):
+        self.assertEqual(APIClient().get(URL).status_code, 401)
+        client = APIClient()
+        client.force_authenticate(Student.objects.get(student_id="S001").user)
+        self.assertEqual(client.get(URL).status_code, 403)
+
+    def test_ordered_by_student_id_in_two_queries(self):
+        with self.assertNumQueries(2):  # COUNT + page; the user comes with select_related
+            response = self.client.get(URL)
+        body = response.json()
+        self.assertEqual(body["count"], 3)
+        self.assertEqual([row["student_id"] for row in body["results"]], ["S001", "S002", "S003"])
+        self.assertEqual(body["results"][0]["full_name"], "Karim Ali")
+        self.assertEqual(body["results"][0]["email"], "S001@example.com")
+
+    def test_prefix_search(self):
+        self.assertEqual(self.search(name="rahim"), ["S002", "S003"])
+        self.assertEqual(self.search(student_id="s00"), ["S001", "S002", "S003"])
+        self.assertEqual(self.search(name="uddin"), [])  # prefix only, not substring
+
+    def test_exact_filters_combine(self):
+        self.assertEqual(self.search(room_no=101), ["S002", "S003"])
+        self.assertEqual(self.search(session="2024-25", department="CSE"), ["S001"])
+        self.assertEqual(self.search(blood_group="A+"), ["S003"])
+
+    def test_page_size(self):
+        response = self.client.get(URL, {"page_size": 2, "page": 2}).json()
+        self.assertEqual([row["student_id"] for row in response["results"]], ["S003"])
+        self.assertIsNone(response["next"])
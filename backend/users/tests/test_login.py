@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from config.benchmark import FAST_HASHERS
+
+User = get_user_model()
+
+LOGIN_URL = "/api/users/auth/login/"
+TOKEN_URL = "/api/token/"
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=[])
+class LoginTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="s@example.com", email="s@example.com", password="pw-12345")
+
+    def login(self, password="pw-12345"):
+        return self.client.post(LOGIN_URL, {"email": "S@example.com", "password": password}, format="json")
+
+    def test_login_issues_tokens(self):
+        response = self.login()
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertIn("access", response.json())
+
+    def test_wrong_password_is_refused(self):
+        self.assertEqual(self.login("nope").status_code, 401)
+
+    def test_deactivated_user_is_refused_like_token_endpoint(self):
+        self.user.is_active = False
+        self.user.save()
+        response = self.login()
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn("access", response.json())
+        token = self.client.post(TOKEN_URL, {"email": "s@example.com", "password": "pw-12345"}, format="json")
+        self.assertEqual(token.status_code, 401)
+
+    def test_token_endpoint_shares_the_auth_throttle(self):
+        for _ in range(20):
+            self.assertEqual(self.login("nope").status_code, 401)
+        token = self.client.post(TOKEN_URL, {"email": "s@example.com", "password": "pw-12345"}, format="json")
+        self.assertEqual(token.status_code, 429)
+        # a different address still gets in; the bucket is per REMOTE_ADDR
+        token = self.client.post(
+            TOKEN_URL, {"email": "s@example.com", "password": "pw-12345"}, format="json", REMOTE_ADDR="10.0.0.2"
+        )
+        self.assertEqual(token.status_code, 200, token.content)
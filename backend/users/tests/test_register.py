@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from config.benchmark import FAST_HASHERS
+from users import services
+from users.models import Student
+
+User = get_user_model()
+
+REGISTER_URL = "/api/users/auth/register/"
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=[])
+class RegisterTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets
+        self.client = APIClient()
+
+    def register(self, email="s@example.com", student_id="S-1"):
+        return self.client.post(
+            REGISTER_URL,
+            {"email": email, "password": "pw-12345", "full_name": "S", "student_id": student_id, "department": "CSE"},
+            format="json",
+        )
+
+    def test_register_creates_user_and_student(self):
+        response = self.register()
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(Student.objects.filter(student_id="S-1", user__email="s@example.com").exists())
+
+    def test_duplicate_email_is_a_400(self):
+        self.register()
+        response = self.register(email="S@Example.com", student_id="S-2")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()), ["email"])
+        self.assertFalse(Student.objects.filter(student_id="S-2").exists())
+
+    def test_duplicate_student_id_is_a_400_and_rolls_back_the_user(self):
+        self.register()
+        response = self.register(email="t@example.com")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()), ["student_id"])
+        self.assertFalse(User.objects.filter(email="t@example.com").exists())
+
+
+class UniqueViolationErrorsTests(TestCase):
+    # MySQL reports the value and the key name, never a bare column name
+    MYSQL = IntegrityError(1062, "Duplicate entry 'taken@example.com' for key 'users_user.email'")
+
+    def test_maps_by_existing_row_not_by_message(self):
+        User.objects.create(username="taken@example.com", email="taken@example.com")
+        errors = services._unique_violation_errors(self.MYSQL, "taken@example.com", "")
+        self.assertEqual(list(errors), ["email"])
+
+    def test_unexplained_error_is_reraised(self):
+        with self.assertRaises(IntegrityError):
+            services._unique_violation_errors(self.MYSQL, "free@example.com", "S-9")
@@ -0,0 +1,68 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from config.benchmark import FAST_HASHERS
+from users.authentication import verified_tokens
+from users.models import RevokedToken
+from users.revocation import RevocationList, revoked_tokens
+
+User = get_user_model()
+
+
+# no replica routing: with HALL_SQLITE the test replica mirrors the in-memory primary through a second connection
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=[])
+class LogoutRevocationTests(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle buckets
+        revoked_tokens.rebuild()
+        verified_tokens.clear()
+        user = User(email="student@example.com", username="student@example.com", role="student")
+        user.set_password("pass12345")
+        user.save()
+        self.client = APIClient()
+        response = self.client.post(
+            "/api/users/auth/login/", {"email": "student@example.com", "password": "pass12345"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.access, self.refresh = response.json()["access"], response.json()["refresh"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access}")
+
+    def logout(self):
+        response = self.client.post("/api/users/auth/logout/", {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+    def test_logout_revokes_access_and_refresh_tokens(self):
+        self.assertEqual(self.client.get("/api/users/auth/profile/").status_code, 200)
+        self.logout()
+        self.assertEqual(self.client.get("/api/users/auth/profile/").status_code, 401)
+        refreshed = APIClient().post("/api/token/refresh/", {"refresh": self.refresh}, format="json")
+        self.assertEqual(refreshed.status_code, 401)
+        self.assertEqual(RevokedToken.objects.count(), 2)
+
+    def test_other_processes_pick_up_revocations(self):
+        other = RevocationList(sync_interval=0)
+        other.rebuild()
+        jti = AccessToken(self.access)["jti"]
+        self.assertFalse(other.is_revoked(jti))
+        self.logout()
+        self.assertTrue(other.is_revoked(jti))
+
+    def test_revoke_is_idempotent(self):
+        token = AccessToken(self.access)
+        revoked_tokens.revoke_token(token)
+        revoked_tokens.revoke_token(token)
+        self.assertEqual(RevokedToken.objects.count(), 1)
+
+    def test_expired_entries_are_pruned(self):
+        RevokedToken.objects.create(jti="old", expires_at=timezone.now() - timedelta(minutes=1))
+        revoked_tokens.revoke("new", time.time() + 60)
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["new"])
+        self.assertFalse(revoked_tokens.is_revoked("old"))
+        self.assertTrue(revoked_tokens.is_revoked("new"))
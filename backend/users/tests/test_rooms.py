@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from config.benchmark import FAST_HASHERS
+from users import rooms
+from users.models import RoomOccupancy, Student
+
+User = get_user_model()
+
+
+def occupancy():
+    return dict(RoomOccupancy.objects.filter(occupants__gt=0).values_list("room_no", "occupants"))
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS, DATABASE_REPLICAS=[], HALL_ROOM_CAPACITY=2)
+class RoomOccupancyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username="admin@example.com", email="admin@example.com", is_staff=True)
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.admin)
+        self.students = [self.make_student(i) for i in range(3)]
+
+    def make_student(self, i):
+        user = User.objects.create_user(username=f"s{i}@example.com", email=f"s{i}@example.com")
+        return Student.objects.create(user=user, student_id=f"S{i}", department="CSE")
+
+    def move(self, student, room_no):
+        client = APIClient()
+        client.force_authenticate(student.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.patch("/api/users/auth/profile/update/", {"room_no": room_no}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def room_list(self):
+        return {room["room_no"]: room for room in self.admin_client.get("/api/users/rooms/").json()["results"]}
+
+    def assertMatchesRebuild(self):
+        maintained = occupancy()
+        rooms.rebuild()
+        self.assertEqual(maintained, occupancy())
+
+    def test_moves_update_counts_and_cached_list(self):
+        self.move(self.students[0], 101)
+        self.move(self.students[1], 101)
+        self.assertEqual(self.room_list()[101]["free_beds"], 0)
+        self.move(self.students[1], 102)
+        self.assertEqual(occupancy(), {101: 1, 102: 1})
+        self.assertEqual(self.room_list()[101]["occupants"], 1)
+        self.assertMatchesRebuild()
+
+    def test_deleting_a_student_frees_the_bed(self):
+        self.move(self.students[0], 101)
+        self.move(self.students[1], 101)
+        self.assertEqual(self.room_list()[101]["occupants"], 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            Student.objects.get(pk=self.students[0].pk).delete()
+        self.assertEqual(self.room_list()[101]["occupants"], 1)
+        self.assertEqual(self.admin_client.get("/api/users/rooms/101/").json()["occupants"], 1)
+        self.assertMatchesRebuild()
+
+    def test_cascading_and_bulk_deletes_are_counted(self):
+        for student in self.students:
+            self.move(student, 101)
+        self.students[0].user.delete()
+        Student.objects.filter(pk=self.students[1].pk).delete()
+        self.assertEqual(occupancy(), {101: 1})
+        self.assertMatchesRebuild()
+
+    def test_unassigned_student_delete_changes_nothing(self):
+        self.move(self.students[0], 101)
+        self.students[2].delete()
+        self.assertEqual(occupancy(), {101: 1})
+
+    @override_settings(ROOM_CACHE_TTL=0)
+    def test_cache_ttl_comes_from_settings(self):
+        rooms.room_list()
+        self.assertIsNone(cache.get(rooms.LIST_KEY))
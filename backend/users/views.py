@@ -1,22 +1,47 @@
 # backend/users/views.py
-from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.db import transaction
+from rest_framework import generics, status
+from rest_framework.authtoken.models import Token
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
-from django.contrib.auth import get_user_model
-from .models import Student
-from .serializers import UserSerializer, StudentSerializer
 
 # JWT
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
-from .serializers import EmailOrUsernameTokenObtainPairSerializer  # make sure you added this as we discussed
 
-User = get_user_model()
+from config.db_router import pin_to_primary, replica_reads
+from config.fields import parse_selection, trim
+from config.throttling import scoped_throttle
+from jobs.queue import enqueue
+
+from . import rooms, services
+from .filters import StudentDirectoryFilter
+from .models import Student
+from .revocation import revoked_tokens
+from .serializers import StudentSerializer, StudentDirectorySerializer, EmailOrUsernameTokenObtainPairSerializer
+from .tasks import process_profile_photo
+
+
+def _save_student(serializer, **kwargs):
+    """
+    serializer.save() + room occupancy bookkeeping, in one transaction.
+    """
+    old_room = serializer.instance.room_no if serializer.instance is not None else 0
+    with transaction.atomic():
+        student = serializer.save(**kwargs)
+        rooms.record_move(old_room, student.room_no)
+        services.invalidate_profile(student.user_id)
+    return student
+
+
+def _enqueue_photo_processing(student, data):
+    # Resizing happens in the job worker; the request only stores the upload
+    if hasattr(data.get("photo_url"), "read"):
+        enqueue(process_profile_photo, student_pk=student.pk)
 
-def _jwt_for_user(user):
-    refresh = RefreshToken.for_user(user)
-    return str(refresh.access_token), str(refresh)
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
@@ -25,58 +50,33 @@ def simple_test_view(request):
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes([scoped_throttle("auth")])
 def register_view(request):
     """
     Register a new user.
     Expects: { email, password, full_name, role?, student_id?, department? }
     Returns: { message, access, refresh, user }
     """
-    data = request.data.copy()
-    serializer = UserSerializer(data=data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    user = serializer.save()
-
-    # Optional extras if your User model has these fields
-    for opt_field in ("student_id", "department"):
-        if hasattr(user, opt_field) and data.get(opt_field) is not None:
-            setattr(user, opt_field, data.get(opt_field))
-    user.save()
-
-    # Optional Student profile shell
-    if data.get("student_id") or data.get("department"):
-        Student.objects.get_or_create(
-            user=user,
-            defaults={
-                "student_id": data.get("student_id", ""),
-                "department": data.get("department", ""),
-            },
-        )
-
-    access, refresh = _jwt_for_user(user)
+    user, errors = services.register_user(request.data)
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
+    # the request is anonymous, so the middleware can't pin the new account itself
+    pin_to_primary(user.pk)
+    access, refresh = services.issue_tokens(user)
     return Response(
         {
             "message": "User registered successfully",
             "access": access,
             "refresh": refresh,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "student_id": getattr(user, "student_id", ""),
-                "department": getattr(user, "department", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
+            "user": services.user_payload(user, with_ids=True),
         },
         status=status.HTTP_201_CREATED,
     )
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes([scoped_throttle("auth")])
 def login_view(request):
     """
     Email + password login (JWT).
@@ -88,31 +88,17 @@ def login_view(request):
     if not email or not password:
         return Response({"error": "Email and password are required"}, status=400)
 
-    try:
-        user = User.objects.get(email__iexact=email)
-    except User.DoesNotExist:
-        return Response({"error": "Invalid credentials"}, status=401)
-
-    if not user.check_password(password):
+    user = services.authenticate_credentials(email, password)
+    if user is None:
         return Response({"error": "Invalid credentials"}, status=401)
 
-    access, refresh = _jwt_for_user(user)
-    student = Student.objects.filter(user=user).first()
-    student_data = StudentSerializer(student).data if student else None
-
+    access, refresh = services.issue_tokens(user)
     return Response(
         {
             "access": access,
             "refresh": refresh,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
-            "student": student_data,
+            "user": services.user_payload(user),
+            "student": services.student_payload(services.cached_student(user)),
         },
         status=200,
     )
@@ -121,177 +107,43 @@ def login_view(request):
 @permission_classes([IsAuthenticated])
 def logout_view(request):
     """
-    Stateless JWT doesn't need server-side logout.
-    Optional: add your own token blacklist if enabled.
-    """
-    return Response({"message": "Logged out (client should discard tokens)."}, status=200)
-
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def profile_view(request):
-    user = request.user
-    student = Student.objects.filter(user=user).first()
-    return Response(
-        {
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
-            "student": StudentSerializer(student).data if student else None,
-        },
-        status=200,
-    )
-
-
-# First complete_profile_view function removed - using the one below with proper logic
-
-
-# backend/users/views.py
-from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.response import Response
-from django.contrib.auth import get_user_model
-
-from .models import Student
-from .serializers import UserSerializer, StudentSerializer
-
-# JWT
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.views import TokenObtainPairView
-from .serializers import EmailOrUsernameTokenObtainPairSerializer  # ensure you added this in serializers.py
-
-User = get_user_model()
-
-def _jwt_for_user(user):
-    refresh = RefreshToken.for_user(user)
-    return str(refresh.access_token), str(refresh)
-
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def simple_test_view(request):
-    return Response({"message": "Simple test working!", "status": "ok"})
-
-@api_view(["POST"])
-@permission_classes([AllowAny])
-def register_view(request):
-    """
-    Register user; returns {access, refresh, user}
-    """
-    data = request.data.copy()
-    serializer = UserSerializer(data=data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-    user = serializer.save()
-
-    for opt_field in ("student_id", "department"):
-        if hasattr(user, opt_field) and data.get(opt_field) is not None:
-            setattr(user, opt_field, data.get(opt_field))
-    user.save()
-
-    if data.get("student_id") or data.get("department"):
-        Student.objects.get_or_create(
-            user=user,
-            defaults={
-                "student_id": data.get("student_id", ""),
-                "department": data.get("department", ""),
-            },
-        )
-
-    access, refresh = _jwt_for_user(user)
-
-    return Response(
-        {
-            "message": "User registered successfully",
-            "access": access,
-            "refresh": refresh,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "student_id": getattr(user, "student_id", ""),
-                "department": getattr(user, "department", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
-        },
-        status=status.HTTP_201_CREATED,
-    )
-
-@api_view(["POST"])
-@permission_classes([AllowAny])
-def login_view(request):
-    """
-    Email + password login; returns {access, refresh, user, student?}
+    Revoke the presented access token and, if sent, the refresh token.
+    Expects: { refresh? }
     """
-    email = (request.data.get("email") or "").strip().lower()
-    password = request.data.get("password") or ""
-    if not email or not password:
-        return Response({"error": "Email and password are required"}, status=400)
-
-    try:
-        user = User.objects.get(email__iexact=email)
-    except User.DoesNotExist:
-        return Response({"error": "Invalid credentials"}, status=401)
-
-    if not user.check_password(password):
-        return Response({"error": "Invalid credentials"}, status=401)
-
-    access, refresh = _jwt_for_user(user)
-    student = Student.objects.filter(user=user).first()
-    student_data = StudentSerializer(student).data if student else None
-
-    return Response(
-        {
-            "access": access,
-            "refresh": refresh,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
-            "student": student_data,
-        },
-        status=200,
-    )
-
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def logout_view(request):
-    # Stateless JWT: no server action needed
-    return Response({"message": "Logged out (discard tokens client-side)."}, status=200)
+    raw_refresh = request.data.get("refresh")
+    if raw_refresh:
+        try:
+            refresh = RefreshToken(raw_refresh)
+        except TokenError:
+            return Response({"error": "Invalid refresh token"}, status=400)
+        if str(refresh.get("user_id")) != str(request.user.pk):
+            return Response({"error": "Refresh token does not belong to this user"}, status=403)
+        revoked_tokens.revoke_token(refresh)
+
+    if isinstance(request.auth, Token):
+        request.auth.delete()
+    elif request.auth is not None and "jti" in request.auth:
+        revoked_tokens.revoke_token(request.auth)
+
+    return Response({"message": "Logged out"}, status=200)
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@replica_reads
 def profile_view(request):
-    user = request.user
-    student = Student.objects.filter(user=user).first()
-    return Response(
-        {
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "username": user.username,
-                "full_name": getattr(user, "full_name", ""),
-                "role": getattr(user, "role", "student"),
-                "is_verified": getattr(user, "is_verified", True),
-            },
-            "student": StudentSerializer(student).data if student else None,
-        },
-        status=200,
-    )
+    # request.user may be a claims-only TokenUser; cache misses load user + profile in one query
+    payload = services.cached_profile(request.user.pk)
+    if payload is None:
+        return Response({"error": "User not found"}, status=401)
+    # ?fields= / ?exclude= narrow the student block; the cached entry stays whole
+    keep = parse_selection(request.query_params, services.student_fields())
+    if keep is not None:
+        payload = {**payload, "student": trim(payload["student"], keep)}
+    return Response(payload, status=200)
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@throttle_classes([scoped_throttle("profile")])
 def complete_profile_view(request):
     user = request.user
     student = Student.objects.filter(user=user).first()
@@ -319,18 +171,20 @@ def complete_profile_view(request):
         # Profile exists, update it
         serializer = StudentSerializer(student, data=data, partial=True)
         if serializer.is_valid():
-            updated = serializer.save()
+            updated = _save_student(serializer)
+            _enqueue_photo_processing(updated, data)
             
             # Set user as verified if this is initial setup
             if is_initial_setup:
                 user.is_verified = True
-                user.save()
+                user.save(update_fields=["is_verified"])
+                services.invalidate_profile(user.pk)
                 message = "Profile completed successfully"
             else:
                 message = "Profile updated successfully"
             
             return Response(
-                {"success": True, "message": message, "student": StudentSerializer(updated).data},
+                {"success": True, "message": message, "student": serializer.data},
                 status=200,
             )
         return Response(serializer.errors, status=400)
@@ -340,20 +194,23 @@ def complete_profile_view(request):
         payload["user"] = user.id
         serializer = StudentSerializer(data=payload)
         if serializer.is_valid():
-            student = serializer.save(user=user)
+            student = _save_student(serializer, user=user)
+            _enqueue_photo_processing(student, data)
             
             # Mark user as verified after successful profile creation
             user.is_verified = True
-            user.save()
+            user.save(update_fields=["is_verified"])
+            services.invalidate_profile(user.pk)
             
             return Response(
-                {"success": True, "message": "Profile completed successfully", "student": StudentSerializer(student).data},
+                {"success": True, "message": "Profile completed successfully", "student": serializer.data},
                 status=200,
             )
         return Response(serializer.errors, status=400)
 
 @api_view(["PUT", "PATCH"])
 @permission_classes([IsAuthenticated])
+@throttle_classes([scoped_throttle("profile")])
 def update_profile_view(request):
     user = request.user
     student = Student.objects.filter(user=user).first()
@@ -362,34 +219,59 @@ def update_profile_view(request):
 
     serializer = StudentSerializer(student, data=request.data, partial=True)
     if serializer.is_valid():
-        updated = serializer.save()
+        updated = _save_student(serializer)
+        _enqueue_photo_processing(updated, request.data)
         return Response(
-            {"message": "Profile updated successfully", "student": StudentSerializer(updated).data},
+            {"message": "Profile updated successfully", "student": serializer.data},
             status=200,
         )
     return Response(serializer.errors, status=400)
 
-class EmailOrUsernameTokenObtainPairView(TokenObtainPairView):
-    serializer_class = EmailOrUsernameTokenObtainPairSerializer
-
+class StudentDirectoryPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
 
-@api_view(["PUT", "PATCH"])
-@permission_classes([IsAuthenticated])
-def update_profile_view(request):
-    user = request.user
-    student = Student.objects.filter(user=user).first()
-    if not student:
-        return Response({"error": "Profile not found. Please complete your profile first."}, status=404)
 
-    serializer = StudentSerializer(student, data=request.data, partial=True)
-    if serializer.is_valid():
-        updated = serializer.save()
-        return Response(
-            {"message": "Profile updated successfully", "student": StudentSerializer(updated).data},
-            status=200,
+class StudentDirectoryView(generics.ListAPIView):
+    """
+    Admin search over students (2 queries per page: COUNT + page).
+    Exact: department, session, room_no, blood_group. Prefix: student_id, name.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = StudentDirectorySerializer
+    filterset_class = StudentDirectoryFilter
+    pagination_class = StudentDirectoryPagination
+    queryset = (
+        Student.objects.select_related("user")
+        .only(
+            "id", "student_id", "department", "session", "room_no", "blood_group",
+            "mobile_number", "emergency_number", "user__id", "user__full_name", "user__email",
         )
-    return Response(serializer.errors, status=400)
+        .order_by("student_id")
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def room_list_view(request):
+    """
+    Occupied rooms with occupants / capacity / free_beds. ?available=1 keeps
+    only rooms with a free bed.
+    """
+    data = rooms.room_list()
+    if request.query_params.get("available") in ("1", "true"):
+        data = [room for room in data if room["free_beds"] > 0]
+    return Response({"count": len(data), "results": data}, status=200)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def room_detail_view(request, room_no):
+    return Response(rooms.room_detail(room_no), status=200)
+
 
-# Optional: email/username JWT endpoint
+# Email/username JWT endpoint (api/token/)
 class EmailOrUsernameTokenObtainPairView(TokenObtainPairView):
     serializer_class = EmailOrUsernameTokenObtainPairSerializer
+    throttle_classes = [scoped_throttle("auth")]